@@ -1,33 +1,214 @@
 """
 Bazarr API client for interacting with Bazarr instance.
+
+Outcomes of uploads and post-processing are reported through the module
+logger rather than printed; callers print their own progress lines.
 """
 
+import itertools
 import json
 import logging
 import os
-import re
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
+
+from utils import KeepAliveAdapter, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Fail fast when Bazarr is unreachable; read timeouts stay per endpoint
+_CONNECT_TIMEOUT = 3.05
+
+# Connection pool size, and enrichment workers kept below it so they never
+# wait on a free connection
+_POOL_MAXSIZE = 64
+_ENRICH_MAX_WORKERS = 16
+
+# Largest page requested from Bazarr; bigger requests are paged underneath
+_MAX_PAGE_SIZE = 500
+
+# Settings and tasks don't change mid-run; reuse responses for this long
+_CACHE_TTL_SECONDS = 60
+
+# Search intervals only change when an admin reconfigures Bazarr
+_INTERVAL_CACHE_TTL_SECONDS = 600
+
+# Series details rarely change, but renames in Sonarr should show up eventually
+_SERIES_CACHE_TTL_SECONDS = 300
+
+# Tables used when parsing Bazarr task intervals
+_EVERY_UNIT_MINUTES = {"day": 24 * 60, "hour": 60, "minute": 1}
+_WEEKDAYS = frozenset(
+    ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+)
+_INTERVAL_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1}
+
+# Job IDs of the "Search for Missing Movies Subtitles" task, and the
+# lowercase names matched against both the task name and the job ID
+_SEARCH_TASK_JOB_IDS = frozenset({"missing_subtitles_movies", "wanted_search_movie"})
+_SEARCH_TASK_NAMES = (
+    "search for missing movies subtitles",
+    "missing_subtitles_movies",
+    "wanted_search_movie",
+)
+
+# Bazarr expects lowercase string booleans in form data and query params
+_BOOL_STR = {True: "true", False: "false"}
+
+
+class _SharedKeepAliveAdapter(KeepAliveAdapter):
+    """KeepAliveAdapter mounted on several sessions, which none of them closes."""
+
+    def close(self):
+        # Closing one client's session must not drop the pool the others
+        # use; its connections are released when the process exits
+        pass
+
+
+class _BazarrAuth(requests.auth.HTTPBasicAuth):
+    """Basic auth and API key, sent only to the Bazarr instance."""
+
+    def __init__(
+        self,
+        bazarr_url: str,
+        api_key: str,
+        username: str,
+        password: str,
+        other_auth=None,
+    ):
+        """
+        Initialize the auth.
+
+        Args:
+            bazarr_url: Base URL of the Bazarr instance
+            api_key: Bazarr API key
+            username: Basic auth username
+            password: Basic auth password
+            other_auth: Auth the session already used, kept for other hosts;
+                either an auth object or a (username, password) tuple
+        """
+        super().__init__(username, password)
+        self.origin = self._origin(bazarr_url)
+        self.api_key = api_key
+        if isinstance(other_auth, tuple):
+            other_auth = requests.auth.HTTPBasicAuth(*other_auth)
+        self.other_auth = other_auth
+
+    @staticmethod
+    def _origin(url: str) -> Tuple[str, Optional[str], Optional[int]]:
+        """Get the scheme, lowercase host and port a URL points at."""
+        parts = urlsplit(url)
+        return parts.scheme.lower(), parts.hostname, parts.port
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        if self._origin(r.url) != self.origin:
+            return self.other_auth(r) if self.other_auth else r
+        r.headers["X-API-KEY"] = self.api_key
+        return super().__call__(r)
+
 
 class Bazarr:
     """Client for interacting with Bazarr API."""
 
-    def __init__(self, bazarr_url: str, api_key: str, username: str, password: str):
+    # Connection pool shared by every client in the process
+    _shared_adapter: Optional[HTTPAdapter] = None
+    _shared_adapter_lock = threading.Lock()
+
+    @classmethod
+    def _get_adapter(cls) -> HTTPAdapter:
+        """
+        Get the process-wide HTTP adapter, creating it on first use.
+
+        Returns:
+            HTTPAdapter with pooled connections and retries for transient errors
+        """
+        with cls._shared_adapter_lock:
+            if cls._shared_adapter is None:
+                # Only GETs are retried: a retried sync PATCH would stack its
+                # 300 second timeout, so PATCH/POST failures are returned as-is
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"]),
+                )
+                cls._shared_adapter = _SharedKeepAliveAdapter(
+                    pool_connections=_POOL_MAXSIZE,
+                    pool_maxsize=_POOL_MAXSIZE,
+                    max_retries=retry,
+                )
+            return cls._shared_adapter
+
+    def __init__(
+        self,
+        bazarr_url: str,
+        api_key: str,
+        username: str,
+        password: str,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize the Bazarr client.
+
+        Args:
+            bazarr_url: Base URL of the Bazarr instance
+            api_key: Bazarr API key
+            username: Basic auth username
+            password: Basic auth password
+            session: Optional session to share with other clients; the API key
+                and auth are only sent with requests to the Bazarr instance
+        """
         self.bazarr_url = bazarr_url
         self.api_key = api_key
         self.username = username
         self.password = password
-        self.session = requests.Session()
+        self.session = session if session is not None else requests.Session()
+
+        # Endpoint URLs are fixed for the lifetime of the client
+        self._urls = {
+            "movies_wanted": f"{bazarr_url}/api/movies/wanted",
+            "movies_subtitles": f"{bazarr_url}/api/movies/subtitles",
+            "subtitles": f"{bazarr_url}/api/subtitles",
+            "movies": f"{bazarr_url}/api/movies",
+            "system_settings": f"{bazarr_url}/api/system/settings",
+            "system_tasks": f"{bazarr_url}/api/system/tasks",
+            "episodes_wanted": f"{bazarr_url}/api/episodes/wanted",
+            "series": f"{bazarr_url}/api/series",
+            "episodes_subtitles": f"{bazarr_url}/api/episodes/subtitles",
+            "episodes": f"{bazarr_url}/api/episodes",
+        }
 
-        # Setup headers with connection optimization
-        self.session.headers.update({"X-API-KEY": api_key, "Connection": "keep-alive"})
+        self._series_cache: Dict[int, Tuple[Optional[Dict], float]] = {}
+        self._series_locks: Dict[int, threading.Lock] = {}
+        self._series_locks_guard = threading.Lock()
+        self._settings_cache: Optional[Dict] = None
+        self._settings_cache_ts = 0.0
+        self._tasks_cache: Optional[Dict] = None
+        self._tasks_cache_ts = 0.0
+        self._interval_cache: Dict[str, Tuple[int, float]] = {}
+
+        # Pool connections to the Bazarr host and retry transient failures;
+        # a shared session only gets the adapter for the Bazarr URL
+        adapter = self._get_adapter()
+        if session is None:
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        else:
+            self.session.mount(bazarr_url, adapter)
 
-        # Setup authentication
-        self.auth = requests.auth.HTTPBasicAuth(username, password)
+        # Setup the API key and authentication once on the session, scoped to
+        # the Bazarr host so a shared session never sends them elsewhere
+        self.session.auth = _BazarrAuth(
+            bazarr_url, api_key, username, password, other_auth=self.session.auth
+        )
 
     def get_wanted_movies(self, start: int = 0, length: int = -1) -> Optional[Dict]:
         """
@@ -35,18 +216,21 @@ class Bazarr:
 
         Args:
             start: Paging start integer (default: 0)
-            length: Paging length integer (default: -1 for all)
+            length: Paging length integer (default: -1 for all); lengths above
+                    the page size cap are fetched page by page
 
         Returns:
             JSON response from API or None if error
         """
-        url = f"{self.bazarr_url}/api/movies/wanted"
-        params = {"start": start, "length": length}
-
         try:
-            response = self.session.get(url, params=params, auth=self.auth, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            if length < 0 or length > _MAX_PAGE_SIZE:
+                movies = self.iter_wanted_movies(start=start)
+                if length > 0:
+                    movies = itertools.islice(movies, length)
+                movies = list(movies)
+                return {"data": movies, "total": len(movies)}
+
+            return self._get_wanted_movies_page(start, length)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error connecting to Bazarr API: {e}")
             return None
@@ -54,6 +238,51 @@ class Bazarr:
             logger.error(f"Error parsing JSON response: {e}")
             return None
 
+    def iter_wanted_movies(
+        self, start: int = 0, page_size: int = 200
+    ) -> Iterator[Dict]:
+        """
+        Iterate over wanted movies, fetching one page at a time.
+
+        Args:
+            start: Paging start integer
+            page_size: Number of movies requested per page
+
+        Yields:
+            Wanted movie dictionaries
+
+        Raises:
+            requests.exceptions.RequestException: If a page request fails
+            json.JSONDecodeError: If a page response is not valid JSON
+        """
+        while True:
+            data = self._get_wanted_movies_page(start, page_size)
+            movies = data.get("data", []) if isinstance(data, dict) else data
+            yield from movies
+
+            # Same end-of-list detection as iter_wanted_episodes
+            if len(movies) != page_size:
+                return
+            start += page_size
+
+    def _get_wanted_movies_page(self, start: int, length: int) -> Dict:
+        """
+        Fetch a single page of wanted movies from Bazarr.
+
+        Args:
+            start: Paging start integer
+            length: Paging length integer
+
+        Returns:
+            JSON response from API
+        """
+        url = self._urls["movies_wanted"]
+        params = {"start": start, "length": length}
+
+        response = self.session.get(url, params=params, timeout=(_CONNECT_TIMEOUT, 30))
+        response.raise_for_status()
+        return json_loads(response.content)
+
     def upload_movie_subtitle(
         self,
         radarr_id: int,
@@ -76,33 +305,36 @@ class Bazarr:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.bazarr_url}/api/movies/subtitles"
-
-            # Prepare form data
-            data = {
-                "radarrid": radarr_id,
-                "language": language,
-                "forced": "true" if forced else "false",
-                "hi": "true" if hi else "false",
-            }
+            url = self._urls["movies_subtitles"]
 
-            # Upload file
+            # Upload file, streaming the multipart body straight from disk
             with open(subtitle_file, "rb") as f:
-                files = {"file": (os.path.basename(subtitle_file), f, "text/plain")}
+                encoder = MultipartEncoder(
+                    fields={
+                        "radarrid": str(radarr_id),
+                        "language": language,
+                        "forced": _BOOL_STR[bool(forced)],
+                        "hi": _BOOL_STR[bool(hi)],
+                        "file": (os.path.basename(subtitle_file), f, "text/plain"),
+                    }
+                )
 
                 response = self.session.post(
-                    url, data=data, files=files, auth=self.auth, timeout=30
+                    url,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    timeout=(_CONNECT_TIMEOUT, 30),
                 )
                 response.raise_for_status()
 
-                print("    ✓ Uploaded subtitle to Bazarr")
+                logger.info(f"Uploaded subtitle for movie {radarr_id} to Bazarr")
                 return True
 
         except requests.exceptions.RequestException as e:
-            print(f"    ✗ Error uploading to Bazarr: {e}")
+            logger.error(f"Error uploading movie subtitle to Bazarr: {e}")
             return False
         except IOError as e:
-            print(f"    ✗ Error reading subtitle file: {e}")
+            logger.error(f"Error reading subtitle file: {e}")
             return False
 
     def sync_subtitle(
@@ -137,7 +369,7 @@ class Bazarr:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.bazarr_url}/api/subtitles"
+            url = self._urls["subtitles"]
 
             # Prepare sync parameters
             params = {
@@ -146,24 +378,24 @@ class Bazarr:
                 "path": subtitle_path,
                 "type": media_type,
                 "id": media_id,
-                "forced": "true" if forced else "false",
-                "hi": "true" if hi else "false",
+                "forced": _BOOL_STR[bool(forced)],
+                "hi": _BOOL_STR[bool(hi)],
                 "reference": reference,
                 "max_offset_seconds": str(max_offset_seconds),
-                "no_fix_framerate": "true" if no_fix_framerate else "false",
-                "gss": "true" if use_gss else "false",
+                "no_fix_framerate": _BOOL_STR[bool(no_fix_framerate)],
+                "gss": _BOOL_STR[bool(use_gss)],
             }
 
             response = self.session.patch(
-                url, params=params, auth=self.auth, timeout=300
+                url, params=params, timeout=(_CONNECT_TIMEOUT, 300)
             )
             response.raise_for_status()
 
-            print("    ✓ Synchronized subtitle with Bazarr")
+            logger.info(f"Synchronized subtitle with Bazarr: {subtitle_path}")
             return True
 
         except requests.exceptions.RequestException as e:
-            print(f"    ✗ Error synchronizing subtitle: {e}")
+            logger.error(f"Error synchronizing subtitle: {e}")
             return False
 
     def trigger_subzero_mods(
@@ -190,7 +422,7 @@ class Bazarr:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.bazarr_url}/api/subtitles"
+            url = self._urls["subtitles"]
 
             # Prepare Sub-Zero modification parameters
             params = {
@@ -199,20 +431,20 @@ class Bazarr:
                 "path": subtitle_path,
                 "type": media_type,
                 "id": media_id,
-                "forced": "true" if forced else "false",
-                "hi": "true" if hi else "false",
+                "forced": _BOOL_STR[bool(forced)],
+                "hi": _BOOL_STR[bool(hi)],
             }
 
             response = self.session.patch(
-                url, params=params, auth=self.auth, timeout=60
+                url, params=params, timeout=(_CONNECT_TIMEOUT, 60)
             )
             response.raise_for_status()
 
-            print("    ✓ Applied Sub-Zero modifications")
+            logger.info(f"Applied Sub-Zero modifications: {subtitle_path}")
             return True
 
         except requests.exceptions.RequestException as e:
-            print(f"    ✗ Error applying Sub-Zero modifications: {e}")
+            logger.error(f"Error applying Sub-Zero modifications: {e}")
             return False
 
     def get_movie_subtitles(self, radarr_id: int) -> Optional[Dict]:
@@ -226,13 +458,15 @@ class Bazarr:
             Movie data with subtitle paths or None if error
         """
         try:
-            url = f"{self.bazarr_url}/api/movies"
-            params = {"radarrid[]": radarr_id}
+            url = self._urls["movies"]
+            params = [("radarrid[]", radarr_id)]
 
-            response = self.session.get(url, params=params, auth=self.auth, timeout=30)
+            response = self.session.get(
+                url, params=params, timeout=(_CONNECT_TIMEOUT, 30)
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             if data and "data" in data and data["data"]:
                 return data["data"][0]  # Return first (and only) movie
             return None
@@ -251,11 +485,19 @@ class Bazarr:
         Returns:
             Dictionary containing system settings or None if error
         """
+        if (
+            self._settings_cache is not None
+            and time.monotonic() - self._settings_cache_ts < _CACHE_TTL_SECONDS
+        ):
+            return self._settings_cache
+
         try:
-            url = f"{self.bazarr_url}/api/system/settings"
-            response = self.session.get(url, auth=self.auth, timeout=30)
+            url = self._urls["system_settings"]
+            response = self.session.get(url, timeout=(_CONNECT_TIMEOUT, 30))
             response.raise_for_status()
-            return response.json()
+            self._settings_cache = json_loads(response.content)
+            self._settings_cache_ts = time.monotonic()
+            return self._settings_cache
         except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             logger.error(f"Error fetching system settings: {e}")
             return None
@@ -313,12 +555,20 @@ class Bazarr:
         Returns:
             JSON response from API or None if error
         """
-        url = f"{self.bazarr_url}/api/system/tasks"
+        if (
+            self._tasks_cache is not None
+            and time.monotonic() - self._tasks_cache_ts < _CACHE_TTL_SECONDS
+        ):
+            return self._tasks_cache
+
+        url = self._urls["system_tasks"]
 
         try:
-            response = self.session.get(url, auth=self.auth, timeout=30)
+            response = self.session.get(url, timeout=(_CONNECT_TIMEOUT, 30))
             response.raise_for_status()
-            return response.json()
+            self._tasks_cache = json_loads(response.content)
+            self._tasks_cache_ts = time.monotonic()
+            return self._tasks_cache
         except requests.exceptions.RequestException as e:
             logger.error(f"Error connecting to Bazarr system tasks API: {e}")
             return None
@@ -330,6 +580,19 @@ class Bazarr:
         """
         Get the interval for "Search for Missing Movies Subtitles" task from Bazarr.
 
+        The interval is cached for ten minutes; see invalidate_interval_cache.
+
+        Returns:
+            Interval in hours, defaults to 24 if not found or error
+        """
+        return self._get_cached_interval(
+            "movies", self._fetch_missing_subtitles_search_interval
+        )
+
+    def _fetch_missing_subtitles_search_interval(self) -> int:
+        """
+        Look up the movie search interval from Bazarr's system tasks.
+
         Returns:
             Interval in hours, defaults to 24 if not found or error
         """
@@ -360,28 +623,20 @@ class Bazarr:
             )
             return 24
 
-        # Look for the missing subtitles search task
-        search_task_names = [
-            "Search for Missing Movies Subtitles",
-            "missing_subtitles_movies",
-            "wanted_search_movie",
-        ]
-
         for task in task_list:
             # Skip if task is not a dict
             if not isinstance(task, dict):
-                logger.debug(f"Skipping non-dict task: {task}")
+                logger.debug("Skipping non-dict task: %s", task)
                 continue
 
-            task_name = task.get("name", "")
-            task_job_id = task.get("job_id", "")
+            task_name = task.get("name") or ""
+            task_name_lower = task_name.lower()
+            task_job_id = (task.get("job_id") or "").lower()
 
-            if any(
-                search_name.lower() in task_name.lower()
-                for search_name in search_task_names
-            ) or any(
-                search_name.lower() in task_job_id.lower()
-                for search_name in search_task_names
+            # Look for the missing subtitles search task, by exact job ID first
+            if task_job_id in _SEARCH_TASK_JOB_IDS or any(
+                name in task_name_lower or name in task_job_id
+                for name in _SEARCH_TASK_NAMES
             ):
                 # Get interval - could be in different formats
                 interval_str = task.get("interval", "")
@@ -415,6 +670,33 @@ class Bazarr:
         )
         return 24
 
+    def _get_cached_interval(self, key: str, fetch) -> int:
+        """
+        Return a cached search interval, refreshing it once it expires.
+
+        Args:
+            key: Cache key for the interval
+            fetch: Callable returning the interval in hours
+
+        Returns:
+            Interval in hours
+        """
+        entry = self._interval_cache.get(key)
+        if entry is not None and (
+            time.monotonic() - entry[1] < _INTERVAL_CACHE_TTL_SECONDS
+        ):
+            return entry[0]
+
+        hours = fetch()
+        self._interval_cache[key] = (hours, time.monotonic())
+        return hours
+
+    def invalidate_interval_cache(self):
+        """Forget cached search intervals and the tasks/settings they came from."""
+        self._interval_cache.clear()
+        self._tasks_cache = None
+        self._settings_cache = None
+
     def _parse_interval_to_minutes(self, interval_str: str) -> int:
         """
         Parse various interval string formats to minutes.
@@ -432,68 +714,45 @@ class Bazarr:
         """
         interval_str = interval_str.strip().lower()
 
+        # Fast path for the common numeric formats (HH:MM:SS, 24h, 1440m, 86400s, 24)
+        if interval_str[:1].isdigit():
+            # Handle HH:MM:SS format
+            if ":" in interval_str:
+                hours, _, rest = interval_str.partition(":")
+                minutes, _, _ = rest.partition(":")
+                return int(hours) * 60 + (int(minutes) if minutes else 0)
+
+            # Assume it's hours if just a number, convert to minutes
+            if interval_str.isdigit():
+                return int(interval_str) * 60
+
+            # Handle suffixed formats via the unit table
+            unit_seconds = _INTERVAL_UNIT_SECONDS.get(interval_str[-1])
+            if unit_seconds is not None:
+                return int(interval_str[:-1]) * unit_seconds // 60
+
         # Handle "every" formats
-        if interval_str.startswith("every"):
-            # Handle "every X hours"
-            if "hours" in interval_str:
-                # Extract number before "hours"
-                match = re.search(r"every\s+(\d+)\s+hours?", interval_str)
-                if match:
-                    return int(match.group(1)) * 60  # Convert hours to minutes
-
-            # Handle "every X minutes"
-            elif "minutes" in interval_str:
-                match = re.search(r"every\s+(\d+)\s+minutes?", interval_str)
-                if match:
-                    return int(match.group(1))  # Already in minutes
+        elif interval_str.startswith("every"):
+            # Split once; every known format is whitespace separated
+            tokens = interval_str.split()
+
+            # Handle "every X days/hours/minutes"
+            if len(tokens) >= 3 and tokens[1].isdigit():
+                unit_minutes = _EVERY_UNIT_MINUTES.get(tokens[2].removesuffix("s"))
+                if unit_minutes is not None:
+                    return int(tokens[1]) * unit_minutes
 
             # Handle "every sunday" or other weekly patterns first
             # (weekly = 168 hours = 10080 minutes)
-            elif any(
-                day in interval_str
-                for day in [
-                    "sunday",
-                    "monday",
-                    "tuesday",
-                    "wednesday",
-                    "thursday",
-                    "friday",
-                    "saturday",
-                ]
-            ):
+            words = set(tokens)
+            if not _WEEKDAYS.isdisjoint(words):
                 # 7 days * 24 hours * 60 minutes = 10080 minutes
                 return 168 * 60
 
             # Handle "every day" (daily = 24 hours = 1440 minutes)
-            elif "day" in interval_str:
+            if "day" in words:
                 return 24 * 60  # 1440 minutes
 
-        # Handle HH:MM:SS format
-        if ":" in interval_str:
-            parts = interval_str.split(":")
-            if len(parts) >= 2:
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                # Convert to total minutes
-                return hours * 60 + minutes
-            elif len(parts) == 1:
-                # Assume hours, convert to minutes
-                return int(parts[0]) * 60
-
-        # Handle suffixed formats (24h, 1440m, 86400s)
-        if interval_str.endswith("h"):
-            # Convert hours to minutes
-            return int(interval_str[:-1]) * 60
-        elif interval_str.endswith("m"):
-            # Already in minutes
-            return int(interval_str[:-1])
-        elif interval_str.endswith("s"):
-            # Convert seconds to minutes
-            return int(interval_str[:-1]) // 60
-        elif interval_str.isdigit():
-            # Assume it's hours if just a number, convert to minutes
-            return int(interval_str) * 60
-
         raise ValueError(f"Unrecognized interval format: {interval_str}")
 
     def get_wanted_episodes(self, start: int = 0, length: int = -1) -> List[Dict]:
@@ -502,27 +761,22 @@ class Bazarr:
 
         Args:
             start: Paging start integer
-            length: Paging length integer (-1 for all)
+            length: Paging length integer (-1 for all); lengths above the
+                    page size cap are fetched page by page
 
         Returns:
             List of wanted episode dictionaries
         """
         try:
-            url = f"{self.bazarr_url}/api/episodes/wanted"
-            params = {"start": start, "length": length}
-
-            response = self.session.get(url, params=params, auth=self.auth, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            episodes = data.get("data", []) if isinstance(data, dict) else data
-
-            # Enrich episode data with series information
-            enriched_episodes = []
-            for episode in episodes:
-                enriched_episode = self._enrich_episode_data(episode)
-                if enriched_episode:
-                    enriched_episodes.append(enriched_episode)
+            if length < 0 or length > _MAX_PAGE_SIZE:
+                episodes = self.iter_wanted_episodes(start=start)
+                if length > 0:
+                    episodes = itertools.islice(episodes, length)
+                enriched_episodes = list(episodes)
+            else:
+                enriched_episodes = self._enrich_episodes(
+                    self._get_wanted_episodes_page(start, length)
+                )
 
             logger.info(f"Found {len(enriched_episodes)} wanted episodes")
             return enriched_episodes
@@ -530,6 +784,110 @@ class Bazarr:
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching wanted episodes: {e}")
             return []
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing wanted episodes response: {e}")
+            return []
+
+    def iter_wanted_episodes(
+        self, start: int = 0, page_size: int = 200
+    ) -> Iterator[Dict]:
+        """
+        Iterate over wanted episodes, fetching and enriching one page at a time.
+
+        Args:
+            start: Paging start integer
+            page_size: Number of episodes requested per page
+
+        Yields:
+            Enriched wanted episode dictionaries
+
+        Raises:
+            requests.exceptions.RequestException: If a page request fails
+            json.JSONDecodeError: If a page response is not valid JSON
+        """
+        while True:
+            episodes = self._get_wanted_episodes_page(start, page_size)
+            yield from self._enrich_episodes(episodes)
+
+            # A short page means we've reached the end of the wanted list; an
+            # oversized one means the server ignored paging and sent everything
+            if len(episodes) != page_size:
+                return
+            start += page_size
+
+    def _get_wanted_episodes_page(self, start: int, length: int) -> List[Dict]:
+        """
+        Fetch a single page of raw wanted episodes from Bazarr.
+
+        Args:
+            start: Paging start integer
+            length: Paging length integer
+
+        Returns:
+            List of raw wanted episode dictionaries
+        """
+        url = self._urls["episodes_wanted"]
+        params = {"start": start, "length": length}
+
+        data = self._get_large_json(url, params)
+        return data.get("data", []) if isinstance(data, dict) else data
+
+    def _get_large_json(self, url: str, params) -> Dict:
+        """
+        GET an endpoint with a potentially large JSON body and decode it.
+
+        The body is streamed and read from the raw response in one call, which
+        hands the parser a single buffer instead of joining requests' chunks.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            json.JSONDecodeError: If the response is not valid JSON
+        """
+        response = self.session.get(
+            url, params=params, stream=True, timeout=(_CONNECT_TIMEOUT, 30)
+        )
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return json_loads(response.raw.read())
+        finally:
+            response.close()
+
+    def _enrich_episodes(self, episodes: List[Dict]) -> List[Dict]:
+        """
+        Enrich a batch of raw episodes with series information.
+
+        Args:
+            episodes: Raw episode data from Bazarr
+
+        Returns:
+            Enriched episodes, skipping any that could not be parsed
+        """
+        # Fetch series information for all episodes in batched requests;
+        # enrichment then reads from the series cache
+        series_ids = {
+            episode.get("sonarrSeriesId") or episode.get("seriesId")
+            for episode in episodes
+        } - {None, ""}
+        self.get_series_info_bulk(series_ids)
+
+        if all(self._get_cached_series(sid)[0] for sid in series_ids):
+            # Every series is cached, so enrichment does no I/O
+            return list(filter(None, map(self._enrich_episode_data, episodes)))
+
+        # Enrich episode data concurrently, so series missed by the batch are
+        # looked up in parallel
+        with ThreadPoolExecutor(
+            max_workers=min(_ENRICH_MAX_WORKERS, len(episodes))
+        ) as executor:
+            return list(filter(None, executor.map(self._enrich_episode_data, episodes)))
 
     def _enrich_episode_data(self, episode: Dict) -> Optional[Dict]:
         """
@@ -541,68 +899,197 @@ class Bazarr:
         Returns:
             Enriched episode data or None
         """
-        season, episode_number = episode.get("episode_number", "").split("x")
+        # Episode numbers come as "SxE"; skip malformed rows before any lookup
+        raw_number = episode.get("episode_number") or ""
+        separator = raw_number.find("x")
+        if separator < 0:
+            logger.warning(f"Skipping episode with malformed number: {raw_number!r}")
+            return None
+
         enriched_episode = {
             "series_title": episode.get("seriesTitle", "Unknown Series").strip(),
-            "season": season,
-            "episode_number": episode_number,
+            "season": raw_number[:separator],
+            "episode_number": raw_number[separator + 1 :],
             "episode_title": episode.get("episodeTitle", "Unknown Episode").strip(),
             "missing_subtitles": episode.get("missing_subtitles", []),
-            "sonarr_series_id": episode.get("sonarrSeriesId", ""),
+            "sonarr_series_id": (
+                episode.get("sonarrSeriesId") or episode.get("seriesId") or ""
+            ),
             "sonarr_episode_id": episode.get("sonarrEpisodeId", ""),
             "scene_name": episode.get("sceneName", ""),
             "tags": episode.get("tags", []),
             "series_type": episode.get("seriesType", "standard"),
         }
 
-        try:
-            # Get more series information
-            series_info = self.get_series_info(enriched_episode["sonarr_series_id"])
-            if series_info:
-                enriched_episode["year"] = series_info.get("year")
-                enriched_episode["imdb"] = series_info.get("imdbId")
-                enriched_episode["tvdb"] = series_info.get("tvdbId")
+        # Get more series information (lookup errors are handled internally)
+        series_id = enriched_episode["sonarr_series_id"]
+        series_info = self.get_series_info(series_id) if series_id else None
+        if series_info:
+            enriched_episode["year"] = series_info.get("year")
+            enriched_episode["imdb"] = series_info.get("imdbId")
+            enriched_episode["tvdb"] = series_info.get("tvdbId")
 
-            return enriched_episode
-
-        except Exception as e:
-            logger.warning(f"Could not enrich episode data: {e}")
-            return enriched_episode
+        return enriched_episode
 
     def get_series_info(self, series_id: int) -> Optional[Dict]:
         """
         Get series information from Bazarr.
 
+        Results are cached per series ID for a few minutes, so episodes of
+        the same series only trigger a single lookup.
+
         Args:
             series_id: Series ID
 
         Returns:
             Series information dictionary or None
         """
-        try:
-            url = f"{self.bazarr_url}/api/series"
-            params = {"seriesid[]": series_id}
+        cached, series_info = self._get_cached_series(series_id)
+        if cached:
+            return series_info
+
+        # Serialize lookups per series so concurrent enrichment of episodes
+        # from the same series doesn't fire duplicate requests
+        with self._series_locks_guard:
+            series_lock = self._series_locks.setdefault(series_id, threading.Lock())
+
+        with series_lock:
+            cached, series_info = self._get_cached_series(series_id)
+            if cached:
+                return series_info
+
+            try:
+                url = self._urls["series"]
+                params = [("seriesid[]", series_id)]
+
+                response = self.session.get(
+                    url, params=params, timeout=(_CONNECT_TIMEOUT, 30)
+                )
+                response.raise_for_status()
 
-            response = self.session.get(url, params=params, auth=self.auth, timeout=30)
-            response.raise_for_status()
+                data = json_loads(response.content)
+                series_list = data.get("data", []) if isinstance(data, dict) else data
 
-            data = response.json()
-            series_list = data.get("data", []) if isinstance(data, dict) else data
+                # Bazarr filters by seriesid[] server-side, so at most one
+                # series comes back
+                series_info = series_list[0] if series_list else None
 
-            # Find the series with matching ID
-            for series in series_list:
-                if (
-                    series.get("sonarrSeriesId") == series_id
-                    or series.get("seriesId") == series_id
-                ):
-                    return series
+                self._cache_series(series_id, series_info)
+                return series_info
 
-            return None
+            except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+                logger.warning(f"Error fetching series info for ID {series_id}: {e}")
+                return None
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Error fetching series info for ID {series_id}: {e}")
+    def get_series_info_bulk(
+        self, series_ids: Iterable[int], batch_size: int = 100
+    ) -> Dict[int, Dict]:
+        """
+        Get series information for many series using batched requests.
+
+        Fetched series are stored in the series cache, so later calls to
+        get_series_info for the same IDs don't hit Bazarr again.
+
+        Args:
+            series_ids: Series IDs to look up
+            batch_size: Maximum number of series IDs per request
+
+        Returns:
+            Dictionary mapping series ID to series information
+        """
+        series_map = {}
+        pending_ids = []
+        for series_id in dict.fromkeys(series_ids):
+            cached, series_info = self._get_cached_series(series_id)
+            if not cached:
+                pending_ids.append(series_id)
+            elif series_info is not None:
+                series_map[series_id] = series_info
+
+        batches = [
+            pending_ids[i : i + batch_size]
+            for i in range(0, len(pending_ids), batch_size)
+        ]
+        if len(batches) > 1:
+            # Large libraries need several lookups; issue them concurrently
+            with ThreadPoolExecutor(
+                max_workers=min(_ENRICH_MAX_WORKERS, len(batches))
+            ) as executor:
+                results = list(executor.map(self._fetch_series_batch, batches))
+        else:
+            results = [self._fetch_series_batch(batch) for batch in batches]
+
+        missing_ids = []
+        for batch, fetched in zip(batches, results):
+            if fetched is None:
+                continue
+
+            # Series missing from a successful response don't exist in Bazarr
+            for series_id in batch:
+                series_info = fetched.get(series_id)
+                self._cache_series(series_id, series_info)
+                if series_info is not None:
+                    series_map[series_id] = series_info
+                else:
+                    missing_ids.append(series_id)
+
+        if missing_ids:
+            logger.warning(f"Bazarr returned no series info for IDs: {missing_ids}")
+
+        return series_map
+
+    def _fetch_series_batch(self, batch: List[int]) -> Optional[Dict[int, Dict]]:
+        """
+        Fetch one batch of series from Bazarr.
+
+        Args:
+            batch: Series IDs to request together
+
+        Returns:
+            Dictionary mapping series ID to series information, or None if
+            the request failed
+        """
+        params = [("seriesid[]", series_id) for series_id in batch]
+
+        try:
+            data = self._get_large_json(self._urls["series"], params)
+            series_list = data.get("data", []) if isinstance(data, dict) else data
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            logger.warning(f"Error fetching series info for {len(batch)} IDs: {e}")
             return None
 
+        fetched = {}
+        for series in series_list:
+            for key in ("sonarrSeriesId", "seriesId"):
+                if series.get(key) is not None:
+                    fetched.setdefault(series[key], series)
+        return fetched
+
+    def _get_cached_series(self, series_id: int) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a series in the cache, ignoring expired entries.
+
+        Args:
+            series_id: Series ID
+
+        Returns:
+            Tuple of (whether a fresh entry exists, cached series information)
+        """
+        entry = self._series_cache.get(series_id)
+        if entry is None or time.monotonic() - entry[1] >= _SERIES_CACHE_TTL_SECONDS:
+            return False, None
+        return True, entry[0]
+
+    def _cache_series(self, series_id: int, series_info: Optional[Dict]):
+        """Store series information in the cache with the current time."""
+        self._series_cache[series_id] = (series_info, time.monotonic())
+
+    def clear_series_cache(self):
+        """Clear cached series information."""
+        with self._series_locks_guard:
+            self._series_cache.clear()
+            self._series_locks.clear()
+
     def upload_episode_subtitle(
         self,
         series_id: int,
@@ -627,21 +1114,28 @@ class Bazarr:
             True if upload successful, False otherwise
         """
         try:
-            url = f"{self.bazarr_url}/api/episodes/subtitles"
+            url = self._urls["episodes_subtitles"]
 
             params = {
                 "seriesid": series_id,
                 "episodeid": episode_id,
                 "language": language,
-                "forced": "true" if forced else "false",
-                "hi": "true" if hi else "false",
+                "forced": _BOOL_STR[bool(forced)],
+                "hi": _BOOL_STR[bool(hi)],
             }
 
+            # Stream the multipart body straight from disk
             with open(subtitle_file, "rb") as f:
-                files = {"file": (subtitle_file, f, "text/plain")}
+                encoder = MultipartEncoder(
+                    fields={"file": (os.path.basename(subtitle_file), f, "text/plain")}
+                )
 
                 response = self.session.post(
-                    url, params=params, files=files, auth=self.auth, timeout=60
+                    url,
+                    params=params,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    timeout=(_CONNECT_TIMEOUT, 60),
                 )
                 response.raise_for_status()
 
@@ -662,16 +1156,28 @@ class Bazarr:
         """
         Get episode search interval from Bazarr settings.
 
+        The interval is cached for ten minutes; see invalidate_interval_cache.
+
         Returns:
             Search interval in hours (default 24)
         """
-        try:
-            url = f"{self.bazarr_url}/api/system/settings"
-            response = self.session.get(url, auth=self.auth, timeout=30)
-            response.raise_for_status()
+        return self._get_cached_interval(
+            "episodes", self._fetch_episode_search_interval
+        )
 
-            settings = response.json()
+    def _fetch_episode_search_interval(self) -> int:
+        """
+        Look up the episode search interval from Bazarr's system settings.
 
+        Returns:
+            Search interval in hours (default 24)
+        """
+        settings = self.get_system_settings()
+        if not settings:
+            logger.warning("Could not get episode search interval from Bazarr")
+            return 24  # Default fallback
+
+        try:
             # Look for episode search interval setting
             # This might be under different keys depending on Bazarr version
             interval = settings.get("general", {}).get("episode_search_interval", 24)
@@ -716,7 +1222,7 @@ class Bazarr:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.bazarr_url}/api/subtitles"
+            url = self._urls["subtitles"]
 
             # Prepare sync parameters
             params = {
@@ -725,24 +1231,24 @@ class Bazarr:
                 "path": subtitle_path,
                 "type": "episode",
                 "id": episode_id,
-                "forced": "true" if forced else "false",
-                "hi": "true" if hi else "false",
+                "forced": _BOOL_STR[bool(forced)],
+                "hi": _BOOL_STR[bool(hi)],
                 "reference": reference,
                 "max_offset_seconds": str(max_offset_seconds),
-                "no_fix_framerate": "true" if no_fix_framerate else "false",
-                "gss": "true" if use_gss else "false",
+                "no_fix_framerate": _BOOL_STR[bool(no_fix_framerate)],
+                "gss": _BOOL_STR[bool(use_gss)],
             }
 
             response = self.session.patch(
-                url, params=params, auth=self.auth, timeout=300
+                url, params=params, timeout=(_CONNECT_TIMEOUT, 300)
             )
             response.raise_for_status()
 
-            print("    ✓ Synchronized episode subtitle with Bazarr")
+            logger.info(f"Synchronized episode subtitle with Bazarr: {subtitle_path}")
             return True
 
         except requests.exceptions.RequestException as e:
-            print(f"    ✗ Error synchronizing episode subtitle: {e}")
+            logger.error(f"Error synchronizing episode subtitle: {e}")
             return False
 
     def trigger_episode_subzero_mods(
@@ -769,7 +1275,7 @@ class Bazarr:
             True if successful, False otherwise
         """
         try:
-            url = f"{self.bazarr_url}/api/subtitles"
+            url = self._urls["subtitles"]
 
             # Prepare Sub-Zero modification parameters
             params = {
@@ -778,20 +1284,20 @@ class Bazarr:
                 "path": subtitle_path,
                 "type": "episode",
                 "id": episode_id,
-                "forced": "true" if forced else "false",
-                "hi": "true" if hi else "false",
+                "forced": _BOOL_STR[bool(forced)],
+                "hi": _BOOL_STR[bool(hi)],
             }
 
             response = self.session.patch(
-                url, params=params, auth=self.auth, timeout=60
+                url, params=params, timeout=(_CONNECT_TIMEOUT, 60)
             )
             response.raise_for_status()
 
-            print("    ✓ Applied Sub-Zero modifications to episode")
+            logger.info(f"Applied Sub-Zero modifications to episode: {subtitle_path}")
             return True
 
         except requests.exceptions.RequestException as e:
-            print(f"    ✗ Error applying Sub-Zero modifications to episode: {e}")
+            logger.error(f"Error applying Sub-Zero modifications to episode: {e}")
             return False
 
     def get_episode_subtitles(self, series_id: int, episode_id: int) -> Optional[Dict]:
@@ -806,13 +1312,15 @@ class Bazarr:
             Episode data with subtitle paths or None if error
         """
         try:
-            url = f"{self.bazarr_url}/api/episodes"
-            params = {"seriesid[]": series_id, "episodeid[]": episode_id}
+            url = self._urls["episodes"]
+            params = [("seriesid[]", series_id), ("episodeid[]", episode_id)]
 
-            response = self.session.get(url, params=params, auth=self.auth, timeout=30)
+            response = self.session.get(
+                url, params=params, timeout=(_CONNECT_TIMEOUT, 30)
+            )
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             if data and "data" in data and data["data"]:
                 return data["data"][0]  # Return first (and only) episode
             return None
@@ -820,6 +1328,6 @@ class Bazarr:
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting episode subtitles: {e}")
             return None
-        except (KeyError, IndexError) as e:
+        except (json.JSONDecodeError, KeyError, IndexError) as e:
             logger.error(f"Error parsing episode subtitles response: {e}")
             return None
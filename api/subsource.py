@@ -2,41 +2,337 @@
 SubSource API client for downloading subtitles.
 """
 
+import functools
 import json
 import logging
 import os
+import random
 import re
+import shutil
+import tempfile
+import threading
 import time
 import zipfile
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from operator import attrgetter
+from typing import IO, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
+from urllib3.util.retry import Retry
 
+from core.config import get_config_dir
 from core.tracking import SubtitleTracker
+from utils import KeepAliveAdapter, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Read size used when streaming subtitle ZIP downloads
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Downloaded ZIPs are kept in memory up to this size before spilling to disk
+_ZIP_SPOOL_MAX_SIZE = 1 << 20
+
+# File extensions recognised as subtitles inside downloaded ZIPs
+_SUBTITLE_EXTENSIONS = (".srt", ".ass", ".ssa", ".sub", ".vtt", ".sbv")
+
+# Movie years resolved through Bazarr are reused across runs for this long
+_MOVIE_YEAR_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Languages of one movie or episode searched and downloaded concurrently;
+# requests still go through the shared rate limiter
+_LANGUAGE_MAX_WORKERS = 4
+
+# Download tokens are reused for this long, and at most this many are kept
+_TOKEN_CACHE_TTL_SECONDS = 300
+_TOKEN_CACHE_MAX_SIZE = 1000
+
+# Bazarr's search interval is looked up again once it is this old
+_SEARCH_INTERVAL_TTL_SECONDS = 60 * 60
+
+# Subtitle listings of a movie or season are reused within a run this long
+_LISTING_CACHE_TTL_SECONDS = 60 * 60
+
+# SubSource title searches are reused across runs for this long
+_SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Searches that found nothing are reused within a run this long, and never
+# saved, so titles added to SubSource later are still found
+_EMPTY_SEARCH_CACHE_TTL_SECONDS = 60 * 60
+
+# Concurrent SubSource searches when preloading movie searches
+_SEARCH_PRELOAD_MAX_WORKERS = 5
+
+# Concurrent Bazarr searches when preloading movie years
+_YEAR_LOOKUP_MAX_WORKERS = 8
+
+# (connect, read) timeouts for year lookups on the Bazarr client's pooled
+# session; an unreachable Bazarr fails fast instead of tying up a worker
+_BAZARR_SEARCH_TIMEOUT = (3.05, 30)
+
+# Statuses meaning SubSource is overloaded; retried by the session adapter
+# and treated as a signal to slow down
+_OVERLOAD_STATUSES = (429, 502, 503, 504)
+
+# Request rate bounds (per second) for the adaptive limiter, and how much a
+# healthy response raises the rate; an overloaded one halves it
+_MIN_REQUEST_RATE = 0.25
+_MAX_REQUEST_RATE = 2.0
+_REQUEST_RATE_STEP = 0.1
+
+# Pause applied after a 429 response that carries no rate-limit headers
+_RATE_LIMIT_FALLBACK_SECONDS = 2.0
+
+# Random extra pause, up to this long, added to rate-limit pauses and retry
+# backoff so concurrent clients don't all come back at the same moment
+_RATE_LIMIT_JITTER_SECONDS = 0.5
+
+# Title search fields that are the same for every query, and the headers of
+# the JSON-encoded search request
+_SEARCH_PAYLOAD_DEFAULTS = {"signal": {}, "limit": 15}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Episode numbering patterns in subtitle release info, most specific first:
+# S01E01, then 1x01, then a standalone E01
+_EPISODE_RE = re.compile(
+    r"[Ss](?P<s_se>\d+)[Ee](?P<e_se>\d+)"
+    r"|(?P<s_x>\d+)x(?P<e_x>\d+)"
+    r"|[Ee](?P<e_only>\d+)"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_release_episode(release_info: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse season and episode numbers from a subtitle's release info.
+
+    Cached because every episode of a season is matched against the same
+    season listing, so the same release names are parsed over and over.
+
+    Args:
+        release_info: Release info of a subtitle
+
+    Returns:
+        Tuple of (season, episode); either may be None if not found
+    """
+    # Scan the release info once, keeping the most specific match; an
+    # S01E01 match can't be beaten, so stop as soon as one is found
+    alt_match = None
+    episode_match = None
+    for match in _EPISODE_RE.finditer(release_info):
+        if match.group("s_se") is not None:
+            return int(match.group("s_se")), int(match.group("e_se"))
+        if match.group("s_x") is not None:
+            alt_match = alt_match or match
+        else:
+            episode_match = episode_match or match
+
+    # Look for 1x01 pattern
+    if alt_match:
+        return int(alt_match.group("s_x")), int(alt_match.group("e_x"))
+
+    # Fallback: standalone E01 pattern (least specific)
+    if episode_match:
+        # For E01 format, we don't extract season from the subtitle
+        # We rely on the season context from the search
+        return None, int(episode_match.group("e_only"))
+
+    return None, None
+
+
+class _TokenBucket:
+    """Thread-safe token bucket limiting how often SubSource is called."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+    ):
+        """
+        Create a bucket that starts full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens that can accumulate
+            min_rate: Lowest rate decrease() can reach (default: rate)
+            max_rate: Highest rate increase() can reach (default: rate)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = rate if min_rate is None else min_rate
+        self.max_rate = rate if max_rate is None else max_rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._held_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update, none during a hold."""
+        earned_since = max(self._updated, self._held_until)
+        if now > earned_since:
+            self._tokens = min(
+                self.burst, self._tokens + (now - earned_since) * self.rate
+            )
+        self._updated = now
+
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            # Requests queued behind a hold are paced from its end
+            wait = max(self._held_until - now, 0.0)
+            if self._tokens < 1:
+                wait += (1 - self._tokens) / self.rate
+            self._tokens -= 1
+
+        # Sleep outside the lock; the token is already reserved
+        if wait > 0:
+            time.sleep(wait)
+
+    def increase(self, step: float):
+        """
+        Raise the rate additively, up to max_rate.
+
+        Args:
+            step: Tokens per second to add
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + step)
+
+    def decrease(self):
+        """Halve the rate, down to min_rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def hold(self, seconds: float):
+        """
+        Hand out no tokens for the given number of seconds.
+
+        Only one request may go out when the hold ends; the rest are paced
+        at the current rate instead of bursting.
+
+        Args:
+            seconds: How long to pause, counted from now
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 1.0)
+            self._held_until = max(self._held_until, now + seconds)
+
+
+def _parse_seconds(value) -> Optional[float]:
+    """
+    Parse a rate-limit header holding a number of seconds or an HTTP date.
+
+    Args:
+        value: Header value, or None if the header is absent
+
+    Returns:
+        Non-negative number of seconds (until the date, for HTTP dates) or
+        None if the value is neither
+    """
+    try:
+        seconds = float(value)
+    except TypeError:
+        return None
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(seconds, 0.0)
+
 
 class SubSourceDownloader:
     """SubSource subtitle downloader."""
 
     def __init__(
-        self, api_url: str, download_dir: str, bazarr=None, cf_clearance: str = None
+        self,
+        api_url: str,
+        download_dir: str,
+        bazarr=None,
+        cf_clearance: str = None,
+        tracker: Optional[SubtitleTracker] = None,
     ):
         self.api_url = api_url
         self.download_dir = download_dir
         self.session = requests.Session()
-        self.tracker = SubtitleTracker()
+
+        # Reuse connections to SubSource and back off on rate limits and
+        # transient gateway errors (Retry-After is honoured for 429s). Title
+        # searches are POSTs but read-only, so they are retried as well.
+        # Once retries run out the last response is returned rather than
+        # raised, so the rate limiter still sees the overload
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=_OVERLOAD_STATUSES,
+            backoff_jitter=_RATE_LIMIT_JITTER_SECONDS,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # Keepalive stops idle pooled sockets being dropped while the run
+        # waits on Bazarr between SubSource searches
+        adapter = KeepAliveAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Pace requests instead of sleeping after each one; the rate grows
+        # while SubSource keeps up and halves when it reports overload or
+        # times out (429s are first retried by the adapter above)
+        self._rate_limiter = _TokenBucket(
+            rate=1.0,
+            burst=4,
+            min_rate=_MIN_REQUEST_RATE,
+            max_rate=_MAX_REQUEST_RATE,
+        )
+        # A tracker passed in is shared rather than reloading tracking.json
+        self.tracker = tracker if tracker is not None else SubtitleTracker()
         self.bazarr = bazarr
-        self._search_interval_hours = None
+        # Resolved up front, off the first item's critical path; it is read
+        # for every movie and episode and refreshed hourly on long runs
+        self._search_interval_fetched_at = time.monotonic()
+        if bazarr:
+            self._search_interval_hours = bazarr.get_missing_subtitles_search_interval()
+        else:
+            logger.warning("No Bazarr client provided, using default 24 hour interval")
+            self._search_interval_hours = 24
         self._movie_years_cache = {}  # Cache movie years to avoid repeated API calls
+        self._movie_years_file = get_config_dir() / "movie_years.json"
+        self._movie_years_store = self._load_movie_years()
+        for title, entry in self._movie_years_store.items():
+            self._movie_years_cache[title] = entry["year"]
+        # Title searches are shared by every language, episode and run
+        self._search_cache_file = get_config_dir() / "search_cache.json"
+        self._search_cache = self._load_search_cache()
+        self._search_cache_dirty = False
+        # Subtitle listings by (link, language); every episode of a season
+        # filters the same season listing
+        self._listing_cache: Dict[Tuple[str, str], Tuple[List[Dict], float]] = {}
+        # In-flight searches and listings are shared: callers asking for the
+        # same one wait on its lock and then find it cached
+        self._request_locks: Dict[Tuple[str, ...], threading.Lock] = {}
+        self._request_locks_guard = threading.Lock()
+        # Download tokens by subtitle link, so retried downloads skip the
+        # details request
+        self._token_cache: Dict[str, Tuple[str, float]] = {}
+        self._token_cache_lock = threading.Lock()
 
         # Setup optimized session headers with Cloudflare bypass headers
         self.session.headers.update(
             {
                 "Accept": "application/json, text/plain, */*",
                 "Accept-Language": "en,bn;q=0.9,en-US;q=0.8",
-                "Content-Type": "application/json",
                 "Cache-Control": "no-cache",
                 "DNT": "1",
                 "Origin": "https://subsource.net",
@@ -64,6 +360,64 @@ class SubSourceDownloader:
         # Create download directory if it doesn't exist
         os.makedirs(download_dir, exist_ok=True)
 
+    def _request(
+        self, send: Callable[..., requests.Response], url: str, **kwargs
+    ) -> requests.Response:
+        """
+        Send a paced request to SubSource and adapt the rate to the outcome.
+
+        Args:
+            send: Session method making the request, e.g. self.session.get
+            url: Request URL
+            **kwargs: Keyword arguments for the session method
+
+        Returns:
+            Response from SubSource, whatever its status
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        self._rate_limiter.acquire()
+        try:
+            response = send(url, **kwargs)
+        except requests.exceptions.Timeout:
+            self._rate_limiter.decrease()
+            raise
+        self._throttle(response)
+        return response
+
+    def _throttle(self, response: requests.Response):
+        """
+        Adapt the request rate to how SubSource is coping.
+
+        Healthy responses raise the rate a little and overload responses halve
+        it. Retry-After also pauses requests; otherwise an exhausted
+        X-RateLimit-Remaining waits for X-RateLimit-Reset, and a bare 429
+        falls back to a short pause.
+
+        Args:
+            response: Response just received from SubSource
+        """
+        headers = response.headers
+        delay = _parse_seconds(headers.get("retry-after"))
+        if delay is None and _parse_seconds(headers.get("x-ratelimit-remaining")) == 0:
+            delay = _parse_seconds(headers.get("x-ratelimit-reset"))
+            if delay is not None and delay > 10**9:
+                # Some servers send the reset as an epoch timestamp
+                delay = max(delay - time.time(), 0.0)
+        if delay is None and response.status_code == 429:
+            delay = _RATE_LIMIT_FALLBACK_SECONDS
+
+        if delay or response.status_code in _OVERLOAD_STATUSES:
+            self._rate_limiter.decrease()
+        else:
+            self._rate_limiter.increase(_REQUEST_RATE_STEP)
+
+        if delay:
+            delay += random.uniform(0, _RATE_LIMIT_JITTER_SECONDS)
+            logger.info(f"SubSource rate limit reached, pausing for {delay:.1f}s")
+            self._rate_limiter.hold(delay)
+
     def search_subtitles(
         self, title: str, year: int, language: str = "english"
     ) -> List[Dict]:
@@ -78,67 +432,89 @@ class SubSourceDownloader:
         Returns:
             List of subtitle results
         """
+        formatted_subtitles = []
         try:
-            # Step 1: Search for the movie
-            print(f"    Searching SubSource for: {title} ({year})")
+            # Step 1: Search for the movie (shared by all of its languages)
+            best_movie = self._find_movie(title, year)
+            movie_link = best_movie.get("link") if best_movie else None
 
-            search_url = f"{self.api_url}/movie/search"
-            search_payload = {
-                "query": title,
-                "signal": {},
-                "includeSeasons": False,
-                "limit": 15,
-            }
+            if not best_movie:
+                logger.info("No matching movie found")
+            elif not movie_link:
+                logger.info("No movie link found")
+            else:
+                movie_title = best_movie.get("title", title)
+                movie_year = best_movie.get("releaseYear", year)
+                logger.info(
+                    f"Found movie: {movie_title} ({movie_year}) - link: {movie_link}"
+                )
 
-            response = self.session.post(search_url, json=search_payload, timeout=15)
-            response.raise_for_status()
+                # Step 2: Get subtitles for this movie in the requested language
+                for subtitle in self._fetch_subtitles(movie_link, language):
+                    subtitle_id = subtitle.get("id")
+                    formatted_subtitles.append(
+                        {
+                            "id": subtitle_id,
+                            "title": f"{movie_title} ({movie_year})",
+                            "language": subtitle.get("language", language),
+                            # Always download through the API
+                            "download_url": (
+                                f"{self.api_url}/subtitle/{subtitle_id}/download"
+                            ),
+                            "filename": subtitle.get("release_info", ""),
+                            "score": subtitle.get("rating", "unrated"),
+                            "hearing_impaired": subtitle.get("hearing_impaired", 0),
+                            "release_info": subtitle.get("release_info", ""),
+                            "upload_date": subtitle.get("upload_date", ""),
+                            "movie_link": movie_link,
+                            "subtitle_link": subtitle.get("link", ""),
+                        }
+                    )
 
-            # Add delay to avoid rate limiting
-            time.sleep(2)
+                logger.info(f"Found {len(formatted_subtitles)} {language} subtitle(s)")
 
-            search_data = response.json()
-            search_results = search_data.get("results", [])
-            print(f"    Found {len(search_results)} movie(s) in search")
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            logger.error(f"Error searching SubSource: {e}")
 
-            # Find the best matching movie by year
-            best_movie = None
-            for movie in search_results:
-                movie_year = movie.get("releaseYear")
-                if movie_year == year:
-                    best_movie = movie
-                    break
+        # Every unsuccessful search is recorded once, whatever the cause
+        if not formatted_subtitles:
+            self.tracker.record_no_subtitles_found(title, year, language)
 
-            if not best_movie and search_results:
-                # If no exact year match, take the first result
-                best_movie = search_results[0]
+        return formatted_subtitles
 
-            if not best_movie:
-                print("    No matching movie found")
-                self.tracker.record_no_subtitles_found(title, year, language)
-                return []
-
-            movie_link = best_movie.get("link")
-            movie_title = best_movie.get("title", title)
-            movie_year = best_movie.get("releaseYear", year)
-            print(f"    Found movie: {movie_title} ({movie_year}) - link: {movie_link}")
-
-            if not movie_link:
-                print("    No movie link found")
-                self.tracker.record_no_subtitles_found(title, year, language)
-                return []
-
-            # Step 2: Get subtitles for this movie using the link
-            # The link is like "/subtitles/nightcrawler-2014", so we build the full URL
-            subtitles_url = f"{self.api_url}{movie_link}"
+    def _fetch_subtitles(self, link: str, language: str) -> List[Dict]:
+        """
+        Fetch the raw subtitle list of a SubSource movie or season for one language.
+
+        Listings are kept for an hour, so the episodes of a season share one
+        request per language.
+
+        Args:
+            link: Movie or season link from the search, e.g. "/subtitles/nightcrawler-2014"
+            language: Subtitle language
+
+        Returns:
+            List of subtitle dictionaries as returned by SubSource
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If the response is not valid JSON
+        """
+        cache_key = (link, language.lower())
+        with self._request_lock("listing", *cache_key):
+            cached = self._listing_cache.get(cache_key)
+            if cached and time.monotonic() - cached[1] < _LISTING_CACHE_TTL_SECONDS:
+                return cached[0]
+
+            subtitles_url = f"{self.api_url}{link}"
             params = {"language": language.lower(), "sort_by_date": "false"}
 
-            response = self.session.get(subtitles_url, params=params, timeout=15)
+            response = self._request(
+                self.session.get, subtitles_url, params=params, timeout=15
+            )
             response.raise_for_status()
 
-            # Add delay to avoid rate limiting
-            time.sleep(2)
-
-            subtitles_data = response.json()
+            subtitles_data = json_loads(response.content)
 
             # Handle different response formats
             if isinstance(subtitles_data, list):
@@ -146,47 +522,156 @@ class SubSourceDownloader:
             else:
                 subtitles = subtitles_data.get("subtitles", [])
 
-            # Format results
-            formatted_subtitles = []
-            for subtitle in subtitles:
-                subtitle_link = subtitle.get("link", "")
-                subtitle_id = subtitle.get("id")
-                subtitle_language = subtitle.get("language", language)
+            self._listing_cache[cache_key] = (subtitles, time.monotonic())
+            return subtitles
 
-                # Build download URL from the link field (always use API)
-                download_url = f"{self.api_url}/subtitle/{subtitle_id}/download"
+    def _request_lock(self, *key: str) -> threading.Lock:
+        """
+        Get the lock serialising one search or listing request.
 
-                formatted_subtitles.append(
-                    {
-                        "id": subtitle_id,
-                        "title": f"{movie_title} ({movie_year})",
-                        "language": subtitle_language,
-                        "download_url": download_url,
-                        "filename": subtitle.get("release_info", ""),
-                        "score": subtitle.get("rating", "unrated"),
-                        "hearing_impaired": subtitle.get("hearing_impaired", 0),
-                        "release_info": subtitle.get("release_info", ""),
-                        "upload_date": subtitle.get("upload_date", ""),
-                        "movie_link": movie_link,
-                        "subtitle_link": subtitle_link,
-                    }
+        Args:
+            key: Kind of request followed by what identifies it
+
+        Returns:
+            Lock shared by all callers of the same request
+        """
+        with self._request_locks_guard:
+            return self._request_locks.setdefault(key, threading.Lock())
+
+    def _find_movie(self, title: str, year: int) -> Optional[Dict]:
+        """
+        Find the best matching SubSource movie for a title and year.
+
+        Args:
+            title: Movie title
+            year: Movie year
+
+        Returns:
+            Best matching movie dictionary or None if nothing matched
+
+        Raises:
+            requests.exceptions.RequestException: If the search request fails
+            ValueError: If the search response is not valid JSON
+        """
+        search_results = self._search_titles(title, include_seasons=False)
+        logger.info(f"Found {len(search_results)} movie(s) in search")
+
+        # Prefer the movie from the same year, else take the first result
+        return next(
+            (movie for movie in search_results if movie.get("releaseYear") == year),
+            search_results[0] if search_results else None,
+        )
+
+    def _search_titles(self, query: str, include_seasons: bool) -> List[Dict]:
+        """
+        Search SubSource titles, reusing recent results for the same query.
+
+        Results are cached per query, ignoring case and extra whitespace, for
+        a day and kept on disk by save_search_cache(). Empty results are only
+        reused for an hour within the run, so every language of a title
+        SubSource doesn't have still shares one search, while titles added
+        to SubSource later are found on the next run.
+
+        Args:
+            query: Movie or series title
+            include_seasons: Whether to include TV series with their seasons
+
+        Returns:
+            List of search results
+
+        Raises:
+            requests.exceptions.RequestException: If the search request fails
+            ValueError: If the search response is not valid JSON
+        """
+        query = " ".join(query.split())
+        cache_key = f"{int(include_seasons)}:{query.lower()}"
+        with self._request_lock("search", cache_key):
+            entry = self._search_cache.get(cache_key)
+            if entry is not None:
+                ttl = (
+                    _SEARCH_CACHE_TTL_SECONDS
+                    if entry["results"]
+                    else _EMPTY_SEARCH_CACHE_TTL_SECONDS
                 )
+                if time.time() - entry["fetched_at"] < ttl:
+                    return entry["results"]
 
-            print(f"    Found {len(formatted_subtitles)} {language} subtitle(s)")
+            logger.info(f"Searching SubSource for: {query}")
 
-            if not formatted_subtitles:
-                self.tracker.record_no_subtitles_found(title, year, language)
+            search_url = f"{self.api_url}/movie/search"
+            search_payload = {
+                **_SEARCH_PAYLOAD_DEFAULTS,
+                "query": query,
+                "includeSeasons": include_seasons,
+            }
 
-            return formatted_subtitles
+            response = self._request(
+                self.session.post,
+                search_url,
+                data=json_dumps(search_payload),
+                headers=_JSON_HEADERS,
+                timeout=15,
+            )
+            response.raise_for_status()
 
-        except requests.exceptions.RequestException as e:
-            print(f"    Error searching SubSource: {e}")
-            self.tracker.record_no_subtitles_found(title, year, language)
-            return []
-        except (KeyError, ValueError) as e:
-            print(f"    Error parsing SubSource response: {e}")
-            self.tracker.record_no_subtitles_found(title, year, language)
-            return []
+            search_results = json_loads(response.content).get("results", [])
+            self._search_cache[cache_key] = {
+                "results": search_results,
+                "fetched_at": int(time.time()),
+            }
+            if search_results:
+                self._search_cache_dirty = True
+            return search_results
+
+    def _load_search_cache(self) -> Dict[str, Dict]:
+        """
+        Load title searches from previous runs, dropping expired entries.
+
+        Returns:
+            Dictionary mapping cache key to its results and fetch timestamp
+        """
+        if not self._search_cache_file.exists():
+            return {}
+
+        try:
+            with open(self._search_cache_file, "rb") as f:
+                data = json_loads(f.read())
+        except (ValueError, IOError) as e:
+            logger.warning(f"Error loading search cache: {e}")
+            return {}
+
+        now = time.time()
+        return {
+            key: entry
+            for key, entry in data.items()
+            if now - entry.get("fetched_at", 0) < _SEARCH_CACHE_TTL_SECONDS
+        }
+
+    def save_search_cache(self):
+        """Save title searches made during this run for later runs."""
+        if not self._search_cache_dirty:
+            return
+
+        # Leave out per-run memos such as a series' season index, and
+        # searches that found nothing
+        data = {
+            key: {
+                "results": [
+                    {k: v for k, v in result.items() if not k.startswith("_")}
+                    for result in entry["results"]
+                ],
+                "fetched_at": entry["fetched_at"],
+            }
+            for key, entry in self._search_cache.items()
+            if entry["results"]
+        }
+        try:
+            self._search_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._search_cache_file, "wb") as f:
+                f.write(json_dumps(data))
+            self._search_cache_dirty = False
+        except IOError as e:
+            logger.error(f"Error saving search cache: {e}")
 
     def download_subtitle(self, subtitle_info: Dict, filename: str) -> Optional[str]:
         """
@@ -211,72 +696,56 @@ class SubSourceDownloader:
                 logger.error(f"No subtitle link found for subtitle ID {subtitle_id}")
                 return None
 
-            # Build subtitle details URL
-            details_url = f"{self.api_url}/subtitle/{subtitle_link}"
-            logger.info(f"Getting download token from: {details_url}")
-
-            response = self.session.get(details_url, timeout=30)
-            response.raise_for_status()
-
-            # Add delay to avoid rate limiting
-            time.sleep(2)
-
-            details_data = response.json()
-            subtitle_details = details_data.get("subtitle", {})
-            download_token = subtitle_details.get("download_token")
-
+            download_token = self._get_download_token(subtitle_link, subtitle_id)
             if not download_token:
-                logger.error(
-                    f"No download token found in response for subtitle ID {subtitle_id}"
-                )
-                logger.debug(f"Response data: {details_data}")
                 return None
 
-            logger.info(
-                f"Got download token for subtitle ID {subtitle_id}: "
-                f"{download_token[:20]}..."
-            )
-
             # Step 2: Download using the token
             download_url = f"{self.api_url}/subtitle/download/{download_token}"
             logger.info(f"Downloading ZIP from: {download_url}")
 
-            response = self.session.get(download_url, timeout=30)
-            response.raise_for_status()
-
-            # Add delay to avoid rate limiting
-            time.sleep(2)
-
-            # Check content type
-            content_type = response.headers.get("content-type", "").lower()
-            logger.debug(f"Download content-type: {content_type}")
-
-            if "text/html" in content_type:
-                logger.error(
-                    f"Received HTML instead of ZIP file for subtitle ID {subtitle_id}"
-                )
-                return None
+            response = self._request(
+                self.session.get, download_url, stream=True, timeout=30
+            )
+            try:
+                if not response.ok:
+                    # The token may have expired; fetch a fresh one next time
+                    with self._token_cache_lock:
+                        self._token_cache.pop(subtitle_link, None)
+                response.raise_for_status()
 
-            # Save the ZIP file temporarily
-            zip_filepath = os.path.join(self.download_dir, f"temp_{subtitle_id}.zip")
+                # Check content type
+                content_type = response.headers.get("content-type", "").lower()
+                logger.debug(f"Download content-type: {content_type}")
 
-            with open(zip_filepath, "wb") as f:
-                f.write(response.content)
+                if "text/html" in content_type:
+                    logger.error(
+                        f"Received HTML instead of ZIP file for subtitle ID "
+                        f"{subtitle_id}"
+                    )
+                    return None
 
-            logger.info(
-                f"Downloaded ZIP file: {zip_filepath} "
-                f"(size: {len(response.content)} bytes)"
-            )
+                # Spool the ZIP in fixed-size chunks; typical subtitle ZIPs
+                # stay in memory and only unusually large ones touch disk
+                with tempfile.SpooledTemporaryFile(
+                    max_size=_ZIP_SPOOL_MAX_SIZE
+                ) as zip_file:
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        zip_file.write(chunk)
 
-            # Step 3: Extract and find the subtitle file
-            extracted_file = self._extract_subtitle_from_zip(zip_filepath, subtitle_id)
+                    logger.info(
+                        f"Downloaded ZIP for subtitle ID {subtitle_id} "
+                        f"(size: {zip_file.tell()} bytes)"
+                    )
 
-            # Clean up ZIP file
-            try:
-                os.remove(zip_filepath)
-                logger.debug(f"Cleaned up ZIP file: {zip_filepath}")
-            except OSError as e:
-                logger.warning(f"Could not clean up ZIP file {zip_filepath}: {e}")
+                    # Step 3: Extract and find the subtitle file
+                    zip_file.seek(0)
+                    extracted_file = self._extract_subtitle_from_zip(
+                        zip_file, subtitle_id
+                    )
+            finally:
+                # Hand the connection back to the pool
+                response.close()
 
             if extracted_file:
                 logger.info(f"✓ Successfully extracted subtitle: {extracted_file}")
@@ -288,107 +757,153 @@ class SubSourceDownloader:
                 )
                 return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"HTTP error downloading subtitle ID {subtitle_id}: {e}")
-            return None
-        except (KeyError, ValueError) as e:
-            logger.error(f"JSON parsing error for subtitle ID {subtitle_id}: {e}")
+        except (
+            requests.exceptions.RequestException,
+            KeyError,
+            ValueError,
+            OSError,
+        ) as e:
+            logger.error(f"Error downloading subtitle ID {subtitle_id}: {e}")
             return None
-        except IOError as e:
-            logger.error(f"File I/O error for subtitle ID {subtitle_id}: {e}")
+
+    def _get_download_token(self, subtitle_link: str, subtitle_id) -> Optional[str]:
+        """
+        Get the download token of a subtitle, reusing a recently fetched one.
+
+        Args:
+            subtitle_link: Subtitle link from the search results
+            subtitle_id: Subtitle ID for logging
+
+        Returns:
+            Download token or None if SubSource didn't return one
+
+        Raises:
+            requests.exceptions.RequestException: If the details request fails
+            ValueError: If the details response is not valid JSON
+        """
+        cached = self._token_cache.get(subtitle_link)
+        if cached and time.monotonic() - cached[1] < _TOKEN_CACHE_TTL_SECONDS:
+            logger.info(f"Reusing download token for subtitle ID {subtitle_id}")
+            return cached[0]
+
+        details_url = f"{self.api_url}/subtitle/{subtitle_link}"
+        logger.info(f"Getting download token from: {details_url}")
+
+        response = self._request(self.session.get, details_url, timeout=30)
+        response.raise_for_status()
+
+        details_data = json_loads(response.content)
+        subtitle_details = details_data.get("subtitle", {})
+        download_token = subtitle_details.get("download_token")
+
+        if not download_token:
+            logger.error(
+                f"No download token found in response for subtitle ID {subtitle_id}"
+            )
+            logger.debug("Response data: %s", details_data)
             return None
 
+        logger.info(
+            f"Got download token for subtitle ID {subtitle_id}: "
+            f"{download_token[:20]}..."
+        )
+
+        # Evict the oldest token once the cache is full; languages download
+        # concurrently, so two threads may evict at the same time
+        with self._token_cache_lock:
+            self._token_cache.pop(subtitle_link, None)
+            if len(self._token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+                self._token_cache.pop(next(iter(self._token_cache)))
+            self._token_cache[subtitle_link] = (download_token, time.monotonic())
+        return download_token
+
     def _extract_subtitle_from_zip(
-        self, zip_filepath: str, subtitle_id: int
+        self, zip_file: Union[str, IO[bytes]], subtitle_id: int
     ) -> Optional[str]:
         """
-        Extract subtitle file from ZIP archive, keeping original filename.
-        Bazarr will handle renaming as needed.
+        Extract subtitle file from ZIP archive, keeping original filename
+        behind a subtitle ID prefix. Bazarr will handle renaming as needed.
 
         Args:
-            zip_filepath: Path to the ZIP file
+            zip_file: Path to the ZIP file or a binary file object holding it
             subtitle_id: Subtitle ID for logging
 
         Returns:
             Path to extracted subtitle file or None if failed
         """
         try:
-            logger.info(f"Extracting ZIP file: {zip_filepath}")
-
-            with zipfile.ZipFile(zip_filepath, "r") as zip_ref:
-                # List all files in the ZIP
-                file_list = zip_ref.namelist()
-                logger.debug(f"Files in ZIP: {file_list}")
+            logger.info(f"Extracting ZIP for subtitle ID {subtitle_id}")
+
+            with zipfile.ZipFile(zip_file, "r") as zip_ref:
+                # List all entries in the ZIP, with their sizes, in one pass
+                entries = zip_ref.infolist()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Files in ZIP: {[entry.filename for entry in entries]}"
+                    )
 
                 # Find subtitle files (common extensions)
-                subtitle_extensions = [".srt", ".ass", ".ssa", ".sub", ".vtt", ".sbv"]
-                subtitle_files = []
-
-                for file in file_list:
-                    file_lower = file.lower()
-                    if any(file_lower.endswith(ext) for ext in subtitle_extensions):
-                        subtitle_files.append(file)
-
-                logger.info(
-                    f"Found {len(subtitle_files)} subtitle file(s): {subtitle_files}"
-                )
-
-                if not subtitle_files:
+                subtitle_entries = [
+                    entry
+                    for entry in entries
+                    if not entry.is_dir()
+                    and entry.filename.lower().endswith(_SUBTITLE_EXTENSIONS)
+                ]
+
+                if not subtitle_entries:
                     logger.error(
                         f"No subtitle files found in ZIP for subtitle ID {subtitle_id}"
                     )
                     return None
 
-                # Take the first subtitle file (or largest if multiple)
-                if len(subtitle_files) > 1:
-                    # Get file sizes and pick the largest one
-                    largest_file = max(
-                        subtitle_files, key=lambda f: zip_ref.getinfo(f).file_size
-                    )
+                # Take the only subtitle file, or the largest if there are several
+                if len(subtitle_entries) == 1:
+                    selected = subtitle_entries[0]
+                    logger.info(f"Found 1 subtitle file: {selected.filename}")
+                else:
+                    selected = max(subtitle_entries, key=attrgetter("file_size"))
                     logger.info(
-                        f"Multiple subtitle files found, selecting largest: "
-                        f"{largest_file}"
+                        f"Found {len(subtitle_entries)} subtitle files, "
+                        f"selecting largest: {selected.filename}"
                     )
-                    selected_file = largest_file
-                else:
-                    selected_file = subtitle_files[0]
-
-                # Extract the selected file with its original name
-                logger.info(f"Extracting file: {selected_file}")
 
-                # Use original filename from ZIP
-                original_filename = os.path.basename(selected_file)
-                target_path = os.path.join(self.download_dir, original_filename)
-
-                # Extract directly to the target location
-                zip_ref.extract(selected_file, self.download_dir)
-
-                # If the extracted file is in a subdirectory, move it to the root
-                extracted_path = os.path.join(self.download_dir, selected_file)
-                if extracted_path != target_path:
-                    os.rename(extracted_path, target_path)
-                    # Clean up any empty directories
+                # Stream the file straight to the download directory under its
+                # original name, dropping any folders it sits in inside the ZIP.
+                # Languages download in parallel and their archives often share
+                # a release name, so the subtitle ID keeps each file apart
+                logger.info(f"Extracting file: {selected.filename}")
+                target_path = os.path.join(
+                    self.download_dir,
+                    f"{subtitle_id}_{os.path.basename(selected.filename)}",
+                )
+                try:
+                    with (
+                        zip_ref.open(selected) as source,
+                        open(target_path, "wb") as target,
+                    ):
+                        shutil.copyfileobj(source, target, _DOWNLOAD_CHUNK_SIZE)
+                except Exception:
+                    # Don't leave a truncated subtitle behind for the upload
                     try:
-                        parent_dir = os.path.dirname(extracted_path)
-                        if parent_dir != self.download_dir:
-                            os.rmdir(parent_dir)
+                        os.remove(target_path)
                     except OSError:
-                        pass  # Directory not empty or other issue
+                        pass
+                    raise
 
-                file_size = os.path.getsize(target_path)
                 logger.info(
-                    f"Extracted subtitle to: {target_path} (size: {file_size} bytes)"
+                    f"Extracted subtitle to: {target_path} "
+                    f"(size: {selected.file_size} bytes)"
                 )
                 return target_path
 
         except zipfile.BadZipFile as e:
-            logger.error(f"Invalid ZIP file {zip_filepath}: {e}")
+            logger.error(f"Invalid ZIP file for subtitle ID {subtitle_id}: {e}")
             return None
         except (IOError, OSError) as e:
-            logger.error(f"File error extracting from {zip_filepath}: {e}")
+            logger.error(f"File error extracting subtitle ID {subtitle_id}: {e}")
             return None
         except Exception as e:
-            logger.error(f"Unexpected error extracting from {zip_filepath}: {e}")
+            logger.error(f"Unexpected error extracting subtitle ID {subtitle_id}: {e}")
             return None
 
     def get_subtitle_for_movie(self, movie: Dict) -> tuple[List[str], int]:
@@ -405,57 +920,98 @@ class SubSourceDownloader:
         year = self._get_movie_year(title, movie.get("year", 0))
         missing_subs = movie.get("missing_subtitles", [])
 
-        downloaded_files = []
-        skipped_count = 0
-
         print(f"  Processing: {title} ({year})")
 
-        for sub in missing_subs:
-            lang_name = sub.get("name", "Unknown")
-            lang_code = sub.get("code2", "en")
-
-            print(f"    Looking for {lang_name} subtitle...")
+        # Skip languages searched recently, using Bazarr's own search interval
+        search_interval = self._get_search_interval_hours()
+        to_try, skipped_count = self.tracker.bulk_filter(
+            title,
+            year,
+            [sub.get("name", "Unknown").lower() for sub in missing_subs],
+            search_interval,
+        )
+        to_try = set(to_try)
 
-            # Check if we should skip this search based on recent failures
-            # Use Bazarr's own search interval
-            search_interval = self._get_search_interval_hours()
-            if self.tracker.should_skip_search(
-                title, year, lang_name.lower(), search_interval
-            ):
+        languages = []
+        for sub in missing_subs:
+            if sub.get("name", "Unknown").lower() in to_try:
+                languages.append(sub)
+            else:
                 print(
-                    f"    Skipping {lang_name} subtitle "
+                    f"    Skipping {sub.get('name', 'Unknown')} subtitle "
                     f"(last tried within {search_interval}h interval)"
                 )
-                skipped_count += 1
-                continue
 
-            # Search for subtitles
-            results = self.search_subtitles(title, year, lang_name.lower())
+        downloaded_files = self._download_languages(
+            languages,
+            lambda language: self.search_subtitles(title, year, language),
+            title,
+            year,
+            "temp_filename",
+        )
 
-            if not results:
-                print(f"    No subtitles found for {lang_name}")
-                continue
+        return downloaded_files, skipped_count
+
+    def _download_languages(
+        self,
+        languages: List[Dict],
+        search: Callable[[str], List[Dict]],
+        track_title: str,
+        track_year: int,
+        temp_prefix: str,
+    ) -> List[str]:
+        """
+        Search and download the best subtitle of each language concurrently.
 
-            # Take the best result (first one)
-            best_result = results[0]
+        Outcomes are printed, and files returned, in the order of languages.
 
-            # Download subtitle (keeping original filename from ZIP)
+        Args:
+            languages: Missing subtitle entries from Bazarr to fetch
+            search: Callable returning search results for a lowercase language
+            track_title: Title under which download failures are tracked
+            track_year: Year under which download failures are tracked
+            temp_prefix: Prefix of the temporary filename of each download
+
+        Returns:
+            List of downloaded subtitle file paths
+        """
+        if not languages:
+            return []
+
+        def download_language(sub: Dict) -> Tuple[Optional[str], str]:
+            lang_name = sub.get("name", "Unknown")
+            lang_code = sub.get("code2", "en")
+
+            results = search(lang_name.lower())
+            if not results:
+                return None, f"No subtitles found for {lang_name}"
+
+            # Take the best result (first one), keeping its original filename
             downloaded_file = self.download_subtitle(
-                best_result, f"temp_filename_{lang_code}.srt"
+                results[0], f"{temp_prefix}_{lang_code}.srt"
             )
             if downloaded_file:
-                downloaded_files.append(downloaded_file)
-                print(f"    ✓ Downloaded {lang_name} subtitle")
-            else:
-                self.tracker.record_download_failure(
-                    title, year, lang_name.lower(), "Download failed"
-                )
-                print(f"    ✗ Failed to download {lang_name} subtitle")
+                return downloaded_file, f"✓ Downloaded {lang_name} subtitle"
+
+            self.tracker.record_download_failure(
+                track_title, track_year, lang_name.lower(), "Download failed"
+            )
+            return None, f"✗ Failed to download {lang_name} subtitle"
 
-            # Small delay to be respectful to the server
-            time.sleep(0.5)
+        for sub in languages:
+            print(f"    Looking for {sub.get('name', 'Unknown')} subtitle...")
 
-        return downloaded_files, skipped_count
+        workers = min(_LANGUAGE_MAX_WORKERS, len(languages))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(download_language, languages))
+
+        downloaded_files = []
+        for downloaded_file, message in outcomes:
+            print(f"    {message}")
+            if downloaded_file:
+                downloaded_files.append(downloaded_file)
+
+        return downloaded_files
 
     def _get_movie_year_from_bazarr(self, movie_title: str) -> Optional[int]:
         """
@@ -474,11 +1030,12 @@ class SubSourceDownloader:
         params = {"query": movie_title}
 
         try:
+            # The Bazarr session already carries the API key and basic auth
             response = self.bazarr.session.get(
-                url, params=params, auth=self.bazarr.auth, timeout=30
+                url, params=params, timeout=_BAZARR_SEARCH_TIMEOUT
             )
             response.raise_for_status()
-            search_data = response.json()
+            search_data = json_loads(response.content)
 
             # Handle different response formats - could be list or dict
             if isinstance(search_data, list):
@@ -491,17 +1048,23 @@ class SubSourceDownloader:
                 )
                 return None
 
-            # Find the best matching movie by title
-            for movie in movies:
-                movie_title_result = movie.get("title", "").lower()
-                if (
-                    movie_title.lower() in movie_title_result
-                    or movie_title_result in movie_title.lower()
-                ):
-                    year = movie.get("year")
-                    if year:
-                        logger.info(f"Found movie year for {movie_title}: {year}")
-                        return int(year)
+            # Find the first title match that has a year
+            title_lower = movie_title.lower()
+            year = next(
+                (
+                    movie.get("year")
+                    for movie in movies
+                    if movie.get("year")
+                    and (
+                        title_lower in movie.get("title", "").lower()
+                        or movie.get("title", "").lower() in title_lower
+                    )
+                ),
+                None,
+            )
+            if year:
+                logger.info(f"Found movie year for {movie_title}: {year}")
+                return int(year)
 
             # If no exact match, try the first result
             if movies:
@@ -546,7 +1109,8 @@ class SubSourceDownloader:
         if self.bazarr:
             year = self._get_movie_year_from_bazarr(title)
             if year:
-                self._movie_years_cache[title] = year
+                self._remember_movie_year(title, year)
+                self._save_movie_years()
                 return year
 
         # Use fallback or default
@@ -554,24 +1118,201 @@ class SubSourceDownloader:
         self._movie_years_cache[title] = final_year
         return final_year
 
-    def _get_search_interval_hours(self) -> int:
+    def preload_movie_years(self, movies: List[Dict]):
         """
-        Get the search interval from Bazarr or use cached value.
+        Resolve missing movie years through Bazarr concurrently.
 
-        Returns:
-            Search interval in hours
+        Looks up every movie without a usable year up front, so processing
+        each movie afterwards is a cache lookup instead of a Bazarr request.
+        Movies Bazarr has no year for get the same fallback year as
+        _get_movie_year() gives them, kept for this run only.
+
+        Args:
+            movies: Movie dictionaries from Bazarr API
         """
-        if self._search_interval_hours is None:
-            if self.bazarr:
-                self._search_interval_hours = (
-                    self.bazarr.get_missing_subtitles_search_interval()
-                )
+        if not self.bazarr:
+            return
+
+        fallback_years = {}
+        for movie in movies:
+            title = movie.get("title", "Unknown")
+            year = movie.get("year") or 0
+            if year <= 1900 and title not in self._movie_years_cache:
+                fallback_years.setdefault(title, year)
+        titles = list(fallback_years)
+        if not titles:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(_YEAR_LOOKUP_MAX_WORKERS, len(titles))
+        ) as executor:
+            years = list(
+                zip(titles, executor.map(self._get_movie_year_from_bazarr, titles))
+            )
+
+        resolved = 0
+        for title, year in years:
+            if year:
+                self._remember_movie_year(title, year)
+                resolved += 1
             else:
-                logger.warning(
-                    "No Bazarr client provided, using default 24 hour interval"
+                fallback_year = fallback_years[title]
+                self._movie_years_cache[title] = (
+                    fallback_year if fallback_year > 0 else 2000
                 )
-                self._search_interval_hours = 24
 
+        if resolved:
+            self._save_movie_years()
+        logger.info(f"Preloaded years for {resolved} of {len(titles)} movie(s)")
+
+    def preload_movie_searches(self, movies: List[Dict]):
+        """
+        Run the SubSource movie searches of a batch of movies concurrently.
+
+        Only movies with a language that is due for a search are looked up.
+        Processing each movie afterwards finds its search already cached,
+        including searches that found nothing.
+        Call preload_movie_years() first so the searches use resolved years.
+
+        Args:
+            movies: Movie dictionaries from Bazarr API
+        """
+        search_interval = self._get_search_interval_hours()
+        titles = set()
+        for movie in movies:
+            title = movie.get("title", "Unknown")
+            year = self._get_movie_year(title, movie.get("year", 0))
+            to_try, _ = self.tracker.bulk_filter(
+                title,
+                year,
+                [
+                    sub.get("name", "Unknown").lower()
+                    for sub in movie.get("missing_subtitles", [])
+                ],
+                search_interval,
+            )
+            if to_try:
+                titles.add(title)
+
+        self._preload_searches(titles, include_seasons=False, kind="movie(s)")
+
+    def preload_episode_searches(self, episodes: List[Dict]):
+        """
+        Run the SubSource series searches of a batch of episodes concurrently.
+
+        Each series is searched once, however many of its episodes are due.
+        Processing each episode afterwards finds its search already cached,
+        including searches that found nothing.
+
+        Args:
+            episodes: Episode dictionaries from Bazarr API
+        """
+        search_interval = self._get_search_interval_hours()
+        titles = set()
+        for episode in episodes:
+            series_title = episode.get("series_title", "Unknown")
+            if series_title in titles:
+                continue
+            episode_key = (
+                f"{series_title}:S{episode.get('season')}"
+                f"E{episode.get('episode_number')}"
+            )
+            to_try, _ = self.tracker.bulk_filter(
+                episode_key,
+                0,
+                [
+                    sub.get("name", "Unknown").lower()
+                    for sub in episode.get("missing_subtitles", [])
+                ],
+                search_interval,
+            )
+            if to_try:
+                titles.add(series_title)
+
+        self._preload_searches(titles, include_seasons=True, kind="series")
+
+    def _preload_searches(self, titles: set, include_seasons: bool, kind: str):
+        """
+        Search SubSource for several titles at once, filling the search cache.
+
+        Args:
+            titles: Titles to search for
+            include_seasons: Whether the searches include TV series
+            kind: What the titles are, for the log message
+        """
+        # Titles differing only in case or spacing share one search
+        titles = {" ".join(title.lower().split()): title for title in titles}
+        if not titles:
+            return
+
+        def search(title: str) -> bool:
+            try:
+                return bool(self._search_titles(title, include_seasons=include_seasons))
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                logger.error(f"Error preloading SubSource search for {title}: {e}")
+                return False
+
+        with ThreadPoolExecutor(
+            max_workers=min(_SEARCH_PRELOAD_MAX_WORKERS, len(titles))
+        ) as executor:
+            found = sum(executor.map(search, titles.values()))
+
+        logger.info(f"Preloaded SubSource searches for {found} of {len(titles)} {kind}")
+
+    def _remember_movie_year(self, title: str, year: int):
+        """Cache a movie year resolved through Bazarr, in memory and on disk."""
+        self._movie_years_cache[title] = year
+        self._movie_years_store[title] = {"year": year, "fetched_at": int(time.time())}
+
+    def _load_movie_years(self) -> Dict[str, Dict]:
+        """
+        Load movie years resolved on previous runs, dropping expired entries.
+
+        Returns:
+            Dictionary mapping movie title to its year and fetch timestamp
+        """
+        if not self._movie_years_file.exists():
+            return {}
+
+        try:
+            with open(self._movie_years_file, "rb") as f:
+                data = json_loads(f.read())
+        except (ValueError, IOError) as e:
+            logger.warning(f"Error loading movie years cache: {e}")
+            return {}
+
+        now = time.time()
+        return {
+            title: entry
+            for title, entry in data.items()
+            if now - entry.get("fetched_at", 0) < _MOVIE_YEAR_TTL_SECONDS
+        }
+
+    def _save_movie_years(self):
+        """Save movie years resolved through Bazarr for later runs."""
+        try:
+            self._movie_years_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._movie_years_file, "wb") as f:
+                f.write(json_dumps(self._movie_years_store))
+        except IOError as e:
+            logger.error(f"Error saving movie years cache: {e}")
+
+    def _get_search_interval_hours(self) -> int:
+        """
+        Get the search interval from Bazarr, refreshed once it is an hour old.
+
+        Returns:
+            Search interval in hours
+        """
+        if (
+            self.bazarr
+            and time.monotonic() - self._search_interval_fetched_at
+            > _SEARCH_INTERVAL_TTL_SECONDS
+        ):
+            self._search_interval_hours = (
+                self.bazarr.get_missing_subtitles_search_interval()
+            )
+            self._search_interval_fetched_at = time.monotonic()
         return self._search_interval_hours
 
     def get_tracking_summary(self) -> dict:
@@ -594,31 +1335,7 @@ class SubSourceDownloader:
         Returns:
             Tuple of (season, episode) or (None, None) if not found
         """
-        release_info = subtitle.get("release_info", "")
-
-        # First, look for S01E01 pattern (most specific)
-        season_episode_match = re.search(r"[Ss](\d+)[Ee](\d+)", release_info)
-        if season_episode_match:
-            season = int(season_episode_match.group(1))
-            episode = int(season_episode_match.group(2))
-            return season, episode
-
-        # Look for 1x01 pattern
-        alt_pattern = re.search(r"(\d+)x(\d+)", release_info)
-        if alt_pattern:
-            season = int(alt_pattern.group(1))
-            episode = int(alt_pattern.group(2))
-            return season, episode
-
-        # Fallback: Look for standalone E01 pattern (least specific)
-        episode_match = re.search(r"[Ee](\d+)", release_info)
-        if episode_match:
-            episode = int(episode_match.group(1))
-            # For E01 format, we don't extract season from the subtitle
-            # We rely on the season context from the search
-            return None, episode
-
-        return None, None
+        return _parse_release_episode(subtitle.get("release_info", ""))
 
     def _find_best_series_match(
         self,
@@ -639,23 +1356,20 @@ class SubSourceDownloader:
         Returns:
             Best matching series or None
         """
-        series_candidates = []
-
-        # Filter for TV series results
-        for result in search_results:
-            result_type = result.get("type", "").lower()
-            result_title = result.get("title", "").lower()
-            series_title_lower = series_title.lower()
-
-            # Must be a TV series and title must match
-            if result_type == "tvseries" and series_title_lower in result_title:
-                series_candidates.append(result)
+        # Filter for TV series results whose title contains the target title
+        series_title_lower = series_title.lower()
+        series_candidates = [
+            result
+            for result in search_results
+            if result.get("type", "").lower() == "tvseries"
+            and series_title_lower in result.get("title", "").lower()
+        ]
 
         if not series_candidates:
-            print(f"      No TV series found matching '{series_title}'")
+            logger.info(f"No TV series found matching '{series_title}'")
             return None
 
-        print(f"      Found {len(series_candidates)} TV series candidate(s)")
+        logger.info(f"Found {len(series_candidates)} TV series candidate(s)")
 
         # If only one candidate, return it
         if len(series_candidates) == 1:
@@ -663,33 +1377,32 @@ class SubSourceDownloader:
 
         # Multiple candidates - filter by release year if available
         if series_year:
-            year_matches = []
-            for candidate in series_candidates:
-                candidate_year = candidate.get("releaseYear")
-                if candidate_year == series_year:
-                    year_matches.append(candidate)
+            year_matches = [
+                candidate
+                for candidate in series_candidates
+                if candidate.get("releaseYear") == series_year
+            ]
 
             if year_matches:
-                print(f"      Matched {len(year_matches)} series by year {series_year}")
+                logger.info(f"Matched {len(year_matches)} series by year {series_year}")
                 # If multiple year matches, check for season availability
                 if len(year_matches) == 1:
                     return year_matches[0]
                 else:
-                    # Check which has the target season
-                    for candidate in year_matches:
-                        if self._has_season(candidate, season):
-                            return candidate
-                    # If no season match, return first year match
-                    return year_matches[0]
+                    # Prefer the one with the target season, else the first
+                    return next(
+                        (c for c in year_matches if self._has_season(c, season)),
+                        year_matches[0],
+                    )
 
         # No year match or no year provided - check for season availability
         for candidate in series_candidates:
             if self._has_season(candidate, season):
-                print(f"      Selected series with season {season}")
+                logger.info(f"Selected series with season {season}")
                 return candidate
 
         # If no season match, return first candidate
-        print("      No exact match found, using first candidate")
+        logger.info("No exact match found, using first candidate")
         return series_candidates[0]
 
     def _has_season(self, series: Dict, season: int) -> bool:
@@ -703,15 +1416,30 @@ class SubSourceDownloader:
         Returns:
             True if series has the season
         """
-        seasons = series.get("seasons", [])
-        if not seasons:
-            return False
+        return int(season) in self._season_index(series)
 
-        for season_data in seasons:
-            season_num = season_data.get("season")
-            if season_num == season:
-                return True
-        return False
+    def _season_index(self, series: Dict) -> Dict[int, Optional[str]]:
+        """
+        Map season numbers of a series to their links.
+
+        The index is built once and memoized on the series dict, so season
+        checks for the same search result are dictionary lookups.
+
+        Args:
+            series: Series data from SubSource
+
+        Returns:
+            Dictionary mapping season number to its first non-empty link
+        """
+        index = series.get("_season_index")
+        if index is None:
+            index = {}
+            for season_data in series.get("seasons") or []:
+                season_num = season_data.get("season")
+                if season_num is not None and not index.get(int(season_num)):
+                    index[int(season_num)] = season_data.get("link")
+            series["_season_index"] = index
+        return index
 
     def _get_season_link(self, series: Dict, season: int) -> Optional[str]:
         """
@@ -726,25 +1454,22 @@ class SubSourceDownloader:
         """
         seasons = series.get("seasons", [])
         if not seasons:
-            print("      No seasons data available")
+            logger.info("No seasons data available")
             return None
 
         # Look for exact season match first
-        for season_data in seasons:
-            season_num = int(season_data.get("season"))
-            if int(season_num) == int(season):
-                link = season_data.get("link")
-                if link:
-                    print(f"      Found exact season {season} match")
-                    return link.replace("=", "-")
+        link = self._season_index(series).get(int(season))
+        if link:
+            logger.info(f"Found exact season {season} match")
+            return link.replace("=", "-")
 
         # If only one season available, use it even if number doesn't match
         if len(seasons) == 1:
             link = seasons[0].get("link")
             if link:
                 available_season = seasons[0].get("season", "unknown")
-                print(
-                    f"      Using only available season {available_season} for target season {season}"
+                logger.info(
+                    f"Using only available season {available_season} for target season {season}"
                 )
                 return link.replace("=", "-")
 
@@ -758,12 +1483,12 @@ class SubSourceDownloader:
                     link = season_data.get("link")
                     if link:
                         available_season = season_data.get("season", "unknown")
-                        print(
-                            f"      Using season {available_season} based on release year match"
+                        logger.info(
+                            f"Using season {available_season} based on release year match"
                         )
                         return link.replace("=", "-")
 
-        print(f"      No suitable season found for season {season}")
+        logger.info(f"No suitable season found for season {season}")
         return None
 
     def _is_subtitle_match(self, subtitle: Dict, target_episode: Dict) -> bool:
@@ -816,87 +1541,59 @@ class SubSourceDownloader:
         episode_number = episode.get("episode_number", 0)
         series_year = episode.get("seriesYear")
 
-        print(f"    Searching SubSource for: {series_title} S{season}E{episode_number}")
+        logger.info(
+            f"Searching SubSource for: {series_title} S{season}E{episode_number}"
+        )
 
+        episode_key = f"{series_title}:S{season}E{episode_number}"
+        matching_subtitles = []
         try:
-            print(f"      Searching with series name: {series_title}")
-
-            # Search with original series name only
-            search_url = f"{self.api_url}/movie/search"
-            search_payload = {
-                "query": series_title,
-                "signal": {},
-                "includeSeasons": True,  # Include TV shows
-                "limit": 15,
-            }
-
-            response = self.session.post(search_url, json=search_payload, timeout=15)
-            response.raise_for_status()
-
-            time.sleep(2)  # Rate limiting
+            logger.info(f"Searching with series name: {series_title}")
 
-            search_data = response.json()
-            search_results = search_data.get("results", [])
+            # Search with original series name only, including TV shows
+            search_results = self._search_titles(series_title, include_seasons=True)
 
-            print(f"      Found {len(search_results)} result(s)")
+            logger.info(f"Found {len(search_results)} result(s)")
 
-            # Find the best matching TV series
+            # Find the best matching TV series and the link of its season
             best_series = self._find_best_series_match(
                 search_results, series_title, series_year, season
             )
+            season_link = (
+                self._get_season_link(best_series, season) if best_series else None
+            )
 
             if not best_series:
-                print("      No matching TV series found")
-                episode_key = f"{series_title}:S{season}E{episode_number}"
-                self.tracker.record_no_subtitles_found(episode_key, 0, language)
-                return []
-
-            # Get season link from the best series
-            season_link = self._get_season_link(best_series, season)
-            if not season_link:
-                print(f"      Season {season} not found in series")
-                episode_key = f"{series_title}:S{season}E{episode_number}"
-                self.tracker.record_no_subtitles_found(episode_key, 0, language)
-                return []
-
-            print(f"      Found season {season}, getting subtitles...")
-
-            # Get subtitles for the season
-            subtitles_url = f"{self.api_url}{season_link}"
-            params = {"language": language.lower(), "sort_by_date": "false"}
-
-            time.sleep(2)  # Rate limiting
-
-            sub_response = self.session.get(subtitles_url, params=params, timeout=15)
-            sub_response.raise_for_status()
-
-            subtitles_data = sub_response.json()
-            if isinstance(subtitles_data, list):
-                subtitles = subtitles_data
+                logger.info("No matching TV series found")
+            elif not season_link:
+                logger.info(f"Season {season} not found in series")
             else:
-                subtitles = subtitles_data.get("subtitles", [])
-
-            # Filter subtitles that match our episode
-            matching_subtitles = []
-            for subtitle in subtitles:
-                if self._is_subtitle_match(subtitle, episode):
-                    subtitle["source_query"] = series_title
-                    subtitle["source_link"] = season_link
-                    matching_subtitles.append(subtitle)
+                logger.info(f"Found season {season}, getting subtitles...")
 
-            print(f"      Found {len(matching_subtitles)} matching episode subtitles")
+                # Keep the season subtitles that match our episode, as copies
+                # since the season listing is cached and shared by episodes
+                matching_subtitles = [
+                    {
+                        **subtitle,
+                        "source_query": series_title,
+                        "source_link": season_link,
+                    }
+                    for subtitle in self._fetch_subtitles(season_link, language)
+                    if self._is_subtitle_match(subtitle, episode)
+                ]
 
-            if not matching_subtitles:
-                episode_key = f"{series_title}:S{season}E{episode_number}"
-                self.tracker.record_no_subtitles_found(episode_key, 0, language)
+                logger.info(
+                    f"Found {len(matching_subtitles)} matching episode subtitles"
+                )
 
-            return matching_subtitles
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            logger.error(f"Error searching for episode: {e}")
 
-        except requests.exceptions.RequestException as e:
-            print(f"      Error searching for episode: {e}")
-            episode_key = f"{series_title}:S{season}E{episode_number}"
+        # Every unsuccessful search is recorded once, whatever the cause
+        if not matching_subtitles:
             self.tracker.record_no_subtitles_found(episode_key, 0, language)
-            return []
+
+        return matching_subtitles
 
     def get_subtitle_for_episode(self, episode: Dict) -> Tuple[List[str], int]:
         """
@@ -915,50 +1612,34 @@ class SubSourceDownloader:
 
         episode_key = f"{series_title}:S{season}E{episode_number}"
 
-        downloaded_files = []
-        skipped_count = 0
-
         print(f"  Processing: {episode_key}")
 
-        for sub in missing_subs:
-            lang_name = sub.get("name", "Unknown")
-            lang_code = sub.get("code2", "en")
-
-            print(f"    Looking for {lang_name} subtitle...")
+        # Skip languages searched recently, using Bazarr's own search interval
+        search_interval = self._get_search_interval_hours()
+        to_try, skipped_count = self.tracker.bulk_filter(
+            episode_key,
+            0,
+            [sub.get("name", "Unknown").lower() for sub in missing_subs],
+            search_interval,
+        )
+        to_try = set(to_try)
 
-            # Check if we should skip this search based on recent failures
-            search_interval = self._get_search_interval_hours()
-            if self.tracker.should_skip_search(
-                episode_key, 0, lang_name.lower(), search_interval
-            ):
+        languages = []
+        for sub in missing_subs:
+            if sub.get("name", "Unknown").lower() in to_try:
+                languages.append(sub)
+            else:
                 print(
-                    f"    Skipping {lang_name} subtitle "
+                    f"    Skipping {sub.get('name', 'Unknown')} subtitle "
                     f"(last tried within {search_interval}h interval)"
                 )
-                skipped_count += 1
-                continue
-
-            # Search for subtitles
-            results = self.search_episode_subtitles(episode, lang_name.lower())
 
-            if not results:
-                print(f"    No subtitles found for {lang_name}")
-                continue
-
-            # Take the best result (first one)
-            best_result = results[0]
-
-            # Download subtitle
-            downloaded_file = self.download_subtitle(
-                best_result, f"temp_episode_{lang_code}.srt"
-            )
-            if downloaded_file:
-                downloaded_files.append(downloaded_file)
-                print(f"    ✓ Downloaded {lang_name} subtitle")
-            else:
-                self.tracker.record_download_failure(
-                    episode_key, 0, lang_name.lower(), "Download failed"
-                )
-                print(f"    ✗ Failed to download {lang_name} subtitle")
+        downloaded_files = self._download_languages(
+            languages,
+            lambda language: self.search_episode_subtitles(episode, language),
+            episode_key,
+            0,
+            "temp_episode",
+        )
 
         return downloaded_files, skipped_count
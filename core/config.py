@@ -11,6 +11,16 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+def get_config_dir() -> Path:
+    """
+    Get the directory holding the config file and the data kept between runs.
+
+    Returns:
+        Path of the bazarr-subsource config directory
+    """
+    return Path.home() / ".config" / "bazarr-subsource"
+
+
 def load_config():
     """
     Load configuration from config file.
@@ -19,7 +29,7 @@ def load_config():
         Configuration dictionary or None if error
     """
     # Config file path
-    config_dir = Path.home() / ".config" / "bazarr-subsource"
+    config_dir = get_config_dir()
     config_file = config_dir / "config.cfg"
 
     # Create config directory if it doesn't exist
@@ -68,77 +78,49 @@ def load_config():
 
 def create_default_config(config_file: Path):
     """Create a default configuration file."""
-    config = configparser.ConfigParser()
-
-    config["bazarr"] = {
-        "url": "https://yourbazarr.example.com",
-        "api_key": "your_api_key_here",
-    }
-
-    config["auth"] = {"username": "your_username", "password": "your_password"}
-
-    config["subsource"] = {"api_url": "https://api.subsource.net/v1"}
-
-    config["download"] = {"directory": "/tmp/downloaded_subtitles"}
-
-    config["movies"] = {"enabled": "true"}
-
-    config["episodes"] = {
-        "enabled": "true",
-        "search_patterns": "season_episode,episode_title,scene_name",
-    }
-
-    config["logging"] = {"level": "INFO", "file": "/var/log/bazarr_subsource.log"}
+    default_config = "\n".join(
+        [
+            "# Bazarr SubSource Integration Configuration",
+            "# Edit this file with your actual settings",
+            "",
+            "[bazarr]",
+            "url = https://yourbazarr.example.com",
+            "api_key = your_api_key_here",
+            "",
+            "[auth]",
+            "# Only needed if you have a reverse proxy with basic auth in front of Bazarr",
+            "# Leave empty or remove this section if connecting directly to Bazarr",
+            "username = your_username",
+            "password = your_password",
+            "",
+            "[subsource]",
+            "api_url = https://api.subsource.net/v1",
+            "# Cloudflare clearance cookie (get from browser DevTools > Application > Cookies)",
+            "# Leave empty if not needed or set via SUBSOURCE_CF_CLEARANCE environment variable",
+            "cf_clearance = ",
+            "",
+            "[download]",
+            "directory = /tmp/downloaded_subtitles",
+            "",
+            "[movies]",
+            "# Enable movie subtitle downloads",
+            "enabled = true",
+            "",
+            "[episodes]",
+            "# Enable TV series episode subtitle downloads",
+            "enabled = true",
+            "# Search patterns: season_episode,episode_title,scene_name",
+            "search_patterns = season_episode,episode_title,scene_name",
+            "",
+            "[logging]",
+            "level = INFO",
+            "file = /var/log/bazarr_subsource.log",
+            "",
+        ]
+    )
 
     with open(config_file, "w") as f:
-        # Write header comments
-        f.write("# Bazarr SubSource Integration Configuration\n")
-        f.write("# Edit this file with your actual settings\n\n")
-
-        # Write bazarr section
-        f.write("[bazarr]\n")
-        f.write("url = https://yourbazarr.example.com\n")
-        f.write("api_key = your_api_key_here\n\n")
-
-        # Write auth section with comments
-        f.write("[auth]\n")
-        f.write(
-            "# Only needed if you have a reverse proxy with basic auth "
-            "in front of Bazarr\n"
-        )
-        f.write(
-            "# Leave empty or remove this section if connecting directly to Bazarr\n"
-        )
-        f.write("username = your_username\n")
-        f.write("password = your_password\n\n")
-
-        # Write remaining sections
-        f.write("[subsource]\n")
-        f.write("api_url = https://api.subsource.net/v1\n")
-        f.write(
-            "# Cloudflare clearance cookie (get from browser DevTools > Application > Cookies)\n"
-        )
-        f.write(
-            "# Leave empty if not needed or set via SUBSOURCE_CF_CLEARANCE environment variable\n"
-        )
-        f.write("cf_clearance = \n\n")
-
-        f.write("[download]\n")
-        f.write("directory = /tmp/downloaded_subtitles\n\n")
-
-        f.write("[movies]\n")
-        f.write("# Enable movie subtitle downloads\n")
-        f.write("enabled = true\n\n")
-
-        f.write("[episodes]\n")
-        f.write("# Enable TV series episode subtitle downloads\n")
-        f.write("enabled = true\n")
-        f.write("# Search patterns: season_episode,episode_title,scene_name\n")
-        f.write("search_patterns = season_episode,episode_title,scene_name\n\n")
-
-        f.write("[logging]\n")
-        f.write("level = INFO\n")
-        f.write("file = /var/log/bazarr_subsource.log\n")
+        f.write(default_config)
 
 
 def setup_logging(log_level: str, log_file: str):
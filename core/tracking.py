@@ -2,23 +2,56 @@
 Tracking module for recording subtitle search failures and successes.
 """
 
+import functools
 import json
 import logging
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, Optional
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+from core.config import get_config_dir
+from utils import json_dumps_indented, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Runs of whitespace collapsed when normalising titles into tracking keys
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse a tracking timestamp, caching the result.
+
+    Scans check the same timestamps for every wanted item, so each distinct
+    string is only parsed once; updated entries get a new string.
+
+    Args:
+        timestamp: ISO 8601 timestamp
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the timestamp is not in ISO 8601 format
+    """
+    return datetime.fromisoformat(timestamp)
+
 
 class SubtitleTracker:
     """Track subtitle search results to avoid repeated searches."""
 
     def __init__(self):
-        self.config_dir = Path.home() / ".config" / "bazarr-subsource"
+        self.config_dir = get_config_dir()
         self.tracking_file = self.config_dir / "tracking.json"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.data = self._load_tracking_data()
+        # Records may come from several download threads at once
+        self._lock = threading.Lock()
+        # Changes are written once by flush() rather than after every record
+        self._dirty = False
 
     def _load_tracking_data(self) -> Dict:
         """Load tracking data from file."""
@@ -26,79 +59,99 @@ class SubtitleTracker:
             return {}
 
         try:
-            with open(self.tracking_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.tracking_file, "rb") as f:
+                data = json_loads(f.read())
                 logger.debug(f"Loaded tracking data: {len(data)} entries")
-                return data
+                return {
+                    key: self._migrate_entry(entries) for key, entries in data.items()
+                }
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Error loading tracking data: {e}")
             return {}
 
+    @staticmethod
+    def _migrate_entry(entries: Union[List[Dict], Dict]) -> Dict[str, Dict]:
+        """
+        Convert a movie's language entries to the current format.
+
+        Older tracking files kept a list of entries per movie, each naming
+        its language; they are now keyed by language instead.
+
+        Args:
+            entries: A movie's language entries, in either format
+
+        Returns:
+            Language entries keyed by language
+        """
+        if not isinstance(entries, list):
+            return entries
+
+        migrated = {}
+        for entry in entries:
+            language = entry.pop("language", None)
+            if language is not None:
+                migrated.setdefault(language, entry)
+        return migrated
+
     def _save_tracking_data(self):
-        """Save tracking data to file."""
+        """
+        Save tracking data to file.
+
+        The data is written to a temporary file that then replaces the
+        tracking file, so an interrupted save never leaves it truncated.
+        """
+        temp_file = self.tracking_file.with_name(self.tracking_file.name + ".tmp")
         try:
-            with open(self.tracking_file, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-                logger.debug(f"Saved tracking data: {len(self.data)} entries")
+            with open(temp_file, "wb") as f:
+                f.write(json_dumps_indented(self.data))
+            os.replace(temp_file, self.tracking_file)
+            logger.debug(f"Saved tracking data: {len(self.data)} entries")
         except IOError as e:
             logger.error(f"Error saving tracking data: {e}")
 
+    def flush(self):
+        """Write the tracking data to file if it changed since the last save."""
+        with self._lock:
+            if self._dirty:
+                self._save_tracking_data()
+                self._dirty = False
+
     def _get_movie_key(self, title: str) -> str:
         """Generate unique key for movie."""
-        import re
-
-        return re.sub(r"\s+", " ", title.lower().strip())
+        return _WHITESPACE_RE.sub(" ", title.lower().strip())
 
     def record_no_subtitles_found(self, title: str, year: int, language: str):
         """Record when no subtitles are found for a movie/language."""
         key = self._get_movie_key(title)
         timestamp = datetime.now().isoformat()
 
-        if key not in self.data:
-            self.data[key] = []
-
-        # Find existing language entry or create new one
-        lang_entry = None
-        for entry in self.data[key]:
-            if entry.get("language") == language:
-                lang_entry = entry
-                break
-
-        if not lang_entry:
-            lang_entry = {"language": language}
-            self.data[key].append(lang_entry)
+        with self._lock:
+            # Find existing language entry or create new one
+            lang_entry = self.data.setdefault(key, {}).setdefault(language, {})
 
-        lang_entry["last_searched"] = timestamp
+            lang_entry["last_searched"] = timestamp
 
-        logger.info(f"Recorded no subtitles found: {title} - {language} at {timestamp}")
-        self._save_tracking_data()
+            logger.info(
+                f"Recorded no subtitles found: {title} - {language} at {timestamp}"
+            )
+            self._dirty = True
 
     def record_download_failure(self, title: str, year: int, language: str, error: str):
         """Record failed subtitle download."""
         key = self._get_movie_key(title)
         timestamp = datetime.now().isoformat()
 
-        if key not in self.data:
-            self.data[key] = []
-
-        # Find existing language entry or create new one
-        lang_entry = None
-        for entry in self.data[key]:
-            if entry.get("language") == language:
-                lang_entry = entry
-                break
+        with self._lock:
+            # Find existing language entry or create new one
+            lang_entry = self.data.setdefault(key, {}).setdefault(language, {})
 
-        if not lang_entry:
-            lang_entry = {"language": language}
-            self.data[key].append(lang_entry)
+            lang_entry["last_download_failure"] = timestamp
+            lang_entry["last_error"] = error
 
-        lang_entry["last_download_failure"] = timestamp
-        lang_entry["last_error"] = error
-
-        logger.info(
-            f"Recorded download failure: {title} - {language}: {error} at {timestamp}"
-        )
-        self._save_tracking_data()
+            logger.info(
+                f"Recorded download failure: {title} - {language}: {error} at {timestamp}"
+            )
+            self._dirty = True
 
     def remove_successful_download(self, title: str, year: int, language: str) -> bool:
         """
@@ -113,26 +166,25 @@ class SubtitleTracker:
             True if entry was removed, False if not found
         """
         key = self._get_movie_key(title)
-        movie_data = self.data.get(key, [])
 
-        # Find and remove the language entry
-        for i, entry in enumerate(movie_data):
-            if entry.get("language") == language:
-                movie_data.pop(i)
-                logger.info(
-                    f"Removed tracking entry for successful download: "
-                    f"{title} - {language}"
-                )
+        with self._lock:
+            movie_data = self.data.get(key, {})
 
-                # If no more language entries for this movie, remove the movie key
-                if not movie_data:
-                    del self.data[key]
-                    logger.info(f"Removed movie from tracking: {title}")
+            # Remove the language entry
+            if movie_data.pop(language, None) is None:
+                return False
 
-                self._save_tracking_data()
-                return True
+            logger.info(
+                f"Removed tracking entry for successful download: {title} - {language}"
+            )
 
-        return False
+            # If no more language entries for this movie, remove the movie key
+            if not movie_data:
+                del self.data[key]
+                logger.info(f"Removed movie from tracking: {title}")
+
+            self._dirty = True
+        return True
 
     def cleanup_obsolete_movies(self, current_wanted_movies: list) -> int:
         """
@@ -154,21 +206,24 @@ class SubtitleTracker:
             if title:
                 current_movie_keys.add(self._get_movie_key(title))
 
-        # Find obsolete entries
-        obsolete_keys = []
-        for movie_key in self.data.keys():
-            if movie_key not in current_movie_keys:
-                obsolete_keys.append(movie_key)
+        with self._lock:
+            # Find obsolete entries
+            obsolete_keys = []
+            for movie_key in self.data.keys():
+                if movie_key not in current_movie_keys:
+                    obsolete_keys.append(movie_key)
+
+            # Remove obsolete entries
+            removed_count = 0
+            for key in obsolete_keys:
+                del self.data[key]
+                removed_count += 1
+                logger.info(f"Removed obsolete tracking entry: {key}")
 
-        # Remove obsolete entries
-        removed_count = 0
-        for key in obsolete_keys:
-            del self.data[key]
-            removed_count += 1
-            logger.info(f"Removed obsolete tracking entry: {key}")
+            if removed_count > 0:
+                self._dirty = True
 
         if removed_count > 0:
-            self._save_tracking_data()
             logger.info(
                 f"Cleaned up {removed_count} obsolete movie(s) from tracking database"
             )
@@ -180,13 +235,7 @@ class SubtitleTracker:
     ) -> Optional[str]:
         """Get the last timestamp when subtitles were searched for."""
         key = self._get_movie_key(title)
-        movie_data = self.data.get(key, [])
-
-        for entry in movie_data:
-            if entry.get("language") == language:
-                return entry.get("last_searched")
-
-        return None
+        return self.data.get(key, {}).get(language, {}).get("last_searched")
 
     def should_skip_search(
         self, title: str, year: int, language: str, hours_threshold: int
@@ -206,17 +255,65 @@ class SubtitleTracker:
             True if search should be skipped
         """
         last_searched = self.get_last_searched_timestamp(title, year, language)
+        return self._searched_recently(
+            title, year, language, last_searched, hours_threshold
+        )
+
+    def bulk_filter(
+        self, title: str, year: int, languages: List[str], hours_threshold: int
+    ) -> Tuple[List[str], int]:
+        """
+        Split languages into those to search and those searched too recently.
+
+        Equivalent to calling should_skip_search for each language, but looks
+        up the movie's tracking entries only once.
+
+        Args:
+            title: Movie title
+            year: Movie year
+            languages: Subtitle languages to check
+            hours_threshold: Skip if no subtitles found within this many hours
+                (from Bazarr interval)
 
+        Returns:
+            Tuple of (languages to search, number of skipped languages)
+        """
+        movie_data = self.data.get(self._get_movie_key(title), {})
+
+        to_try = []
+        skipped_count = 0
+        for language in languages:
+            if self._searched_recently(
+                title,
+                year,
+                language,
+                movie_data.get(language, {}).get("last_searched"),
+                hours_threshold,
+            ):
+                skipped_count += 1
+            else:
+                to_try.append(language)
+
+        return to_try, skipped_count
+
+    def _searched_recently(
+        self,
+        title: str,
+        year: int,
+        language: str,
+        last_searched: Optional[str],
+        hours_threshold: int,
+    ) -> bool:
+        """Check whether a last-searched timestamp falls within the threshold."""
         # If we don't have a search record, don't skip
         if not last_searched:
             return False
 
         try:
-            last_search_time = datetime.fromisoformat(last_searched)
-            time_diff = datetime.now() - last_search_time
+            time_diff = datetime.now() - _parse_timestamp(last_searched)
 
             # Skip if search was within the threshold
-            if time_diff.total_seconds() < (hours_threshold * 3600):
+            if time_diff < timedelta(hours=hours_threshold):
                 logger.info(
                     f"Skipping search for {title} ({year}) - {language} "
                     f"(last searched {time_diff} ago)"
@@ -236,7 +333,7 @@ class SubtitleTracker:
         failure_count = 0
 
         for movie_entries in self.data.values():
-            for entry in movie_entries:
+            for entry in movie_entries.values():
                 if "last_searched" in entry and "subtitles_found" not in entry:
                     no_subs_count += 1
                 if "last_download_success" in entry:
@@ -42,10 +42,16 @@ from utils import format_movie_info, format_episode_info
 logger = None
 
 
+def print_status(success: bool, success_msg: str, failure_msg: str):
+    """Print a status line for a Bazarr operation."""
+    print(f"    ✓ {success_msg}" if success else f"    ✗ {failure_msg}")
+
+
 def main():
     """Main function to list wanted movies and download subtitles."""
     global logger
 
+    downloader = None
     try:
         # Load configuration first
         config = load_config()
@@ -186,6 +192,11 @@ def main():
                     f"Removed {removed_count} obsolete movie(s) from tracking database"
                 )
 
+            # Resolve missing movie years and run the SubSource movie searches
+            # in concurrent passes up front
+            downloader.preload_movie_years(movies)
+            downloader.preload_movie_searches(movies)
+
             print("\nStarting movie subtitle downloads...")
 
             # Process each movie
@@ -225,6 +236,7 @@ def main():
                             radarr_id, subtitle_file, lang_code, forced, hi
                         ):
                             successful_uploads += 1
+                            print("    ✓ Uploaded subtitle to Bazarr")
 
                             # Get movie details to find subtitle path for post-processing
                             movie_data = bazarr.get_movie_subtitles(radarr_id)
@@ -243,13 +255,20 @@ def main():
                                                 print(
                                                     "    Applying Sub-Zero modifications..."
                                                 )
-                                                bazarr.trigger_subzero_mods(
-                                                    subtitle_path=subtitle_path,
-                                                    media_type="movie",
-                                                    media_id=radarr_id,
-                                                    language=lang_code,
-                                                    forced=forced,
-                                                    hi=hi,
+                                                subzero_ok = (
+                                                    bazarr.trigger_subzero_mods(
+                                                        subtitle_path=subtitle_path,
+                                                        media_type="movie",
+                                                        media_id=radarr_id,
+                                                        language=lang_code,
+                                                        forced=forced,
+                                                        hi=hi,
+                                                    )
+                                                )
+                                                print_status(
+                                                    subzero_ok,
+                                                    "Applied Sub-Zero modifications",
+                                                    "Failed to apply Sub-Zero modifications",
                                                 )
 
                                             # Perform subtitle synchronization if enabled
@@ -257,7 +276,7 @@ def main():
                                                 print(
                                                     "    Performing subtitle synchronization..."
                                                 )
-                                                bazarr.sync_subtitle(
+                                                sync_ok = bazarr.sync_subtitle(
                                                     subtitle_path=subtitle_path,
                                                     media_type="movie",
                                                     media_id=radarr_id,
@@ -275,6 +294,11 @@ def main():
                                                     ],
                                                     use_gss=sync_settings["use_gss"],
                                                 )
+                                                print_status(
+                                                    sync_ok,
+                                                    "Synchronized subtitle with Bazarr",
+                                                    "Failed to synchronize subtitle",
+                                                )
                                         break
 
                             # Clean up tracking database for successful download
@@ -291,6 +315,8 @@ def main():
                                 print(f"    Cleaned up local file: {subtitle_file}")
                             except OSError:
                                 pass
+                        else:
+                            print("    ✗ Failed to upload subtitle to Bazarr")
 
                 # Small delay between movies
                 if i < len(movies):
@@ -338,6 +364,9 @@ def main():
                     f"from tracking database"
                 )
 
+            # Run the SubSource series searches concurrently up front
+            downloader.preload_episode_searches(episodes)
+
             print("\nStarting episode subtitle downloads...")
 
             for i, episode in enumerate(episodes, 1):
@@ -393,13 +422,20 @@ def main():
                                                 print(
                                                     "    Applying Sub-Zero modifications..."
                                                 )
-                                                bazarr.trigger_episode_subzero_mods(
-                                                    subtitle_path=subtitle_path,
-                                                    series_id=series_id,
-                                                    episode_id=episode_id,
-                                                    language=lang_code,
-                                                    forced=False,
-                                                    hi=False,
+                                                subzero_ok = (
+                                                    bazarr.trigger_episode_subzero_mods(
+                                                        subtitle_path=subtitle_path,
+                                                        series_id=series_id,
+                                                        episode_id=episode_id,
+                                                        language=lang_code,
+                                                        forced=False,
+                                                        hi=False,
+                                                    )
+                                                )
+                                                print_status(
+                                                    subzero_ok,
+                                                    "Applied Sub-Zero modifications to episode",
+                                                    "Failed to apply Sub-Zero modifications to episode",
                                                 )
 
                                             # Perform episode subtitle synchronization if enabled
@@ -407,7 +443,7 @@ def main():
                                                 print(
                                                     "    Performing episode subtitle synchronization..."
                                                 )
-                                                bazarr.sync_episode_subtitle(
+                                                sync_ok = bazarr.sync_episode_subtitle(
                                                     subtitle_path=subtitle_path,
                                                     series_id=series_id,
                                                     episode_id=episode_id,
@@ -423,6 +459,11 @@ def main():
                                                     ],
                                                     use_gss=sync_settings["use_gss"],
                                                 )
+                                                print_status(
+                                                    sync_ok,
+                                                    "Synchronized episode subtitle with Bazarr",
+                                                    "Failed to synchronize episode subtitle",
+                                                )
                                         break
 
                             # Clean up tracking database for successful download
@@ -453,6 +494,10 @@ def main():
                 if i < len(episodes):
                     time.sleep(1)
 
+        # Keep this run's SubSource title searches for the next run
+        if downloader:
+            downloader.save_search_cache()
+
         # Summary
         print("\n" + "=" * 50)
         print("DOWNLOAD SUMMARY")
@@ -506,6 +551,10 @@ def main():
 
             print(f"Stack trace:\n{traceback.format_exc()}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Save search results recorded so far, even when the run is cut short
+        if downloader:
+            downloader.tracker.flush()
 
 
 if __name__ == "__main__":
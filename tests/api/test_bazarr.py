@@ -3,10 +3,15 @@ Tests for api.bazarr module.
 """
 
 import json
+import os
+import socket
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import requests
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 
 from api.bazarr import Bazarr
 
@@ -32,20 +37,109 @@ class TestBazarr(unittest.TestCase):
         self.assertEqual(self.client.username, self.username)
         self.assertEqual(self.client.password, self.password)
 
-        # Check session headers
-        self.assertIn("X-API-KEY", self.client.session.headers)
-        self.assertEqual(self.client.session.headers["X-API-KEY"], self.api_key)
+        # Check auth setup, which carries the API key
+        self.assertIsInstance(self.client.session.auth, requests.auth.HTTPBasicAuth)
+        self.assertEqual(self.client.session.auth.username, self.username)
 
-        # Check auth setup
-        self.assertIsInstance(self.client.auth, requests.auth.HTTPBasicAuth)
+        request = self.client.session.prepare_request(
+            requests.Request("GET", self.bazarr_url + "/api/movies")
+        )
+        self.assertEqual(request.headers["X-API-KEY"], self.api_key)
+        self.assertTrue(request.headers["Authorization"].startswith("Basic "))
+
+    def test_init_mounts_pooled_adapter(self):
+        """Test session mounts a sized HTTPAdapter with retries."""
+        for prefix in ("http://", "https://"):
+            adapter = self.client.session.get_adapter(prefix + "test.bazarr.com")
+            self.assertIsInstance(adapter, requests.adapters.HTTPAdapter)
+            self.assertEqual(adapter._pool_maxsize, 64)
+            self.assertEqual(adapter.max_retries.total, 2)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+            self.assertEqual(adapter.max_retries.allowed_methods, {"GET"})
+
+    def test_init_adapter_socket_options(self):
+        """Test pooled connections enable TCP_NODELAY and keepalive."""
+        adapter = self.client.session.get_adapter(self.bazarr_url)
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), socket_options)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+
+    def test_init_shares_adapter_between_clients(self):
+        """Test all clients reuse one connection pool."""
+        other = Bazarr("https://other.bazarr.com", "key", "user", "pass")
+
+        self.assertIs(
+            other.session.get_adapter("https://other.bazarr.com"),
+            self.client.session.get_adapter(self.bazarr_url),
+        )
+        self.assertIsNot(other.session, self.client.session)
+        self.assertEqual(other.session.auth.api_key, "key")
+
+    def test_shared_session_keeps_credentials_to_bazarr(self):
+        """Test a shared session sends Bazarr credentials to Bazarr only."""
+        session = requests.Session()
+        session.auth = ("other", "secret")
+        Bazarr(self.bazarr_url, self.api_key, "user", "pass", session=session)
+
+        for url in ("https://api.subsource.net/v1", "https://test.bazarr.com.evil"):
+            with self.subTest(url=url):
+                request = session.prepare_request(requests.Request("GET", url))
+
+                self.assertNotIn("X-API-KEY", request.headers)
+                self.assertEqual(
+                    request.headers["Authorization"],
+                    requests.auth._basic_auth_str("other", "secret"),
+                )
+
+        request = session.prepare_request(
+            requests.Request("GET", "https://Test.Bazarr.com/api/series")
+        )
+        self.assertEqual(request.headers["X-API-KEY"], self.api_key)
+        self.assertEqual(
+            request.headers["Authorization"],
+            requests.auth._basic_auth_str("user", "pass"),
+        )
+
+    def test_init_with_shared_session(self):
+        """Test clients can share a caller-provided session."""
+        session = requests.Session()
+        client = Bazarr(self.bazarr_url, self.api_key, "user", "pass", session=session)
+        other = Bazarr(self.bazarr_url, self.api_key, "user", "pass", session=session)
+
+        self.assertIs(client.session, session)
+        self.assertIs(other.session, session)
+        self.assertNotIn("X-API-KEY", session.headers)
+        self.assertIs(
+            session.get_adapter(self.bazarr_url + "/api/series"),
+            Bazarr._get_adapter(),
+        )
+
+    def test_closing_one_session_keeps_shared_pool(self):
+        """Test closing a client's session leaves other clients' pool open."""
+        other = Bazarr(self.bazarr_url, self.api_key, "user", "pass")
+        adapter = other.session.get_adapter(self.bazarr_url)
+        adapter.poolmanager.connection_from_url(self.bazarr_url)
+
+        self.client.session.close()
+
+        self.assertEqual(len(adapter.poolmanager.pools), 1)
+
+    def test_get_adapter_created_once_across_threads(self):
+        """Test concurrent first use creates a single shared adapter."""
+        with patch.object(Bazarr, "_shared_adapter", None):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                adapters = list(executor.map(lambda _: Bazarr._get_adapter(), range(8)))
+
+        self.assertEqual(len({id(adapter) for adapter in adapters}), 1)
 
     @patch("api.bazarr.requests.Session.get")
     def test_get_wanted_movies_success(self, mock_get):
         """Test successful get_wanted_movies request."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [{"title": "Test Movie", "missing_subtitles": []}]
-        }
+        mock_response.content = json.dumps(
+            {"data": [{"title": "Test Movie", "missing_subtitles": []}]}
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -60,13 +154,58 @@ class TestBazarr(unittest.TestCase):
         self.assertIn(
             "/api/movies/wanted", call_args[0][0]
         )  # First positional arg is URL
-        self.assertEqual(call_args[1]["params"], {"start": 0, "length": -1})
+        self.assertEqual(call_args[1]["params"], {"start": 0, "length": 200})
+        # Auth is applied at the session level, not per call
+        self.assertNotIn("auth", call_args[1])
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_movies_pages_through_results(self, mock_get):
+        """Test wanted movies are requested in fixed-size pages."""
+        pages = [
+            [{"radarrId": i} for i in range(200)],
+            [{"radarrId": i} for i in range(200, 230)],
+        ]
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.content = json.dumps({"data": page}).encode()
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        result = self.client.get_wanted_movies()
+
+        self.assertEqual(len(result["data"]), 230)
+        self.assertEqual(result["total"], 230)
+        self.assertEqual(
+            [call[1]["params"] for call in mock_get.call_args_list],
+            [{"start": 0, "length": 200}, {"start": 200, "length": 200}],
+        )
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_movies_clamps_large_length(self, mock_get):
+        """Test lengths above the page cap are fetched in pages."""
+        responses = []
+        for start in (0, 200, 400):
+            response = Mock()
+            response.content = json.dumps(
+                {"data": [{"radarrId": i} for i in range(start, start + 200)]}
+            ).encode()
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        result = self.client.get_wanted_movies(length=550)
+
+        self.assertEqual(len(result["data"]), 550)
+        self.assertEqual(
+            [call[1]["params"]["length"] for call in mock_get.call_args_list],
+            [200, 200, 200],
+        )
 
     @patch("api.bazarr.requests.Session.get")
     def test_get_wanted_movies_with_parameters(self, mock_get):
         """Test get_wanted_movies with custom parameters."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -89,27 +228,31 @@ class TestBazarr(unittest.TestCase):
         """Test get_wanted_movies handles JSON decode errors."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"Invalid JSON"
         mock_get.return_value = mock_response
 
         result = self.client.get_wanted_movies()
 
         self.assertIsNone(result)
 
-    @patch("builtins.open", create=True)
-    @patch("os.path.basename")
+    def _write_subtitle_file(self):
+        """Write a temporary subtitle file that is removed after the test."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".srt", delete=False) as f:
+            f.write("1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n")
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+
     @patch("api.bazarr.requests.Session.post")
-    def test_upload_subtitle_success(self, mock_post, mock_basename, mock_open):
+    def test_upload_subtitle_success(self, mock_post):
         """Test successful subtitle upload."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
-        mock_basename.return_value = "test.srt"
-        mock_open.return_value.__enter__.return_value = Mock()
+        subtitle_file = self._write_subtitle_file()
 
         result = self.client.upload_movie_subtitle(
             radarr_id=123,
-            subtitle_file="/path/to/test.srt",
+            subtitle_file=subtitle_file,
             language="en",
             forced=True,
             hi=False,
@@ -118,29 +261,28 @@ class TestBazarr(unittest.TestCase):
         self.assertTrue(result)
         mock_post.assert_called_once()
 
-        # Check the request data
+        # Check the streamed multipart body and its content type
         call_args = mock_post.call_args
+        encoder = call_args[1]["data"]
+        self.assertIsInstance(encoder, MultipartEncoder)
+        self.assertEqual(call_args[1]["headers"]["Content-Type"], encoder.content_type)
         expected_data = {
-            "radarrid": 123,
+            "radarrid": "123",
             "language": "en",
             "forced": "true",
             "hi": "false",
         }
-        self.assertEqual(call_args[1]["data"], expected_data)
+        for key, value in expected_data.items():
+            self.assertEqual(encoder.fields[key], value)
+        self.assertEqual(encoder.fields["file"][0], os.path.basename(subtitle_file))
 
-    @patch("builtins.open", create=True)
-    @patch("os.path.basename")
     @patch("api.bazarr.requests.Session.post")
-    def test_upload_subtitle_request_exception(
-        self, mock_post, mock_basename, mock_open
-    ):
+    def test_upload_subtitle_request_exception(self, mock_post):
         """Test subtitle upload handles request exceptions."""
         mock_post.side_effect = requests.exceptions.RequestException("Network error")
-        mock_basename.return_value = "test.srt"
-        mock_open.return_value.__enter__.return_value = Mock()
 
         result = self.client.upload_movie_subtitle(
-            radarr_id=123, subtitle_file="/path/to/test.srt", language="en"
+            radarr_id=123, subtitle_file=self._write_subtitle_file(), language="en"
         )
 
         self.assertFalse(result)
@@ -158,7 +300,7 @@ class TestBazarr(unittest.TestCase):
     def test_get_system_tasks_success(self, mock_get):
         """Test successful get_system_tasks request."""
         mock_response = Mock()
-        mock_response.json.return_value = {"tasks": []}
+        mock_response.content = json.dumps({"tasks": []}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -207,6 +349,53 @@ class TestBazarr(unittest.TestCase):
 
         self.assertEqual(interval, 6)
 
+    @patch.object(Bazarr, "get_system_tasks")
+    def test_get_missing_subtitles_search_interval_by_job_id(self, mock_get_tasks):
+        """Test search interval matches on job ID and skips unrelated tasks."""
+        mock_get_tasks.return_value = [
+            "not a task",
+            {"name": "Update Series", "job_id": "update_series", "interval": "1h"},
+            {"name": None, "job_id": "WANTED_SEARCH_MOVIE", "interval": "3h"},
+        ]
+
+        interval = self.client.get_missing_subtitles_search_interval()
+
+        self.assertEqual(interval, 3)
+
+    @patch.object(Bazarr, "get_system_tasks")
+    def test_get_missing_subtitles_search_interval_crossed_fields(self, mock_get_tasks):
+        """Test a job ID in the task name, or the label in the job ID, matches."""
+        for task in [
+            {"name": "wanted_search_movie", "job_id": "", "interval": "4h"},
+            {
+                "name": "",
+                "job_id": "search for missing movies subtitles",
+                "interval": "4h",
+            },
+        ]:
+            with self.subTest(task=task):
+                self.client.invalidate_interval_cache()
+                mock_get_tasks.return_value = [task]
+
+                interval = self.client.get_missing_subtitles_search_interval()
+
+                self.assertEqual(interval, 4)
+
+    @patch.object(Bazarr, "get_system_tasks")
+    def test_get_missing_subtitles_search_interval_cached(self, mock_get_tasks):
+        """Test the search interval is cached until invalidated."""
+        mock_get_tasks.return_value = [
+            {"name": "Search for Missing Movies Subtitles", "interval": "6h"}
+        ]
+
+        self.assertEqual(self.client.get_missing_subtitles_search_interval(), 6)
+        self.assertEqual(self.client.get_missing_subtitles_search_interval(), 6)
+        mock_get_tasks.assert_called_once()
+
+        self.client.invalidate_interval_cache()
+        self.client.get_missing_subtitles_search_interval()
+        self.assertEqual(mock_get_tasks.call_count, 2)
+
     def test_parse_interval_to_minutes_hours_format(self):
         """Test parsing HH:MM:SS format."""
         # Test hours:minutes format
@@ -249,10 +438,28 @@ class TestBazarr(unittest.TestCase):
         minutes = self.client._parse_interval_to_minutes("every monday")
         self.assertEqual(minutes, 168 * 60)
 
+    def test_parse_interval_to_minutes_full_formats(self):
+        """Test parsing HH:MM:SS and scheduled 'every' formats."""
+        self.assertEqual(self.client._parse_interval_to_minutes("24:00:00"), 24 * 60)
+        self.assertEqual(self.client._parse_interval_to_minutes(" 06:15:00 "), 375)
+        self.assertEqual(self.client._parse_interval_to_minutes("3:"), 180)
+        self.assertEqual(
+            self.client._parse_interval_to_minutes("every Sunday at 3:00"), 168 * 60
+        )
+        self.assertEqual(
+            self.client._parse_interval_to_minutes("every day at 5:00"), 24 * 60
+        )
+        self.assertEqual(self.client._parse_interval_to_minutes("every 1 hour"), 60)
+        self.assertEqual(
+            self.client._parse_interval_to_minutes("every 2 days"), 2 * 24 * 60
+        )
+
     def test_parse_interval_to_minutes_invalid_format(self):
         """Test parsing invalid format raises ValueError."""
         with self.assertRaises(ValueError):
             self.client._parse_interval_to_minutes("invalid format")
+        with self.assertRaises(ValueError):
+            self.client._parse_interval_to_minutes("12x")
 
     @patch("api.bazarr.requests.Session.patch")
     def test_sync_subtitle_success(self, mock_patch):
@@ -333,22 +540,24 @@ class TestBazarr(unittest.TestCase):
     def test_get_movie_subtitles_success(self, mock_get):
         """Test successful get_movie_subtitles request."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "radarrid": 123,
-                    "title": "Test Movie",
-                    "subtitles": [
-                        {
-                            "code2": "en",
-                            "path": "/path/to/subtitle.srt",
-                            "forced": False,
-                            "hi": False,
-                        }
-                    ],
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "radarrid": 123,
+                        "title": "Test Movie",
+                        "subtitles": [
+                            {
+                                "code2": "en",
+                                "path": "/path/to/subtitle.srt",
+                                "forced": False,
+                                "hi": False,
+                            }
+                        ],
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -374,53 +583,219 @@ class TestBazarr(unittest.TestCase):
     def test_get_wanted_episodes_success(self, mock_get):
         """Test successful retrieval of wanted episodes."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "sonarrEpisodeId": 123,
-                    "sonarrSeriesId": 456,
-                    "title": "Pilot",
-                    "season": 1,
-                    "episode": 1,
-                    "missing_subtitles": [{"name": "English", "code2": "en"}],
-                },
-                {
-                    "sonarrEpisodeId": 124,
-                    "sonarrSeriesId": 456,
-                    "title": "Cat's in the Bag",
-                    "season": 1,
-                    "episode": 2,
-                    "missing_subtitles": [{"name": "Spanish", "code2": "es"}],
-                },
-            ]
-        }
+        mock_response.raw.read.return_value = json.dumps(
+            {
+                "data": [
+                    {
+                        "sonarrEpisodeId": 123,
+                        "sonarrSeriesId": 456,
+                        "title": "Pilot",
+                        "season": 1,
+                        "episode": 1,
+                        "missing_subtitles": [{"name": "English", "code2": "en"}],
+                    },
+                    {
+                        "sonarrEpisodeId": 124,
+                        "sonarrSeriesId": 456,
+                        "title": "Cat's in the Bag",
+                        "season": 1,
+                        "episode": 2,
+                        "missing_subtitles": [{"name": "Spanish", "code2": "es"}],
+                    },
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         # Mock series enrichment
-        with patch.object(self.client, "_enrich_episode_data", side_effect=lambda x: x):
+        with (
+            patch.object(self.client, "get_series_info_bulk") as mock_bulk,
+            patch.object(self.client, "_enrich_episode_data", side_effect=lambda x: x),
+        ):
             episodes = self.client.get_wanted_episodes()
 
+        # Both episodes belong to one series, fetched in a single batch
+        mock_bulk.assert_called_once_with({456})
+
         self.assertEqual(len(episodes), 2)
         self.assertEqual(episodes[0]["title"], "Pilot")
         self.assertEqual(episodes[0]["season"], 1)
         self.assertEqual(episodes[0]["episode"], 1)
         mock_get.assert_called_once()
 
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_episodes_preserves_order_and_drops_empty(self, mock_get):
+        """Test concurrent enrichment keeps order and filters empty results."""
+        mock_response = Mock()
+        mock_response.raw.read.return_value = json.dumps(
+            {"data": [{"sonarrEpisodeId": i} for i in range(40)]}
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        def enrich(episode):
+            return None if episode["sonarrEpisodeId"] % 10 == 0 else episode
+
+        with patch.object(self.client, "_enrich_episode_data", side_effect=enrich):
+            episodes = self.client.get_wanted_episodes()
+
+        expected_ids = [i for i in range(40) if i % 10]
+        self.assertEqual([e["sonarrEpisodeId"] for e in episodes], expected_ids)
+
+    @patch("api.bazarr.ThreadPoolExecutor")
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_episodes_cached_series_skip_thread_pool(
+        self, mock_get, mock_executor
+    ):
+        """Test enrichment runs inline when every series was batch-fetched."""
+        wanted_response = Mock()
+        wanted_response.raw.read.return_value = json.dumps(
+            {"data": [{"episode_number": "1x01", "sonarrSeriesId": 7}]}
+        ).encode()
+        series_response = Mock()
+        series_response.raw.read.return_value = json.dumps(
+            {"data": [{"sonarrSeriesId": 7, "year": 2019}]}
+        ).encode()
+        mock_get.side_effect = [wanted_response, series_response]
+
+        episodes = self.client.get_wanted_episodes()
+
+        self.assertEqual(episodes[0]["year"], 2019)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_executor.assert_not_called()
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_episodes_pages_through_results(self, mock_get):
+        """Test wanted episodes are requested in fixed-size pages."""
+        pages = [
+            [{"sonarrEpisodeId": i} for i in range(200)],
+            [{"sonarrEpisodeId": i} for i in range(200, 250)],
+        ]
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.raw.read.return_value = json.dumps({"data": page}).encode()
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        with (
+            patch.object(self.client, "get_series_info_bulk"),
+            patch.object(self.client, "_enrich_episode_data", side_effect=lambda x: x),
+        ):
+            episodes = self.client.get_wanted_episodes()
+
+        self.assertEqual(len(episodes), 250)
+        self.assertEqual(
+            [call[1]["params"] for call in mock_get.call_args_list],
+            [{"start": 0, "length": 200}, {"start": 200, "length": 200}],
+        )
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_episodes_explicit_length(self, mock_get):
+        """Test an explicit length fetches a single page."""
+        mock_response = Mock()
+        mock_response.raw.read.return_value = json.dumps({"data": []}).encode()
+        mock_get.return_value = mock_response
+
+        self.assertEqual(self.client.get_wanted_episodes(start=10, length=5), [])
+        mock_get.assert_called_once()
+        self.assertEqual(mock_get.call_args[1]["params"], {"start": 10, "length": 5})
+        # Wanted lists can be large, so the body is streamed and read raw
+        self.assertTrue(mock_get.call_args[1]["stream"])
+        self.assertTrue(mock_response.raw.decode_content)
+        mock_response.close.assert_called_once()
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_episodes_invalid_json(self, mock_get):
+        """Test get_wanted_episodes handles JSON decode errors."""
+        mock_response = Mock()
+        mock_response.raw.read.return_value = b"<html>Bad gateway</html>"
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        self.assertEqual(self.client.get_wanted_episodes(), [])
+
+    @patch.object(Bazarr, "get_series_info")
+    def test_enrich_episode_data(self, mock_series_info):
+        """Test episode enrichment splits the episode number and adds series info."""
+        mock_series_info.return_value = {"year": 2008, "imdbId": "tt0903747"}
+
+        enriched = self.client._enrich_episode_data(
+            {
+                "seriesTitle": "Breaking Bad ",
+                "episode_number": "1x02",
+                "sonarrSeriesId": 456,
+                "sonarrEpisodeId": 124,
+            }
+        )
+
+        self.assertEqual(enriched["series_title"], "Breaking Bad")
+        self.assertEqual(enriched["season"], "1")
+        self.assertEqual(enriched["episode_number"], "02")
+        self.assertEqual(enriched["year"], 2008)
+        mock_series_info.assert_called_once_with(456)
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_wanted_episodes_batches_series_id_fallback(self, mock_get):
+        """Test episodes keyed by seriesId join the single series batch."""
+        wanted_response = Mock()
+        wanted_response.raw.read.return_value = json.dumps(
+            {
+                "data": [
+                    {"episode_number": "1x01", "sonarrSeriesId": 7},
+                    {"episode_number": "2x01", "seriesId": 8},
+                    {"episode_number": "2x02", "seriesId": 8},
+                ]
+            }
+        ).encode()
+        series_response = Mock()
+        series_response.raw.read.return_value = json.dumps(
+            {
+                "data": [
+                    {"sonarrSeriesId": 7, "year": 2019},
+                    {"sonarrSeriesId": 8, "year": 2021},
+                ]
+            }
+        ).encode()
+        mock_get.side_effect = [wanted_response, series_response]
+
+        episodes = self.client.get_wanted_episodes()
+
+        self.assertEqual([e["year"] for e in episodes], [2019, 2021, 2021])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            sorted(mock_get.call_args[1]["params"]),
+            [("seriesid[]", 7), ("seriesid[]", 8)],
+        )
+
+    @patch.object(Bazarr, "get_series_info")
+    def test_enrich_episode_data_malformed_number(self, mock_series_info):
+        """Test malformed episode numbers are skipped without a series lookup."""
+        for raw_number in ("", None, "12"):
+            enriched = self.client._enrich_episode_data(
+                {"episode_number": raw_number, "sonarrSeriesId": 456}
+            )
+            self.assertIsNone(enriched)
+
+        mock_series_info.assert_not_called()
+
     @patch("api.bazarr.requests.Session.get")
     def test_get_series_info_success(self, mock_get):
         """Test successful series info retrieval."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "sonarrSeriesId": 456,
-                    "title": "Breaking Bad",
-                    "year": 2008,
-                    "imdbId": "tt0903747",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "sonarrSeriesId": 456,
+                        "title": "Breaking Bad",
+                        "year": 2008,
+                        "imdbId": "tt0903747",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -430,6 +805,116 @@ class TestBazarr(unittest.TestCase):
         self.assertEqual(series_info["title"], "Breaking Bad")
         self.assertEqual(series_info["year"], 2008)
 
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_series_info_cached(self, mock_get):
+        """Test series info is fetched once per series ID."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {"data": [{"sonarrSeriesId": 456, "title": "Breaking Bad"}]}
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        first = self.client.get_series_info(456)
+        second = self.client.get_series_info(456)
+
+        self.assertIs(first, second)
+        mock_get.assert_called_once()
+
+        self.client.clear_series_cache()
+        self.client.get_series_info(456)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_series_info_bulk(self, mock_get):
+        """Test batched series lookup populates the series cache."""
+        mock_response = Mock()
+        mock_response.raw.read.return_value = json.dumps(
+            {
+                "data": [
+                    {"sonarrSeriesId": 1, "title": "Show One"},
+                    {"sonarrSeriesId": 2, "title": "Show Two"},
+                ]
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with self.assertLogs("api.bazarr", level="WARNING") as logs:
+            series_map = self.client.get_series_info_bulk([1, 2, 2, 3])
+
+        self.assertEqual(set(series_map), {1, 2})
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("IDs: [3]", logs.output[0])
+        self.assertEqual(
+            mock_get.call_args[1]["params"],
+            [("seriesid[]", 1), ("seriesid[]", 2), ("seriesid[]", 3)],
+        )
+
+        # Cached lookups, including the missing series, don't hit Bazarr
+        self.assertEqual(self.client.get_series_info(2)["title"], "Show Two")
+        self.assertIsNone(self.client.get_series_info(3))
+        mock_get.assert_called_once()
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_series_info_bulk_batches_requests(self, mock_get):
+        """Test batched series lookup splits large ID sets."""
+        mock_response = Mock()
+        mock_response.raw.read.return_value = json.dumps({"data": []}).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        self.client.get_series_info_bulk(range(250))
+
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_series_info_bulk_merges_concurrent_batches(self, mock_get):
+        """Test results from concurrently fetched batches are combined."""
+
+        def respond(url, params, **kwargs):
+            response = Mock()
+            response.raw.read.return_value = json.dumps(
+                {"data": [{"sonarrSeriesId": sid} for _, sid in params]}
+            ).encode()
+            return response
+
+        mock_get.side_effect = respond
+
+        series_map = self.client.get_series_info_bulk(range(250))
+
+        self.assertEqual(set(series_map), set(range(250)))
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("api.bazarr.time.monotonic")
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_series_info_cache_expires(self, mock_get, mock_monotonic):
+        """Test cached series info is refetched after its TTL."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {"data": [{"sonarrSeriesId": 456, "title": "Breaking Bad"}]}
+        ).encode()
+        mock_get.return_value = mock_response
+
+        mock_monotonic.return_value = 1000.0
+        self.client.get_series_info(456)
+        mock_monotonic.return_value = 1299.0
+        self.client.get_series_info(456)
+        self.assertEqual(mock_get.call_count, 1)
+
+        mock_monotonic.return_value = 1300.0
+        self.client.get_series_info(456)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_series_info_errors_not_cached(self, mock_get):
+        """Test failed series lookups are retried on the next call."""
+        mock_get.side_effect = requests.exceptions.RequestException("Network error")
+
+        self.assertIsNone(self.client.get_series_info(456))
+        self.assertIsNone(self.client.get_series_info(456))
+        self.assertEqual(mock_get.call_count, 2)
+
     @patch("api.bazarr.requests.Session.post")
     def test_upload_episode_subtitle_success(self, mock_post):
         """Test successful episode subtitle upload."""
@@ -438,8 +923,6 @@ class TestBazarr(unittest.TestCase):
         mock_post.return_value = mock_response
 
         # Create temporary subtitle file
-        import tempfile
-
         with tempfile.NamedTemporaryFile(mode="w", suffix=".srt", delete=False) as f:
             f.write("1\n00:00:01,000 --> 00:00:02,000\nTest subtitle\n")
             temp_file = f.name
@@ -464,9 +947,11 @@ class TestBazarr(unittest.TestCase):
             self.assertEqual(call_args.kwargs["params"]["episodeid"], 123)
             self.assertEqual(call_args.kwargs["params"]["language"], "en")
 
-        finally:
-            import os
+            # Only the file name is sent, not the local directory layout
+            upload_name = call_args.kwargs["data"].fields["file"][0]
+            self.assertEqual(upload_name, os.path.basename(temp_file))
 
+        finally:
             os.unlink(temp_file)
 
     @patch("api.bazarr.requests.Session.patch")
@@ -502,22 +987,24 @@ class TestBazarr(unittest.TestCase):
     def test_get_episode_subtitles_success(self, mock_get):
         """Test successful get_episode_subtitles request."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "sonarrEpisodeId": 123,
-                    "title": "Test Episode",
-                    "subtitles": [
-                        {
-                            "code2": "en",
-                            "path": "/path/to/episode.srt",
-                            "forced": False,
-                            "hi": False,
-                        }
-                    ],
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "sonarrEpisodeId": 123,
+                        "title": "Test Episode",
+                        "subtitles": [
+                            {
+                                "code2": "en",
+                                "path": "/path/to/episode.srt",
+                                "forced": False,
+                                "hi": False,
+                            }
+                        ],
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -527,19 +1014,25 @@ class TestBazarr(unittest.TestCase):
         self.assertEqual(result["sonarrEpisodeId"], 123)
         self.assertIn("subtitles", result)
         mock_get.assert_called_once()
+        self.assertEqual(
+            mock_get.call_args[1]["params"],
+            [("seriesid[]", 456), ("episodeid[]", 123)],
+        )
 
     @patch("api.bazarr.requests.Session.get")
     def test_get_system_settings_success(self, mock_get):
         """Test successful get_system_settings request."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "subsync": {
-                "max_offset_seconds": 300,
-                "no_fix_framerate": True,
-                "gss": False,
-            },
-            "general": {"use_subsync": True},
-        }
+        mock_response.content = json.dumps(
+            {
+                "subsync": {
+                    "max_offset_seconds": 300,
+                    "no_fix_framerate": True,
+                    "gss": False,
+                },
+                "general": {"use_subsync": True},
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -549,6 +1042,44 @@ class TestBazarr(unittest.TestCase):
         self.assertIn("subsync", result)
         mock_get.assert_called_once()
 
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_system_settings_cached(self, mock_get):
+        """Test system settings are reused by all settings helpers."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "subsync": {"use_subsync": True},
+                "general": {"subzero_mods": ["common"], "episode_search_interval": 6},
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        self.client.get_sync_settings()
+        self.client.get_subzero_settings()
+        interval = self.client.get_episode_search_interval()
+
+        self.assertEqual(interval, 6)
+        mock_get.assert_called_once()
+
+    @patch("api.bazarr.time.monotonic")
+    @patch("api.bazarr.requests.Session.get")
+    def test_get_system_tasks_cache_expires(self, mock_get, mock_monotonic):
+        """Test system tasks are refetched once the cache TTL has passed."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"tasks": []}).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        mock_monotonic.return_value = 1000.0
+        self.client.get_system_tasks()
+        self.client.get_system_tasks()
+        self.assertEqual(mock_get.call_count, 1)
+
+        mock_monotonic.return_value = 2000.0
+        self.client.get_system_tasks()
+        self.assertEqual(mock_get.call_count, 2)
+
     @patch("api.bazarr.requests.Session.get")
     def test_get_system_settings_exception(self, mock_get):
         """Test get_system_settings handles exceptions."""
@@ -2,15 +2,22 @@
 Tests for api.subsource module.
 """
 
+import json
 import os
+import shutil
+import socket
 import tempfile
+import threading
+import time
 import unittest
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import requests
 
-from api.subsource import SubSourceDownloader
+from api.subsource import SubSourceDownloader, _TokenBucket
 
 
 class TestSubSourceDownloader(unittest.TestCase):
@@ -22,8 +29,12 @@ class TestSubSourceDownloader(unittest.TestCase):
         self.api_url = "https://api.test.com"
         self.download_dir = self.temp_dir
         self.mock_bazarr = Mock()
+        self.mock_bazarr.get_missing_subtitles_search_interval.return_value = 6
 
-        with patch("core.tracking.SubtitleTracker"):
+        with (
+            patch("core.tracking.SubtitleTracker"),
+            patch("core.config.Path.home", return_value=Path(self.temp_dir)),
+        ):
             self.downloader = SubSourceDownloader(
                 self.api_url, self.download_dir, self.mock_bazarr
             )
@@ -31,9 +42,7 @@ class TestSubSourceDownloader(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures."""
         # Clean up temp directory
-        for file in os.listdir(self.temp_dir):
-            os.remove(os.path.join(self.temp_dir, file))
-        os.rmdir(self.temp_dir)
+        shutil.rmtree(self.temp_dir)
 
     def test_init(self):
         """Test SubSourceDownloader initialization."""
@@ -48,36 +57,68 @@ class TestSubSourceDownloader(unittest.TestCase):
         expected_headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36 Edg/142.0.0.0",
             "Accept": "application/json, text/plain, */*",
-            "Content-Type": "application/json",
             "Origin": "https://subsource.net",
             "Referer": "https://subsource.net/",
         }
         for key, value in expected_headers.items():
             self.assertEqual(self.downloader.session.headers[key], value)
 
+        # JSON POSTs set their own Content-Type; GETs shouldn't send one
+        self.assertNotIn("Content-Type", self.downloader.session.headers)
+
+    def test_init_shares_tracker(self):
+        """Test a tracker passed in is used instead of loading a new one."""
+        tracker = Mock()
+
+        with (
+            patch("core.config.Path.home", return_value=Path(self.temp_dir)),
+            patch("api.subsource.SubtitleTracker") as mock_tracker_cls,
+        ):
+            downloader = SubSourceDownloader(
+                self.api_url, self.download_dir, self.mock_bazarr, tracker=tracker
+            )
+
+        self.assertIs(downloader.tracker, tracker)
+        mock_tracker_cls.assert_not_called()
+
+    def test_init_mounts_pooled_adapter(self):
+        """Test the session pools connections and retries rate limits."""
+        adapter = self.downloader.session.get_adapter(self.api_url)
+
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+        self.assertIn("POST", adapter.max_retries.allowed_methods)
+        self.assertGreater(adapter.max_retries.backoff_jitter, 0)
+
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+
     @patch("api.subsource.requests.Session.get")
     @patch("api.subsource.requests.Session.post")
     def test_search_subtitles_success(self, mock_post, mock_get):
         """Test successful subtitle search."""
         # Mock first API call (movie search)
         movie_search_response = Mock()
-        movie_search_response.json.return_value = {
-            "results": [
-                {
-                    "title": "Test Movie",
-                    "releaseYear": 2023,
-                    "link": "/subtitles/test-movie-2023",
-                }
-            ]
-        }
+        movie_search_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "title": "Test Movie",
+                        "releaseYear": 2023,
+                        "link": "/subtitles/test-movie-2023",
+                    }
+                ]
+            }
+        ).encode()
         movie_search_response.raise_for_status.return_value = None
         mock_post.return_value = movie_search_response
 
         # Mock second API call (subtitle search)
         subtitle_search_response = Mock()
-        subtitle_search_response.json.return_value = [
-            {"id": "12345", "language": "English"}
-        ]
+        subtitle_search_response.content = json.dumps(
+            [{"id": "12345", "language": "English"}]
+        ).encode()
         subtitle_search_response.raise_for_status.return_value = None
         mock_get.return_value = subtitle_search_response
 
@@ -88,26 +129,157 @@ class TestSubSourceDownloader(unittest.TestCase):
         mock_post.assert_called_once()
         mock_get.assert_called_once()
 
+    @patch("api.subsource.time.sleep")
+    @patch("api.subsource.requests.Session.get")
+    @patch("api.subsource.requests.Session.post")
+    def test_search_subtitles_reuses_movie_search(self, mock_post, mock_get, _):
+        """Test the movie search runs once for several languages."""
+        movie_search_response = Mock()
+        movie_search_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "title": "Test Movie",
+                        "releaseYear": 2023,
+                        "link": "/subtitles/test-movie-2023",
+                    }
+                ]
+            }
+        ).encode()
+        mock_post.return_value = movie_search_response
+        subtitle_search_response = Mock()
+        subtitle_search_response.content = json.dumps([{"id": "12345"}]).encode()
+        mock_get.return_value = subtitle_search_response
+
+        self.downloader.search_subtitles("Test Movie", 2023, "english")
+        self.downloader.search_subtitles("test movie", 2023, "spanish")
+
+        mock_post.assert_called_once()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args[1]["params"]["language"], "spanish")
+
+    @patch("api.subsource.requests.Session.get")
+    @patch("api.subsource.requests.Session.post")
+    def test_search_cache_persists_between_runs(self, mock_post, mock_get):
+        """Test title searches are saved and reused by later downloaders."""
+        search_response = Mock()
+        search_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "title": "Test Movie",
+                        "releaseYear": 2023,
+                        "link": "/subtitles/test-movie-2023",
+                    }
+                ]
+            }
+        ).encode()
+        mock_post.return_value = search_response
+        mock_get.return_value = Mock(content=b"[]")
+
+        self.downloader.search_subtitles("Test Movie", 2023, "english")
+        self.downloader.save_search_cache()
+
+        with patch("core.config.Path.home", return_value=Path(self.temp_dir)):
+            downloader = SubSourceDownloader(
+                self.api_url, self.download_dir, self.mock_bazarr
+            )
+        movie = downloader._find_movie("Test Movie", 2023)
+
+        self.assertEqual(movie["link"], "/subtitles/test-movie-2023")
+        mock_post.assert_called_once()
+
     @patch("api.subsource.requests.Session.get")
-    def test_search_subtitles_no_movie_found(self, mock_get):
+    def test_fetch_subtitles_reuses_listing(self, mock_get):
+        """Test a season listing is fetched once per language."""
+        mock_get.return_value = Mock(content=json.dumps([{"id": 1}]).encode())
+
+        for _ in range(3):
+            self.downloader._fetch_subtitles("/subtitles/show/season-1", "English")
+        self.downloader._fetch_subtitles("/subtitles/show/season-1", "spanish")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("api.subsource.requests.Session.post")
+    def test_search_titles_normalises_query(self, mock_post):
+        """Test queries differing in case or spacing share one search."""
+        mock_post.return_value = Mock(
+            content=json.dumps({"results": [{"title": "Test Show"}]}).encode()
+        )
+
+        self.downloader._search_titles(" Test  Show", include_seasons=True)
+        self.downloader._search_titles("test show ", include_seasons=True)
+
+        mock_post.assert_called_once()
+        self.assertEqual(
+            json.loads(mock_post.call_args[1]["data"])["query"], "Test Show"
+        )
+
+    @patch("api.subsource.requests.Session.post")
+    def test_search_cache_keeps_empty_results_for_the_run(self, mock_post):
+        """Test searches without results are reused but not saved."""
+        mock_post.return_value = Mock(content=json.dumps({"results": []}).encode())
+
+        self.downloader._search_titles("Test Show", include_seasons=True)
+        self.downloader._search_titles("Test Show", include_seasons=True)
+        self.downloader.save_search_cache()
+
+        mock_post.assert_called_once()
+        with patch("core.config.Path.home", return_value=Path(self.temp_dir)):
+            downloader = SubSourceDownloader(
+                self.api_url, self.download_dir, self.mock_bazarr
+            )
+        downloader._search_titles("Test Show", include_seasons=True)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("api.subsource.time.time")
+    @patch("api.subsource.requests.Session.post")
+    def test_search_cache_expires_empty_results(self, mock_post, mock_time):
+        """Test searches without results are repeated after an hour."""
+        mock_post.return_value = Mock(content=json.dumps({"results": []}).encode())
+        mock_time.return_value = 1000.0
+
+        self.downloader._search_titles("Test Show", include_seasons=True)
+        mock_time.return_value += 60 * 60
+        self.downloader._search_titles("Test Show", include_seasons=True)
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("api.subsource.requests.Session.post")
+    def test_search_subtitles_not_found_searches_once(self, mock_post):
+        """Test every language of a title SubSource lacks shares one search."""
+        mock_post.return_value = Mock(content=json.dumps({"results": []}).encode())
+
+        for language in ("english", "spanish", "french"):
+            self.downloader.search_subtitles("Missing Movie", 2023, language)
+
+        mock_post.assert_called_once()
+
+    @patch("api.subsource.time.sleep")
+    @patch("api.subsource.requests.Session.post")
+    def test_search_subtitles_no_movie_found(self, mock_post, _):
         """Test subtitle search when no movie is found."""
         mock_response = Mock()
-        mock_response.json.return_value = {"movies": []}
+        mock_response.content = json.dumps({"results": []}).encode()
         mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_post.return_value = mock_response
 
         result = self.downloader.search_subtitles("Nonexistent Movie", 2023, "english")
 
         self.assertEqual(result, [])
 
-    @patch("api.subsource.requests.Session.get")
-    def test_search_subtitles_request_exception(self, mock_get):
+    @patch("api.subsource.requests.Session.post")
+    def test_search_subtitles_request_exception(self, mock_post):
         """Test subtitle search handles request exceptions."""
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
+        mock_post.side_effect = requests.exceptions.RequestException("Network error")
 
-        result = self.downloader.search_subtitles("Test Movie", 2023, "english")
+        with patch.object(self.downloader, "tracker") as mock_tracker:
+            result = self.downloader.search_subtitles("Test Movie", 2023, "english")
 
         self.assertEqual(result, [])
+        mock_tracker.record_no_subtitles_found.assert_called_once_with(
+            "Test Movie", 2023, "english"
+        )
 
     @patch("api.subsource.requests.Session.get")
     @patch("api.subsource.requests.Session.post")
@@ -115,25 +287,27 @@ class TestSubSourceDownloader(unittest.TestCase):
         """Test subtitle search matches movie by year."""
         # Mock response with multiple movies, different years
         movie_search_response = Mock()
-        movie_search_response.json.return_value = {
-            "results": [
-                {
-                    "title": "Test Movie",
-                    "releaseYear": 2020,
-                    "link": "/subtitles/test-movie-2020",
-                },
-                {
-                    "title": "Test Movie",
-                    "releaseYear": 2023,
-                    "link": "/subtitles/test-movie-2023",
-                },
-            ]
-        }
+        movie_search_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "title": "Test Movie",
+                        "releaseYear": 2020,
+                        "link": "/subtitles/test-movie-2020",
+                    },
+                    {
+                        "title": "Test Movie",
+                        "releaseYear": 2023,
+                        "link": "/subtitles/test-movie-2023",
+                    },
+                ]
+            }
+        ).encode()
         movie_search_response.raise_for_status.return_value = None
         mock_post.return_value = movie_search_response
 
         subtitle_response = Mock()
-        subtitle_response.json.return_value = []
+        subtitle_response.content = json.dumps([]).encode()
         subtitle_response.raise_for_status.return_value = None
         mock_get.return_value = subtitle_response
 
@@ -158,11 +332,207 @@ class TestSubSourceDownloader(unittest.TestCase):
             self.assertEqual(year, 2022)
             mock_lookup.assert_called_once_with("Test Movie")
 
+    def test_get_movie_year_persists_bazarr_lookups(self):
+        """Test years resolved through Bazarr are reused by later downloaders."""
+        with patch.object(
+            self.downloader, "_get_movie_year_from_bazarr", return_value=2022
+        ):
+            self.downloader._get_movie_year("Test Movie", 0)
+
+        with patch("core.config.Path.home", return_value=Path(self.temp_dir)):
+            downloader = SubSourceDownloader(
+                self.api_url, self.download_dir, self.mock_bazarr
+            )
+
+        with patch.object(downloader, "_get_movie_year_from_bazarr") as mock_lookup:
+            self.assertEqual(downloader._get_movie_year("Test Movie", 0), 2022)
+            mock_lookup.assert_not_called()
+
+    def test_get_movie_year_ignores_expired_entries(self):
+        """Test persisted movie years expire after the TTL."""
+        with patch.object(
+            self.downloader, "_get_movie_year_from_bazarr", return_value=2022
+        ):
+            self.downloader._get_movie_year("Test Movie", 0)
+
+        eight_days_later = time.time() + 8 * 24 * 60 * 60
+        with (
+            patch("core.config.Path.home", return_value=Path(self.temp_dir)),
+            patch("api.subsource.time.time", return_value=eight_days_later),
+        ):
+            downloader = SubSourceDownloader(
+                self.api_url, self.download_dir, self.mock_bazarr
+            )
+
+        self.assertNotIn("Test Movie", downloader._movie_years_cache)
+
+    def test_preload_movie_years(self):
+        """Test missing movie years are resolved once, before processing."""
+        movies = [
+            {"title": "Known Year", "year": 2019},
+            {"title": "Needs Year", "year": 0},
+            {"title": "Needs Year", "year": 0},
+            {"title": "Not In Bazarr"},
+        ]
+        years = {"Needs Year": 2021, "Not In Bazarr": None}
+
+        with patch.object(
+            self.downloader, "_get_movie_year_from_bazarr", side_effect=years.get
+        ) as mock_lookup:
+            self.downloader.preload_movie_years(movies)
+            self.assertEqual(self.downloader._get_movie_year("Needs Year", 0), 2021)
+
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_lookup.call_args_list),
+            ["Needs Year", "Not In Bazarr"],
+        )
+
+    def test_preload_movie_years_unresolved_looked_up_once(self):
+        """Test titles without a year in Bazarr aren't looked up again."""
+        movies = [
+            {
+                "title": f"Unknown {i}",
+                "year": 0,
+                "missing_subtitles": [{"name": "English"}],
+            }
+            for i in range(5)
+        ]
+
+        with (
+            patch.object(
+                self.downloader, "_get_movie_year_from_bazarr", return_value=None
+            ) as mock_lookup,
+            patch.object(self.downloader, "_search_titles", return_value=[]),
+            patch.object(self.downloader, "_save_movie_years") as mock_save,
+        ):
+            self.downloader.preload_movie_years(movies)
+            self.downloader.preload_movie_searches(movies)
+
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_lookup.call_args_list),
+            [movie["title"] for movie in movies],
+        )
+        self.assertEqual(self.downloader._get_movie_year("Unknown 0", 0), 2000)
+        mock_save.assert_not_called()
+
+    @patch("api.subsource.requests.Session.post")
+    def test_preload_movie_searches_not_found_searches_once(self, mock_post):
+        """Test a preloaded title SubSource lacks isn't searched per language."""
+        mock_post.return_value = Mock(content=json.dumps({"results": []}).encode())
+        movie = {
+            "title": "Missing Movie",
+            "year": 2023,
+            "missing_subtitles": [
+                {"name": "English", "code2": "en"},
+                {"name": "Spanish", "code2": "es"},
+                {"name": "French", "code2": "fr"},
+            ],
+        }
+
+        with patch.object(
+            self.downloader.tracker,
+            "bulk_filter",
+            return_value=(["english", "spanish", "french"], 0),
+        ):
+            self.downloader.preload_movie_searches([movie])
+            downloaded_files, _ = self.downloader.get_subtitle_for_movie(movie)
+
+        self.assertEqual(downloaded_files, [])
+        mock_post.assert_called_once()
+
+    def test_preload_movie_searches(self):
+        """Test movie searches run once for movies due for a search."""
+        movies = [
+            {"title": "Due", "year": 2020, "missing_subtitles": [{"name": "English"}]},
+            {"title": "Due", "year": 2020, "missing_subtitles": [{"name": "Dutch"}]},
+            {
+                "title": "Recent",
+                "year": 2021,
+                "missing_subtitles": [{"name": "English"}],
+            },
+        ]
+
+        def bulk_filter(title, year, languages, hours):
+            return ([], len(languages)) if title == "Recent" else (languages, 0)
+
+        with (
+            patch.object(self.downloader.tracker, "bulk_filter", bulk_filter),
+            patch.object(
+                self.downloader, "_search_titles", return_value=[{}]
+            ) as mock_search,
+        ):
+            self.downloader.preload_movie_searches(movies)
+
+        mock_search.assert_called_once_with("Due", include_seasons=False)
+
+    @patch("api.subsource.requests.Session.post")
+    def test_preload_episode_searches_not_found_searches_once(self, mock_post):
+        """Test a preloaded series SubSource lacks isn't searched per episode."""
+        mock_post.return_value = Mock(content=json.dumps({"results": []}).encode())
+        episodes = [
+            {
+                "series_title": "Missing Show",
+                "season": 1,
+                "episode_number": episode_number,
+                "missing_subtitles": [
+                    {"name": "English", "code2": "en"},
+                    {"name": "Spanish", "code2": "es"},
+                ],
+            }
+            for episode_number in (1, 2)
+        ]
+
+        with patch.object(
+            self.downloader.tracker,
+            "bulk_filter",
+            return_value=(["english", "spanish"], 0),
+        ):
+            self.downloader.preload_episode_searches(episodes)
+            for episode in episodes:
+                downloaded_files, _ = self.downloader.get_subtitle_for_episode(episode)
+                self.assertEqual(downloaded_files, [])
+
+        mock_post.assert_called_once()
+
+    def test_preload_episode_searches(self):
+        """Test each due series is searched once for all its episodes."""
+        episodes = [
+            {
+                "series_title": "Due",
+                "season": 1,
+                "episode_number": episode_number,
+                "missing_subtitles": [{"name": "English"}],
+            }
+            for episode_number in (1, 2)
+        ] + [
+            {
+                "series_title": "Recent",
+                "season": 1,
+                "episode_number": 1,
+                "missing_subtitles": [{"name": "English"}],
+            }
+        ]
+
+        def bulk_filter(key, year, languages, hours):
+            return ([], len(languages)) if key.startswith("Recent") else (languages, 0)
+
+        with (
+            patch.object(self.downloader.tracker, "bulk_filter", bulk_filter),
+            patch.object(
+                self.downloader, "_search_titles", return_value=[{}]
+            ) as mock_search,
+        ):
+            self.downloader.preload_episode_searches(episodes)
+
+        mock_search.assert_called_once_with("Due", include_seasons=True)
+
     @patch("api.subsource.requests.Session.get")
     def test_get_movie_year_from_bazarr(self, mock_get):
         """Test getting movie year from Bazarr search API."""
         mock_response = Mock()
-        mock_response.json.return_value = [{"title": "Test Movie", "year": 2023}]
+        mock_response.content = json.dumps(
+            [{"title": "Test Movie", "year": 2023}]
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -170,34 +540,52 @@ class TestSubSourceDownloader(unittest.TestCase):
         self.mock_bazarr.bazarr_url = "https://test.bazarr.com"
         self.mock_bazarr.session = Mock()
         self.mock_bazarr.session.get.return_value = mock_response
-        self.mock_bazarr.auth = Mock()
 
         year = self.downloader._get_movie_year_from_bazarr("Test Movie")
 
         self.assertEqual(year, 2023)
+        _, kwargs = self.mock_bazarr.session.get.call_args
+        self.assertNotIn("auth", kwargs)
+        self.assertEqual(kwargs["timeout"], (3.05, 30))
+
+    def test_get_movie_year_from_bazarr_invalid_json(self):
+        """Test Bazarr search responses that aren't JSON yield no year."""
+        mock_response = Mock()
+        mock_response.content = b"<html>Login</html>"
+        mock_response.raise_for_status.return_value = None
+
+        self.mock_bazarr.bazarr_url = "https://test.bazarr.com"
+        self.mock_bazarr.session = Mock()
+        self.mock_bazarr.session.get.return_value = mock_response
+
+        self.assertIsNone(self.downloader._get_movie_year_from_bazarr("Test Movie"))
 
     def test_get_search_interval_hours(self):
-        """Test getting search interval hours."""
-        # Test cached value
-        self.downloader._search_interval_hours = 12
-        interval = self.downloader._get_search_interval_hours()
-        self.assertEqual(interval, 12)
-
-        # Test fetching from Bazarr
-        self.downloader._search_interval_hours = None
-        self.mock_bazarr.get_missing_subtitles_search_interval.return_value = 6
-        interval = self.downloader._get_search_interval_hours()
-        self.assertEqual(interval, 6)
-        self.assertEqual(self.downloader._search_interval_hours, 6)
+        """Test the search interval is resolved at init and refreshed hourly."""
+        self.assertEqual(self.downloader._get_search_interval_hours(), 6)
+        self.assertEqual(self.downloader._get_search_interval_hours(), 6)
+        self.mock_bazarr.get_missing_subtitles_search_interval.assert_called_once()
+
+        # An hour later the interval is looked up again
+        self.mock_bazarr.get_missing_subtitles_search_interval.return_value = 12
+        self.downloader._search_interval_fetched_at -= 3601
+        self.assertEqual(self.downloader._get_search_interval_hours(), 12)
+
+    def test_get_search_interval_hours_without_bazarr(self):
+        """Test the default search interval is used without a Bazarr client."""
+        with patch("core.config.Path.home", return_value=Path(self.temp_dir)):
+            downloader = SubSourceDownloader(self.api_url, self.download_dir)
+
+        self.assertEqual(downloader._get_search_interval_hours(), 24)
 
     @patch("api.subsource.requests.Session.get")
     def test_download_subtitle_success(self, mock_get):
         """Test successful subtitle download."""
         # Mock token request
         token_response = Mock()
-        token_response.json.return_value = {
-            "subtitle": {"download_token": "test_token_12345"}
-        }
+        token_response.content = json.dumps(
+            {"subtitle": {"download_token": "test_token_12345"}}
+        ).encode()
         token_response.raise_for_status.return_value = None
         mock_get.return_value = token_response
 
@@ -211,7 +599,10 @@ class TestSubSourceDownloader(unittest.TestCase):
             zip_content = f.read()
 
         download_response = Mock()
-        download_response.content = zip_content
+        download_response.iter_content.return_value = [
+            zip_content[:10],
+            zip_content[10:],
+        ]
         download_response.headers = {"content-type": "application/zip"}
         download_response.raise_for_status.return_value = None
 
@@ -229,11 +620,34 @@ class TestSubSourceDownloader(unittest.TestCase):
             content = f.read()
         self.assertEqual(content, "Test subtitle content")
 
+        # The ZIP is spooled in memory rather than written next to the result
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "temp_12345.zip")))
+
+        # The ZIP is streamed and the connection released
+        self.assertTrue(mock_get.call_args[1]["stream"])
+        download_response.close.assert_called_once()
+
+    @patch("api.subsource.requests.Session.get")
+    def test_get_download_token_reuses_recent_token(self, mock_get):
+        """Test download tokens are fetched once per subtitle link."""
+        mock_get.return_value = Mock(
+            content=json.dumps({"subtitle": {"download_token": "token"}}).encode()
+        )
+
+        self.assertEqual(self.downloader._get_download_token("link", 1), "token")
+        self.assertEqual(self.downloader._get_download_token("link", 1), "token")
+        mock_get.assert_called_once()
+
+        # Expired tokens are fetched again
+        self.downloader._token_cache["link"] = ("token", time.monotonic() - 301)
+        self.downloader._get_download_token("link", 1)
+        self.assertEqual(mock_get.call_count, 2)
+
     @patch("api.subsource.requests.Session.get")
     def test_download_subtitle_no_token(self, mock_get):
         """Test subtitle download when no token is returned."""
         mock_response = Mock()
-        mock_response.json.return_value = {"subtitle": {}}
+        mock_response.content = json.dumps({"subtitle": {}}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -248,9 +662,9 @@ class TestSubSourceDownloader(unittest.TestCase):
         """Test subtitle download handles HTML response."""
         # Mock token request
         token_response = Mock()
-        token_response.json.return_value = {
-            "subtitle": {"download_token": "test_token"}
-        }
+        token_response.content = json.dumps(
+            {"subtitle": {"download_token": "test_token"}}
+        ).encode()
         token_response.raise_for_status.return_value = None
         mock_get.return_value = token_response
 
@@ -289,6 +703,50 @@ class TestSubSourceDownloader(unittest.TestCase):
         # Check that ZIP file was cleaned up (allow for timing issues)
         self.assertTrue(os.path.exists(result))  # Result file should exist
 
+    def test_extract_subtitle_from_zip_nested_folder(self):
+        """Test subtitles in ZIP folders land in the download directory."""
+        zip_path = os.path.join(self.temp_dir, "test.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Movie.2023/Subs/movie.srt", "Nested subtitle")
+
+        result = self.downloader._extract_subtitle_from_zip(zip_path, "12345")
+
+        self.assertEqual(result, os.path.join(self.temp_dir, "12345_movie.srt"))
+        with open(result, "r") as f:
+            self.assertEqual(f.read(), "Nested subtitle")
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "Movie.2023")))
+
+    def test_extract_subtitle_from_zip_corrupt_entry(self):
+        """Test a subtitle that fails its CRC check leaves no partial file."""
+        zip_path = os.path.join(self.temp_dir, "test.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("movie.srt", "Test subtitle content")
+        with open(zip_path, "r+b") as f:
+            data = f.read()
+            f.seek(data.index(b"Test subtitle content"))
+            f.write(b"Bad!")
+
+        result = self.downloader._extract_subtitle_from_zip(zip_path, "12345")
+
+        self.assertIsNone(result)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "12345_movie.srt")))
+
+    def test_extract_subtitle_from_zip_shared_release_name(self):
+        """Test subtitles whose archives share a release name stay apart."""
+        results = {}
+        for subtitle_id, content in [("1", "English"), ("2", "Spanish")]:
+            zip_path = os.path.join(self.temp_dir, f"{subtitle_id}.zip")
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                zf.writestr("Movie.2023.1080p.srt", content)
+            results[content] = self.downloader._extract_subtitle_from_zip(
+                zip_path, subtitle_id
+            )
+
+        self.assertNotEqual(results["English"], results["Spanish"])
+        for content, result in results.items():
+            with open(result, "r") as f:
+                self.assertEqual(f.read(), content)
+
     def test_extract_subtitle_from_zip_no_subtitles(self):
         """Test extracting from ZIP with no subtitle files."""
         # Create a test ZIP file without subtitles
@@ -339,7 +797,9 @@ class TestSubSourceDownloader(unittest.TestCase):
 
         # Mock tracker to not skip searches
         with patch.object(
-            self.downloader.tracker, "should_skip_search", return_value=False
+            self.downloader.tracker,
+            "bulk_filter",
+            return_value=(["english", "english"], 0),
         ):
             movie = {
                 "title": "Test Movie",
@@ -359,15 +819,56 @@ class TestSubSourceDownloader(unittest.TestCase):
             self.assertEqual(mock_search.call_count, 2)  # Called for each subtitle
             self.assertEqual(mock_download.call_count, 2)
 
+    @patch.object(SubSourceDownloader, "search_subtitles")
+    @patch.object(SubSourceDownloader, "download_subtitle")
+    def test_get_subtitle_for_movie_keeps_language_order(
+        self, mock_download, mock_search
+    ):
+        """Test concurrently fetched languages come back in Bazarr's order."""
+        mock_search.side_effect = lambda title, year, language: (
+            [] if language == "french" else [{"id": language}]
+        )
+        mock_download.side_effect = lambda result, filename: (
+            None if result["id"] == "spanish" else f"/path/{filename}"
+        )
+        movie = {
+            "title": "Test Movie",
+            "year": 2023,
+            "missing_subtitles": [
+                {"name": "English", "code2": "en"},
+                {"name": "French", "code2": "fr"},
+                {"name": "Spanish", "code2": "es"},
+                {"name": "German", "code2": "de"},
+            ],
+        }
+
+        with (
+            patch.object(
+                self.downloader.tracker,
+                "bulk_filter",
+                return_value=(["english", "french", "spanish", "german"], 0),
+            ),
+            patch.object(
+                self.downloader.tracker, "record_download_failure"
+            ) as mock_failure,
+        ):
+            downloaded_files, _ = self.downloader.get_subtitle_for_movie(movie)
+
+        self.assertEqual(
+            downloaded_files,
+            ["/path/temp_filename_en.srt", "/path/temp_filename_de.srt"],
+        )
+        mock_failure.assert_called_once_with(
+            "Test Movie", 2023, "spanish", "Download failed"
+        )
+
     @patch.object(SubSourceDownloader, "_get_search_interval_hours")
     def test_get_subtitle_for_movie_with_tracking(self, mock_interval):
         """Test getting subtitles with tracking that skips searches."""
         mock_interval.return_value = 24
 
         # Mock tracker to skip searches
-        with patch.object(
-            self.downloader.tracker, "should_skip_search", return_value=True
-        ):
+        with patch.object(self.downloader.tracker, "bulk_filter", return_value=([], 1)):
             movie = {
                 "title": "Test Movie",
                 "year": 2023,
@@ -402,6 +903,16 @@ class TestSubSourceDownloader(unittest.TestCase):
         self.assertEqual(season, 1)
         self.assertEqual(episode, 1)
 
+    def test_extract_episode_info_prefers_most_specific(self):
+        """Test S01E01 wins over earlier, less specific patterns."""
+        extract = self.downloader._extract_episode_info_from_subtitle
+
+        self.assertEqual(
+            extract({"release_info": "Show.Episode7.2x03.S02E04.WEB"}), (2, 4)
+        )
+        self.assertEqual(extract({"release_info": "Show.E05.2x03.WEB"}), (2, 3))
+        self.assertEqual(extract({"release_info": "Show.E05.WEB"}), (None, 5))
+
     def test_extract_episode_info_no_match(self):
         """Test episode info extraction when no pattern matches."""
         subtitle = {"release_info": "Breaking.Bad.720p.BluRay.x264-REWARD"}
@@ -411,6 +922,53 @@ class TestSubSourceDownloader(unittest.TestCase):
         self.assertIsNone(season)
         self.assertIsNone(episode)
 
+    def test_season_lookups_share_index(self):
+        """Test season checks and links come from one memoized index."""
+        series = {
+            "seasons": [
+                {"season": 1, "link": "/subtitles/show/season=1"},
+                {"season": "2", "link": ""},
+                {"season": 2, "link": "/subtitles/show/season=2"},
+            ]
+        }
+
+        self.assertTrue(self.downloader._has_season(series, 2))
+        self.assertFalse(self.downloader._has_season(series, 3))
+        self.assertEqual(
+            self.downloader._get_season_link(series, 2), "/subtitles/show/season-2"
+        )
+        self.assertEqual(series["_season_index"][1], "/subtitles/show/season=1")
+
+    def test_find_best_series_match(self):
+        """Test series candidates are narrowed by type, title, year and season."""
+        results = [
+            {"type": "Movie", "title": "Show", "releaseYear": 2020},
+            {"type": "TVSeries", "title": "Other", "releaseYear": 2020},
+            {"type": "TVSeries", "title": "The Show", "releaseYear": 2019},
+            {
+                "type": "TVSeries",
+                "title": "Show",
+                "releaseYear": 2020,
+                "seasons": [{"season": 1, "link": "/subtitles/show/season-1"}],
+            },
+            {
+                "type": "tvseries",
+                "title": "Show (2020)",
+                "releaseYear": 2020,
+                "seasons": [{"season": 2, "link": "/subtitles/show/season-2"}],
+            },
+        ]
+
+        match = self.downloader._find_best_series_match(results, "show", 2020, 2)
+        self.assertIs(match, results[4])
+
+        match = self.downloader._find_best_series_match(results, "show", 2020, 5)
+        self.assertIs(match, results[3])
+
+        self.assertIsNone(
+            self.downloader._find_best_series_match(results, "Missing", 2020, 1)
+        )
+
     def test_is_subtitle_match_success(self):
         """Test subtitle matching with correct season/episode."""
         subtitle = {"release_info": "Breaking.Bad.S01E01.720p.BluRay.x264-REWARD"}
@@ -435,31 +993,35 @@ class TestSubSourceDownloader(unittest.TestCase):
         """Test successful episode subtitle search."""
         # Mock search response
         mock_search_response = Mock()
-        mock_search_response.json.return_value = {
-            "results": [
-                {
-                    "title": "Breaking Bad",
-                    "type": "tvseries",
-                    "link": "/subtitles/breaking-bad-2008",
-                    "seasons": [
-                        {"season": 1, "link": "/subtitles/breaking-bad-2008/s1"}
-                    ],
-                    "releaseYear": 2008,
-                }
-            ]
-        }
+        mock_search_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "title": "Breaking Bad",
+                        "type": "tvseries",
+                        "link": "/subtitles/breaking-bad-2008",
+                        "seasons": [
+                            {"season": 1, "link": "/subtitles/breaking-bad-2008/s1"}
+                        ],
+                        "releaseYear": 2008,
+                    }
+                ]
+            }
+        ).encode()
         mock_search_response.raise_for_status.return_value = None
         mock_post.return_value = mock_search_response
 
         # Mock subtitles response
         mock_sub_response = Mock()
-        mock_sub_response.json.return_value = [
-            {
-                "id": "123",
-                "release_info": "Breaking.Bad.S01E01.720p.BluRay.x264-REWARD",
-                "language": "english",
-            }
-        ]
+        mock_sub_response.content = json.dumps(
+            [
+                {
+                    "id": "123",
+                    "release_info": "Breaking.Bad.S01E01.720p.BluRay.x264-REWARD",
+                    "language": "english",
+                }
+            ]
+        ).encode()
         mock_sub_response.raise_for_status.return_value = None
         mock_get.return_value = mock_sub_response
 
@@ -479,7 +1041,7 @@ class TestSubSourceDownloader(unittest.TestCase):
     def test_search_episode_subtitles_no_results(self, mock_post):
         """Test episode subtitle search with no results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
@@ -493,6 +1055,199 @@ class TestSubSourceDownloader(unittest.TestCase):
 
         self.assertEqual(len(results), 0)
 
+    @patch("api.subsource.requests.Session.post")
+    def test_search_episode_subtitles_invalid_json(self, mock_post):
+        """Test episode subtitle search handles non-JSON responses."""
+        mock_response = Mock()
+        mock_response.content = b"<html>Just a moment...</html>"
+        mock_post.return_value = mock_response
+
+        episode = {"series_title": "Unknown Show", "season": 1, "episode_number": 1}
+
+        self.assertEqual(
+            self.downloader.search_episode_subtitles(episode, "english"), []
+        )
+
+    def test_throttle_honours_rate_limit_headers(self):
+        """Test rate-limit headers pause the request limiter."""
+        cases = [
+            ({"Retry-After": "5"}, 200, 5.25),
+            ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 429, None),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}, 200, 3.25),
+            ({"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": "3"}, 200, None),
+            ({}, 429, 2.25),
+            ({}, 200, None),
+        ]
+        for headers, status_code, expected in cases:
+            with self.subTest(headers=headers, status_code=status_code):
+                response = requests.Response()
+                response.headers.update(headers)
+                response.status_code = status_code
+
+                with (
+                    patch.object(self.downloader, "_rate_limiter") as mock_limiter,
+                    patch("api.subsource.random.uniform", return_value=0.25),
+                ):
+                    self.downloader._throttle(response)
+
+                if expected is None:
+                    mock_limiter.hold.assert_not_called()
+                else:
+                    mock_limiter.hold.assert_called_once_with(expected)
+
+    def test_throttle_adapts_request_rate(self):
+        """Test healthy responses speed requests up and overload slows them."""
+        for status_code, speeds_up in [(200, True), (503, False), (429, False)]:
+            with self.subTest(status_code=status_code):
+                response = requests.Response()
+                response.status_code = status_code
+
+                with patch.object(self.downloader, "_rate_limiter") as mock_limiter:
+                    self.downloader._throttle(response)
+
+                self.assertEqual(mock_limiter.increase.called, speeds_up)
+                self.assertEqual(mock_limiter.decrease.called, not speeds_up)
+
+    def _serve_overload(self, headers: dict) -> list:
+        """
+        Point the downloader at a local server that always answers 429.
+
+        Args:
+            headers: Extra headers sent with every 429 response
+
+        Returns:
+            List that collects the path of every request the server receives
+        """
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(429)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        self.downloader.api_url = f"http://127.0.0.1:{server.server_address[1]}"
+        return hits
+
+    @patch("urllib3.util.retry.time.sleep")
+    def test_overload_through_adapter_slows_requests(self, _):
+        """Test a 429 that outlasts the adapter's retries reaches the limiter."""
+        hits = self._serve_overload({"Retry-After": "0"})
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.downloader._fetch_subtitles("/subtitles/test-movie", "english")
+
+        # The first attempt plus three retries, then the limiter backs off
+        self.assertEqual(len(hits), 4)
+        self.assertEqual(self.downloader._rate_limiter.rate, 0.5)
+
+    @patch("api.subsource.random.uniform", return_value=0.25)
+    @patch("urllib3.util.retry.time.sleep")
+    def test_rate_limit_through_adapter_pauses_requests(self, *_):
+        """Test a 429 left after the adapter's retries pauses later requests."""
+        for headers, expected_hold in [({"Retry-After": "5"}, 5.25), ({}, 2.25)]:
+            with self.subTest(headers=headers):
+                self._serve_overload(headers)
+
+                with (
+                    patch.object(self.downloader._rate_limiter, "hold") as mock_hold,
+                    self.assertRaises(requests.exceptions.HTTPError),
+                ):
+                    self.downloader._fetch_subtitles("/subtitles/test-movie", "english")
+
+                mock_hold.assert_called_once_with(expected_hold)
+
+    @patch("api.subsource.requests.Session.get")
+    def test_timeout_slows_requests(self, mock_get):
+        """Test a timed out request halves the request rate."""
+        mock_get.side_effect = requests.exceptions.Timeout()
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            self.downloader._fetch_subtitles("/subtitles/test-movie", "english")
+
+        self.assertEqual(self.downloader._rate_limiter.rate, 0.5)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for the SubSource request rate limiter."""
+
+    @patch("api.subsource.time.sleep")
+    @patch("api.subsource.time.monotonic", return_value=100.0)
+    def test_acquire_allows_burst_then_waits(self, mock_monotonic, mock_sleep):
+        """Test a full bucket serves a burst before pacing requests."""
+        bucket = _TokenBucket(rate=1.0, burst=2)
+
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("api.subsource.time.sleep")
+    @patch("api.subsource.time.monotonic")
+    def test_acquire_refills_over_time(self, mock_monotonic, mock_sleep):
+        """Test tokens are replenished at the configured rate."""
+        mock_monotonic.return_value = 100.0
+        bucket = _TokenBucket(rate=0.5, burst=1)
+        bucket.acquire()
+
+        mock_monotonic.return_value = 102.0
+        bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch("api.subsource.time.sleep")
+    @patch("api.subsource.time.monotonic", return_value=100.0)
+    def test_hold_delays_next_acquire(self, mock_monotonic, mock_sleep):
+        """Test a hold pauses requests even while tokens are available."""
+        bucket = _TokenBucket(rate=1.0, burst=4)
+
+        bucket.hold(3.0)
+        bucket.acquire()
+
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch("api.subsource.time.sleep")
+    @patch("api.subsource.time.monotonic", return_value=100.0)
+    def test_hold_paces_queued_requests(self, mock_monotonic, mock_sleep):
+        """Test requests queued behind a hold don't burst when it ends."""
+        bucket = _TokenBucket(rate=1.0, burst=4)
+
+        bucket.hold(5.0)
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertEqual(
+            [call.args[0] for call in mock_sleep.call_args_list], [5.0, 6.0, 7.0]
+        )
+
+    def test_rate_changes_stay_within_bounds(self):
+        """Test the rate grows additively, halves, and respects its bounds."""
+        bucket = _TokenBucket(rate=1.0, burst=1, min_rate=0.25, max_rate=1.5)
+
+        bucket.increase(0.25)
+        self.assertEqual(bucket.rate, 1.25)
+        bucket.increase(1.0)
+        self.assertEqual(bucket.rate, 1.5)
+
+        for _ in range(4):
+            bucket.decrease()
+        self.assertEqual(bucket.rate, 0.25)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,7 +11,12 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from core.config import create_default_config, load_config, setup_logging
+from core.config import (
+    create_default_config,
+    get_config_dir,
+    load_config,
+    setup_logging,
+)
 
 
 class TestConfig(unittest.TestCase):
@@ -58,6 +63,15 @@ class TestConfig(unittest.TestCase):
         )
         self.assertEqual(config.get("logging", "level"), "INFO")
 
+    @patch("core.config.Path.home")
+    def test_get_config_dir(self, mock_home):
+        """Test the config directory sits under the user's home."""
+        mock_home.return_value = Path(self.temp_dir)
+
+        self.assertEqual(
+            get_config_dir(), Path(self.temp_dir) / ".config" / "bazarr-subsource"
+        )
+
     @patch("core.config.Path.home")
     @patch("core.config.create_default_config")
     @patch("sys.exit")
@@ -22,7 +22,7 @@ class TestSubtitleTracker(unittest.TestCase):
         self.tracking_file = Path(self.temp_dir) / "test_tracking.json"
 
         # Mock the config directory
-        with patch("core.tracking.Path.home") as mock_home:
+        with patch("core.config.Path.home") as mock_home:
             mock_home.return_value = Path(self.temp_dir)
             self.tracker = SubtitleTracker()
             # Override the tracking file path for testing
@@ -56,9 +56,11 @@ class TestSubtitleTracker(unittest.TestCase):
     def test_load_tracking_data_existing_file(self):
         """Test loading tracking data from existing file."""
         test_data = {
-            "test movie": [
-                {"language": "english", "last_searched": "2023-01-01T12:00:00"}
-            ]
+            "test movie": {
+                "english": {
+                    "last_searched": "2023-01-01T12:00:00",
+                }
+            }
         }
 
         with open(self.tracking_file, "w") as f:
@@ -67,6 +69,17 @@ class TestSubtitleTracker(unittest.TestCase):
         data = self.tracker._load_tracking_data()
         self.assertEqual(data, test_data)
 
+    def test_load_tracking_data_migrates_language_lists(self):
+        """Test tracking files with per-movie entry lists are keyed by language."""
+        entry = {"language": "english", "last_searched": "2023-01-01T12:00:00"}
+        with open(self.tracking_file, "w") as f:
+            json.dump({"test movie": [entry]}, f)
+
+        data = self.tracker._load_tracking_data()
+        self.assertEqual(
+            data, {"test movie": {"english": {"last_searched": "2023-01-01T12:00:00"}}}
+        )
+
     def test_load_tracking_data_invalid_json(self):
         """Test loading tracking data handles invalid JSON."""
         # Write invalid JSON
@@ -79,9 +92,11 @@ class TestSubtitleTracker(unittest.TestCase):
     def test_save_tracking_data(self):
         """Test saving tracking data."""
         test_data = {
-            "test movie": [
-                {"language": "english", "last_searched": "2023-01-01T12:00:00"}
-            ]
+            "test movie": {
+                "english": {
+                    "last_searched": "2023-01-01T12:00:00",
+                }
+            }
         }
 
         self.tracker.data = test_data
@@ -95,6 +110,13 @@ class TestSubtitleTracker(unittest.TestCase):
 
         self.assertEqual(saved_data, test_data)
 
+        # The file stays indented for people reading or editing it
+        with open(self.tracking_file, "r", encoding="utf-8") as f:
+            self.assertIn('\n  "test movie": {\n', f.read())
+
+        # The temporary file is renamed over the tracking file
+        self.assertEqual(list(Path(self.temp_dir).glob("*.tmp")), [])
+
     def test_record_no_subtitles_found(self):
         """Test recording when no subtitles are found."""
         title = "Test Movie"
@@ -108,8 +130,8 @@ class TestSubtitleTracker(unittest.TestCase):
 
         lang_entries = self.tracker.data[key]
         self.assertEqual(len(lang_entries), 1)
-        self.assertEqual(lang_entries[0]["language"], language)
-        self.assertIn("last_searched", lang_entries[0])
+        self.assertIn(language, lang_entries)
+        self.assertIn("last_searched", lang_entries[language])
 
     def test_record_download_failure(self):
         """Test recording failed subtitle download."""
@@ -125,9 +147,9 @@ class TestSubtitleTracker(unittest.TestCase):
 
         lang_entries = self.tracker.data[key]
         self.assertEqual(len(lang_entries), 1)
-        self.assertEqual(lang_entries[0]["language"], language)
-        self.assertIn("last_download_failure", lang_entries[0])
-        self.assertEqual(lang_entries[0]["last_error"], error)
+        self.assertIn(language, lang_entries)
+        self.assertIn("last_download_failure", lang_entries[language])
+        self.assertEqual(lang_entries[language]["last_error"], error)
 
     def test_get_last_searched_timestamp(self):
         """Test getting last searched timestamp."""
@@ -159,9 +181,7 @@ class TestSubtitleTracker(unittest.TestCase):
         # Record a recent failure (1 hour ago)
         failure_time = current_time - timedelta(hours=1)
         key = self.tracker._get_movie_key(title)
-        self.tracker.data[key] = [
-            {"language": language, "last_searched": failure_time.isoformat()}
-        ]
+        self.tracker.data[key] = {language: {"last_searched": failure_time.isoformat()}}
 
         # Should skip if threshold is 2 hours
         should_skip = self.tracker.should_skip_search(title, year, language, 2)
@@ -181,6 +201,57 @@ class TestSubtitleTracker(unittest.TestCase):
         should_skip = self.tracker.should_skip_search(title, year, language, 24)
         self.assertFalse(should_skip)
 
+    def test_should_skip_search_invalid_timestamp(self):
+        """Test unparseable timestamps don't skip the search."""
+        key = self.tracker._get_movie_key("Test Movie")
+        self.tracker.data[key] = {"english": {"last_searched": "not a timestamp"}}
+
+        for _ in range(2):
+            self.assertFalse(
+                self.tracker.should_skip_search("Test Movie", 2023, "english", 24)
+            )
+
+    @patch("core.tracking.datetime")
+    def test_bulk_filter(self, mock_datetime):
+        """Test bulk_filter splits languages by their last search time."""
+        current_time = datetime(2023, 1, 1, 12, 0, 0)
+        mock_datetime.now.return_value = current_time
+        mock_datetime.fromisoformat.side_effect = datetime.fromisoformat
+
+        key = self.tracker._get_movie_key("Test Movie")
+        self.tracker.data[key] = {
+            "english": {
+                "last_searched": (current_time - timedelta(hours=1)).isoformat(),
+            },
+            "spanish": {
+                "last_searched": (current_time - timedelta(hours=30)).isoformat(),
+            },
+        }
+
+        to_try, skipped_count = self.tracker.bulk_filter(
+            "Test Movie", 2023, ["english", "spanish", "french"], 24
+        )
+
+        self.assertEqual(to_try, ["spanish", "french"])
+        self.assertEqual(skipped_count, 1)
+
+    def test_flush_saves_only_changes(self):
+        """Test records are written once on flush rather than immediately."""
+        self.tracker.record_no_subtitles_found("Test Movie", 2023, "english")
+        self.tracker.record_no_subtitles_found("Test Movie", 2023, "spanish")
+        self.assertFalse(self.tracking_file.exists())
+
+        with patch.object(
+            self.tracker, "_save_tracking_data", wraps=self.tracker._save_tracking_data
+        ) as mock_save:
+            self.tracker.flush()
+            self.tracker.flush()
+
+        mock_save.assert_called_once()
+        with open(self.tracking_file, "r") as f:
+            saved_data = json.load(f)
+        self.assertEqual(len(saved_data["test movie"]), 2)
+
     def test_update_existing_language_entry(self):
         """Test updating an existing language entry."""
         title = "Test Movie"
@@ -198,10 +269,10 @@ class TestSubtitleTracker(unittest.TestCase):
 
         # Should still have only one entry for this language
         self.assertEqual(len(lang_entries), 1)
-        self.assertEqual(lang_entries[0]["language"], language)
+        self.assertIn(language, lang_entries)
 
         # Should have updated search timestamp
-        self.assertIn("last_searched", lang_entries[0])
+        self.assertIn("last_searched", lang_entries[language])
 
     def test_multiple_languages_same_movie(self):
         """Test tracking multiple languages for the same movie."""
@@ -218,7 +289,7 @@ class TestSubtitleTracker(unittest.TestCase):
         # Should have two language entries
         self.assertEqual(len(lang_entries), 2)
 
-        languages = [entry["language"] for entry in lang_entries]
+        languages = list(lang_entries)
         self.assertIn("english", languages)
         self.assertIn("spanish", languages)
 
@@ -261,7 +332,7 @@ class TestSubtitleTracker(unittest.TestCase):
         # Movie should still exist with Spanish entry
         self.assertIn(key, self.tracker.data)
         self.assertEqual(len(self.tracker.data[key]), 1)
-        self.assertEqual(self.tracker.data[key][0]["language"], "spanish")
+        self.assertEqual(list(self.tracker.data[key]), ["spanish"])
 
     def test_remove_successful_download_not_found(self):
         """Test removing non-existent entry."""
@@ -170,6 +170,9 @@ class TestRun(unittest.TestCase):
         # Verify file cleanup
         mock_remove.assert_called_once_with("/tmp/test.srt")
 
+        # Verify tracking data was saved once at the end of the run
+        mock_downloader.tracker.flush.assert_called_once()
+
         # Verify success logging
         mock_logger.info.assert_called()
 
@@ -218,6 +221,45 @@ class TestRun(unittest.TestCase):
                     run.main()
                 mock_exit.assert_called_once_with(1)
 
+    @patch("run.load_config")
+    @patch("run.setup_logging")
+    @patch("run.Bazarr")
+    @patch("run.SubSourceDownloader")
+    @patch("builtins.print")
+    def test_main_interrupted_saves_tracking(
+        self,
+        mock_print,
+        mock_downloader_class,
+        mock_bazarr_class,
+        mock_setup_logging,
+        mock_load_config,
+    ):
+        """Test tracking data is saved when the run is interrupted."""
+        mock_load_config.return_value = {
+            "log_level": "INFO",
+            "log_file": "test.log",
+            "bazarr_url": "https://test.bazarr.com",
+            "api_key": "test_key",
+            "username": "test_user",
+            "password": "test_pass",
+            "subsource_api_url": "https://api.test.com",
+            "download_directory": "/tmp",
+        }
+        mock_bazarr = Mock()
+        mock_bazarr.get_sync_settings.return_value = {"enabled": False}
+        mock_bazarr.get_subzero_settings.return_value = {"mods": [], "enabled": False}
+        mock_bazarr.get_wanted_movies.side_effect = KeyboardInterrupt()
+        mock_bazarr_class.return_value = mock_bazarr
+
+        with (
+            patch("run.logging.getLogger", return_value=Mock()),
+            patch("run.sys.exit") as mock_exit,
+        ):
+            run.main()
+
+        mock_exit.assert_called_once_with(0)
+        mock_downloader_class.return_value.tracker.flush.assert_called_once()
+
     @patch("run.load_config")
     @patch("builtins.print")
     def test_main_config_error(self, mock_print, mock_load_config):
@@ -392,6 +434,17 @@ class TestRun(unittest.TestCase):
             "Execution completed with no successful uploads."
         )
 
+    @patch("builtins.print")
+    def test_print_status(self, mock_print):
+        """Test status lines for Bazarr operations."""
+        run.print_status(True, "Synchronized subtitle", "Failed to synchronize")
+        run.print_status(False, "Synchronized subtitle", "Failed to synchronize")
+
+        print_calls = [call[0][0] for call in mock_print.call_args_list]
+        self.assertEqual(
+            print_calls, ["    ✓ Synchronized subtitle", "    ✗ Failed to synchronize"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,9 +2,17 @@
 Tests for utils module.
 """
 
+import json
+import socket
 import unittest
 
-from utils import format_movie_info
+from utils import (
+    KeepAliveAdapter,
+    format_movie_info,
+    json_dumps,
+    json_dumps_indented,
+    json_loads,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -201,6 +209,43 @@ class TestUtils(unittest.TestCase):
         # Should use "year" field first
         self.assertEqual(result, expected)
 
+    def test_json_loads(self):
+        """Test JSON decoding from raw response bytes."""
+        payload = {"data": [{"title": "Amélie", "year": 2001}]}
+
+        self.assertEqual(json_loads(json.dumps(payload).encode()), payload)
+
+    def test_json_dumps(self):
+        """Test JSON encoding to UTF-8 bytes round-trips."""
+        payload = {"query": "Amélie", "signal": {}, "limit": 15}
+
+        encoded = json_dumps(payload)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded), payload)
+
+    def test_json_dumps_indented(self):
+        """Test indented JSON keeps one field per line and raw Unicode."""
+        payload = {"title": "Amélie", "languages": ["english"]}
+
+        encoded = json_dumps_indented(payload)
+
+        self.assertEqual(json.loads(encoded), payload)
+        self.assertIn('\n  "title": "Amélie"'.encode(), encoded)
+
+    def test_keep_alive_adapter_socket_options(self):
+        """Test pooled sockets get TCP keepalive on top of urllib3's defaults."""
+        adapter = KeepAliveAdapter()
+
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), socket_options)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+
+    def test_json_loads_invalid(self):
+        """Test invalid JSON raises the stdlib decode error type."""
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads(b"not json")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,11 +3,51 @@ Utility functions for Bazarr SubSource integration.
 """
 
 import logging
+import socket
 from typing import Dict
 
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+
+    def json_dumps_indented(obj) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON indented by two spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON, like orjson.dumps."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def json_dumps_indented(obj) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON indented by two spaces."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
 logger = logging.getLogger(__name__)
 
 
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets use TCP keepalive and TCP_NODELAY."""
+
+    # urllib3's defaults already include TCP_NODELAY
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 def format_movie_info(movie: Dict) -> str:
     """
     Format movie information for display.